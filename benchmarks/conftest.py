@@ -0,0 +1,84 @@
+"""
+Benchmark suite for pybboxes, run with
+
+    python -m scripts.run_benchmarks
+
+Results are saved by pytest-benchmark as JSON under `.benchmarks/` and can be compared across commits with
+`pytest-benchmark compare` or `--benchmark-compare`.
+"""
+import numpy as np
+import pytest
+
+from pybboxes.functional import convert_bbox
+from pybboxes.utils.synthetic import generate_dataset
+
+BOX_FORMATS = ("albumentations", "coco", "fiftyone", "voc", "yolo")
+ANNOTATION_FORMATS = ("coco", "voc", "yolo")
+BOXES_PER_IMAGE = 10
+NUM_CLASSES = 5
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-sizes",
+        default="1000,100000,1000000",
+        help="Comma separated number of boxes for the annotation I/O benchmarks.",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "num_boxes" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("bench_sizes").split(",")]
+        metafunc.parametrize("num_boxes", sizes)
+
+
+def random_voc_boxes(n: int, image_size, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    w, h = image_size
+    x_tl = rng.integers(0, w // 2, size=n)
+    y_tl = rng.integers(0, h // 2, size=n)
+    x_br = x_tl + rng.integers(1, w // 2, size=n)
+    y_br = y_tl + rng.integers(1, h // 2, size=n)
+    return np.stack([x_tl, y_tl, x_br, y_br], axis=-1)
+
+
+@pytest.fixture(scope="session")
+def image_size():
+    return 640, 480
+
+
+@pytest.fixture(scope="session")
+def boxes_by_format(image_size):
+    """1000 valid boxes in every supported format."""
+    voc_boxes = random_voc_boxes(1000, image_size)
+    return {
+        bbox_type: np.array(
+            [convert_bbox(box, from_type="voc", to_type=bbox_type, image_size=image_size) for box in voc_boxes.tolist()]
+        )
+        for bbox_type in BOX_FORMATS
+    }
+
+
+@pytest.fixture(scope="session")
+def annotation_dataset(tmp_path_factory, image_size):
+    """
+    Returns a factory writing (once per session) a dataset with the given number of boxes in the given
+    annotation format, and returning the keyword arguments for the matching `load_from_*` method.
+    """
+    cache = {}
+
+    def factory(annotation_type: str, num_boxes: int) -> dict:
+        key = (annotation_type, num_boxes)
+        if key not in cache:
+            cache[key] = generate_dataset(
+                str(tmp_path_factory.mktemp(f"{annotation_type}_{num_boxes}")),
+                annotation_type=annotation_type,
+                num_images=num_boxes // BOXES_PER_IMAGE,
+                write_images=annotation_type == "yolo",
+                image_sizes=[image_size],
+                boxes_per_image=(BOXES_PER_IMAGE, BOXES_PER_IMAGE),
+                num_classes=NUM_CLASSES,
+            )
+        return cache[key]
+
+    return factory
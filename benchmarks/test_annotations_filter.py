@@ -0,0 +1,36 @@
+import pytest
+
+from pybboxes.annotations import Annotations
+
+
+@pytest.fixture(scope="module")
+def annotations(annotation_dataset):
+    anns = Annotations(annotation_type="coco")
+    anns.load_from_coco(**annotation_dataset("coco", 1000000))
+    anns.table.to_voc_array()
+    return anns
+
+
+def test_filter(benchmark, annotations):
+    benchmark(annotations.filter, labels=["class_0", "class_1"], area_min=32 * 32, oob=False)
+
+
+def test_filter_chained(benchmark, annotations):
+    view = annotations.filter(area_min=32 * 32)
+    benchmark(view.filter, labels=["class_0"], aspect_max=2)
+
+
+def test_filter_materialize(benchmark, annotations):
+    benchmark(lambda: annotations.filter(labels=["class_0"]).table)
+
+
+def test_filter_objects(benchmark, annotations):
+    """subset by copying `Annotation` objects, the previous way"""
+
+    def filter_objects():
+        return {
+            name: [ann for ann in objects if ann.label_name == "class_0" and ann.box.area >= 32 * 32]
+            for name, objects in annotations._objects.items()
+        }
+
+    benchmark.pedantic(filter_objects, rounds=1, iterations=1)
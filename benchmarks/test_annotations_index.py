@@ -0,0 +1,41 @@
+import pytest
+
+from pybboxes.annotations import Annotations
+
+
+@pytest.fixture(scope="module")
+def annotations(annotation_dataset):
+    anns = Annotations(annotation_type="coco")
+    anns.load_from_coco(**annotation_dataset("coco", 1000000))
+    anns.table.index
+    return anns
+
+
+def test_label_indices(benchmark, annotations):
+    benchmark(annotations.label_indices, "class_0")
+
+
+def test_label_indices_scan(benchmark, annotations):
+    benchmark(lambda: (annotations.table.label_ids == 0).nonzero()[0])
+
+
+def test_label_counts(benchmark, annotations):
+    benchmark(annotations.label_counts)
+
+
+def test_area_indices(benchmark, annotations):
+    benchmark(annotations.area_indices, 1000, 1100)
+
+
+def test_image_indices(benchmark, annotations):
+    benchmark(annotations.image_indices, annotations.table.image_names[-1])
+
+
+def test_build_index(benchmark, annotations):
+    table = annotations.table
+
+    def build():
+        table._index = None
+        return table.index
+
+    benchmark(build)
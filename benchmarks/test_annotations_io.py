@@ -0,0 +1,41 @@
+import pytest
+
+from benchmarks.conftest import ANNOTATION_FORMATS
+from pybboxes.annotations import Annotations
+
+
+def _load(annotation_type: str, kwargs: dict) -> Annotations:
+    anns = Annotations(annotation_type=annotation_type)
+    getattr(anns, f"load_from_{annotation_type}")(**kwargs)
+    return anns
+
+
+@pytest.mark.parametrize("annotation_type", ANNOTATION_FORMATS)
+def test_load(benchmark, annotation_dataset, annotation_type, num_boxes):
+    kwargs = annotation_dataset(annotation_type, num_boxes)
+    benchmark.pedantic(_load, args=(annotation_type, kwargs), rounds=1, iterations=1)
+
+
+@pytest.mark.parametrize("annotation_type", ANNOTATION_FORMATS)
+def test_save(benchmark, annotation_dataset, tmp_path_factory, annotation_type, num_boxes):
+    anns = _load("coco", annotation_dataset("coco", num_boxes))
+
+    def setup():
+        export_path = tmp_path_factory.mktemp(f"save_{annotation_type}_{num_boxes}")
+        if annotation_type == "coco":
+            export_path = export_path / "annotations.json"
+        return (str(export_path),), {}
+
+    benchmark.pedantic(getattr(anns, f"save_as_{annotation_type}"), setup=setup, rounds=1, iterations=1)
+
+
+def test_to_dataframe(benchmark, annotation_dataset, num_boxes):
+    pytest.importorskip("pandas")
+    anns = _load("coco", annotation_dataset("coco", num_boxes))
+    benchmark(anns.to_dataframe, bbox_type="yolo")
+
+
+def test_from_dataframe(benchmark, annotation_dataset, num_boxes):
+    pytest.importorskip("pandas")
+    df = _load("coco", annotation_dataset("coco", num_boxes)).to_dataframe()
+    benchmark(Annotations.from_dataframe, df, annotation_type="coco")
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from pybboxes.annotations import Annotations
+from pybboxes.annotations.table import AnnotationTable
+
+
+@pytest.fixture(scope="module")
+def datasets(annotation_dataset):
+    first = Annotations(annotation_type="coco")
+    first.load_from_coco(**annotation_dataset("coco", 1000000))
+    # A relabeling of the same images, jittered boxes and a reordered label vocabulary
+    table = first.table
+    rng = np.random.default_rng(0)
+    second = Annotations(annotation_type="coco")
+    second._class_names = first._class_names[::-1]
+    second._table = AnnotationTable(
+        "coco",
+        table.values + rng.integers(-1, 2, table.values.shape),
+        len(first._class_names) - 1 - table.label_ids,
+        table.image_ids,
+        table.image_names,
+        table.image_sizes,
+    )
+    return first, second
+
+
+def test_merge(benchmark, datasets):
+    first, second = datasets
+    benchmark.pedantic(first.merge, args=(second,), rounds=3, iterations=1)
+
+
+def test_merge_dedup(benchmark, datasets):
+    first, second = datasets
+    merged = benchmark.pedantic(first.merge, args=(second,), kwargs={"dedup_iou": 0.7}, rounds=3, iterations=1)
+    assert len(first) <= len(merged) < len(first) + len(second)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray3D
+
+
+@pytest.fixture(scope="module")
+def scene():
+    """100k objects in a 200m x 200m x 10m point cloud scene and jittered detections of them."""
+    rng = np.random.default_rng(0)
+    centers = np.c_[rng.uniform(0, 200, (100000, 2)), rng.uniform(0, 10, 100000)]
+    sizes = rng.uniform(0.5, 5, (100000, 3))
+    detections = np.c_[centers + rng.normal(0, 0.3, centers.shape), sizes]
+    return BoxArray3D(np.c_[centers, sizes], bbox_type="center"), BoxArray3D(detections, bbox_type="center")
+
+
+def test_volume(benchmark, scene):
+    benchmark(lambda: scene[0].volume)
+
+
+def test_iou_elementwise(benchmark, scene):
+    boxes, detections = scene
+    benchmark(boxes.iou, detections)
+
+
+def test_sparse_iou(benchmark, scene):
+    boxes, detections = scene
+    benchmark.pedantic(boxes.sparse_iou, args=(detections,), kwargs={"min_iou": 0.1}, rounds=3)
+
+
+def test_iou_matrix(benchmark, scene):
+    boxes, detections = scene
+    benchmark(boxes[:2000].iou_matrix, detections[:2000])
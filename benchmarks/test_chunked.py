@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from pybboxes import ChunkedBoxArray
+
+
+@pytest.fixture(scope="module")
+def boxes_file(tmp_path_factory):
+    """4M voc boxes (128 MB) on disk."""
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(-20, 1900, (4000000, 2))
+    path = str(tmp_path_factory.mktemp("chunked") / "boxes.npy")
+    np.save(path, np.c_[corners, corners + rng.uniform(5, 200, (4000000, 2))])
+    return path
+
+
+@pytest.fixture(scope="module")
+def chunked_boxes(boxes_file):
+    return ChunkedBoxArray.open(boxes_file, image_size=(1920, 1080))
+
+
+def test_convert(benchmark, chunked_boxes, tmp_path):
+    benchmark.pedantic(chunked_boxes.convert, args=("yolo", str(tmp_path / "yolo.npy")), rounds=3)
+
+
+def test_drop_oob(benchmark, chunked_boxes, tmp_path):
+    benchmark.pedantic(chunked_boxes.drop_oob, args=(str(tmp_path / "inbounds.npy"),), rounds=3)
+
+
+def test_area_stats(benchmark, chunked_boxes):
+    benchmark.pedantic(chunked_boxes.area_stats, rounds=3)
@@ -0,0 +1,46 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from benchmarks.conftest import BOX_FORMATS, random_voc_boxes
+from pybboxes import BoxArray, precision
+from pybboxes.boxes.bbox import load_bbox
+from pybboxes.functional import convert_bbox
+
+FORMAT_PAIRS = [pair for pair in itertools.product(BOX_FORMATS, BOX_FORMATS) if pair[0] != pair[1]]
+
+
+@pytest.mark.parametrize("from_type,to_type", FORMAT_PAIRS)
+def test_convert_scalar(benchmark, boxes_by_format, image_size, from_type, to_type):
+    box = boxes_by_format[from_type][0].tolist()
+    benchmark(convert_bbox, box, from_type=from_type, to_type=to_type, image_size=image_size)
+
+
+@pytest.mark.parametrize("from_type,to_type", FORMAT_PAIRS)
+def test_convert_batch(benchmark, boxes_by_format, image_size, from_type, to_type):
+    boxes = boxes_by_format[from_type]
+    klass = type(load_bbox(from_type, boxes[0], image_size=image_size))
+
+    def convert():
+        return [
+            getattr(box, f"to_{to_type}")(return_values=True) for box in klass.from_array(boxes, image_size=image_size)
+        ]
+
+    benchmark(convert)
+
+
+@pytest.mark.parametrize("bbox_type", BOX_FORMATS)
+def test_from_array(benchmark, boxes_by_format, image_size, bbox_type):
+    boxes = boxes_by_format[bbox_type]
+    klass = type(load_bbox(bbox_type, boxes[0], image_size=image_size))
+    benchmark(klass.from_array, boxes, image_size=image_size)
+
+
+@pytest.mark.parametrize("policy", [(None, None), ("float32", "int32")], ids=["float64", "float32-int32"])
+def test_box_array_convert(benchmark, image_size, policy):
+    """1M yolo boxes to coco as BoxArray, with the default storage and a compact dtype policy."""
+    voc_boxes = np.tile(random_voc_boxes(1000, image_size), (1000, 1))
+    with precision.dtype_policy(*policy):
+        boxes = BoxArray.from_voc(voc_boxes, "yolo", image_size)
+        benchmark(boxes.convert, "coco")
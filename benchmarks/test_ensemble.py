@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from pybboxes.ensemble import fuse_boxes
+
+
+@pytest.fixture(scope="module", params=[1, 20], ids=lambda n: f"{n}-labels")
+def predictions(request):
+    """Predictions of 10 models with 1k boxes each on a 1000x1000 image, jittered detections of 400 objects."""
+    rng = np.random.default_rng(0)
+    objects = np.c_[rng.uniform(0, 900, (400, 2)), rng.uniform(20, 100, (400, 2))]
+    object_labels = rng.integers(0, request.param, len(objects))
+    boxes_list, scores_list, labels_list = [], [], []
+    for _ in range(10):
+        picked = rng.integers(0, len(objects), 1000)
+        boxes_list.append(objects[picked] + rng.normal(0, 5, (1000, 4)))
+        scores_list.append(rng.random(1000))
+        labels_list.append(object_labels[picked])
+    return boxes_list, scores_list, labels_list
+
+
+@pytest.mark.parametrize("method", ["wbf", "average", "max"])
+def test_fuse_boxes(benchmark, predictions, method):
+    benchmark.pedantic(fuse_boxes, args=predictions, kwargs={"bbox_type": "coco", "method": method}, rounds=3)
@@ -0,0 +1,66 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+from pycocotools.coco import COCO
+from pycocotools.cocoeval import COCOeval
+
+from pybboxes.annotations import Annotations
+from pybboxes.evaluation import DetectionEvaluator
+from pybboxes.utils.synthetic import generate_dataset
+
+NUM_IMAGES = 1000
+
+
+@pytest.fixture(scope="module")
+def evaluation_data(tmp_path_factory):
+    json_path = generate_dataset(
+        str(tmp_path_factory.mktemp("evaluation")), "coco", num_images=NUM_IMAGES, write_images=False, num_classes=20
+    )["json_path"]
+    ground_truth = Annotations("coco")
+    ground_truth.load_from_coco(json_path)
+
+    rng = np.random.default_rng(0)
+    predictions = []
+    for image_name, _, boxes, labels in ground_truth._iter_records():
+        coco_boxes = np.c_[boxes[:, :2], boxes[:, 2:] - boxes[:, :2]]
+        predictions.append(
+            (image_name, coco_boxes * rng.uniform(0.9, 1.1, size=coco_boxes.shape), rng.random(len(boxes)), labels)
+        )
+    return json_path, ground_truth, predictions
+
+
+def test_detection_evaluator(benchmark, evaluation_data):
+    _, ground_truth, predictions = evaluation_data
+
+    def evaluate():
+        evaluator = DetectionEvaluator(ground_truth)
+        for prediction in predictions:
+            evaluator.update(*prediction, bbox_type="coco")
+        return evaluator.compute()
+
+    benchmark.pedantic(evaluate, rounds=3)
+
+
+def test_cocoeval(benchmark, evaluation_data):
+    json_path, _, predictions = evaluation_data
+    with contextlib.redirect_stdout(io.StringIO()):
+        coco = COCO(json_path)
+    image_ids = {image["file_name"]: image_id for image_id, image in coco.imgs.items()}
+    category_ids = {category["name"]: category_id for category_id, category in coco.cats.items()}
+    detections = [
+        {"image_id": image_ids[image_name], "bbox": box, "score": score, "category_id": category_ids[label]}
+        for image_name, boxes, scores, labels in predictions
+        for box, score, label in zip(boxes.tolist(), scores.tolist(), labels)
+    ]
+
+    def evaluate():
+        with contextlib.redirect_stdout(io.StringIO()):
+            coco_eval = COCOeval(coco, coco.loadRes(detections), "bbox")
+            coco_eval.evaluate()
+            coco_eval.accumulate()
+            coco_eval.summarize()
+        return coco_eval.stats
+
+    benchmark.pedantic(evaluate, rounds=3)
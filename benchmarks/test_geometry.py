@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from pybboxes import VocBoundingBox
+from pybboxes.functional import (
+    compute_area,
+    compute_intersection,
+    compute_iou,
+    compute_iou_matrix,
+    pack_polygons,
+    polygons_to_bbox,
+)
+
+IOU_METRICS = ["iou", "giou", "diou", "ciou"]
+
+
+@pytest.fixture(scope="module")
+def box_pairs(boxes_by_format, image_size):
+    boxes = VocBoundingBox.from_array(boxes_by_format["voc"], image_size=image_size)
+    return list(zip(boxes[::2], boxes[1::2]))
+
+
+@pytest.mark.parametrize("metric", IOU_METRICS)
+def test_iou(benchmark, box_pairs, metric):
+    benchmark(lambda: [getattr(box1, metric)(box2) for box1, box2 in box_pairs])
+
+
+def test_intersection(benchmark, box_pairs):
+    benchmark(lambda: [box1.intersection(box2) for box1, box2 in box_pairs])
+
+
+@pytest.mark.parametrize("bbox_type", ["coco", "yolo"])
+def test_iou_vectorized(benchmark, boxes_by_format, image_size, bbox_type):
+    boxes = boxes_by_format[bbox_type]
+    benchmark(compute_iou, boxes[::2], boxes[1::2], bbox_type=bbox_type, image_size=image_size)
+
+
+def test_intersection_vectorized(benchmark, boxes_by_format):
+    boxes = boxes_by_format["voc"]
+    benchmark(compute_intersection, boxes[::2], boxes[1::2], bbox_type="voc")
+
+
+def test_area_vectorized(benchmark, boxes_by_format):
+    benchmark(compute_area, boxes_by_format["coco"], bbox_type="coco")
+
+
+@pytest.mark.parametrize("metric", IOU_METRICS)
+def test_iou_matrix(benchmark, boxes_by_format, metric):
+    boxes = boxes_by_format["coco"]
+    benchmark(compute_iou_matrix, boxes, boxes, bbox_type="coco", metric=metric)
+
+
+@pytest.fixture(scope="module")
+def segmentations():
+    """100k COCO style polygons of 4 to 40 points."""
+    rng = np.random.default_rng(0)
+    return [[rng.uniform(0, 640, 2 * rng.integers(4, 41)).tolist()] for _ in range(100000)]
+
+
+def test_polygons_to_bbox(benchmark, segmentations):
+    coords, offsets = pack_polygons(segmentations)
+    benchmark(polygons_to_bbox, coords, offsets, bbox_type="coco")
+
+
+def test_polygons_to_bbox_per_polygon(benchmark, segmentations):
+    def per_polygon():
+        return [
+            (min(polygon[0::2]), min(polygon[1::2]), max(polygon[0::2]), max(polygon[1::2]))
+            for (polygon,) in segmentations
+        ]
+
+    benchmark.pedantic(per_polygon, rounds=3)
+
+
+def test_pack_polygons(benchmark, segmentations):
+    benchmark.pedantic(pack_polygons, args=(segmentations,), rounds=3)
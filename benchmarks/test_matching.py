@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from pybboxes.functional import compute_iou_matrix
+from pybboxes.matching import match_boxes
+
+
+@pytest.fixture(scope="module")
+def box_sets():
+    """10k boxes scattered over a large canvas, mostly non-overlapping, and a jittered copy."""
+    rng = np.random.default_rng(42)
+    boxes1 = np.c_[rng.uniform(0, 20000, (10000, 2)), rng.uniform(10, 100, (10000, 2))]
+    boxes2 = boxes1 + np.c_[rng.normal(0, 5, (10000, 2)), np.zeros((10000, 2))]
+    return boxes1, boxes2, rng.random(10000)
+
+
+@pytest.mark.parametrize("method", ["greedy", "hungarian"])
+def test_match_boxes(benchmark, box_sets, method):
+    boxes1, boxes2, scores = box_sets
+    benchmark(match_boxes, boxes1, boxes2, iou_threshold=0.5, method=method, scores=scores)
+
+
+def test_dense_iou_matrix(benchmark, box_sets):
+    boxes1, boxes2, _ = box_sets
+    benchmark.pedantic(compute_iou_matrix, args=(boxes1[:2500], boxes2[:2500]), rounds=3)
@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray, RotatedBoxArray
+from pybboxes.functional import compute_iou_matrix
+
+THREADS = [None, *sorted({2, 4, os.cpu_count() or 1})]
+WORKERS = [None, *sorted({2, os.cpu_count() or 1})]
+
+
+@pytest.fixture(scope="module")
+def large_boxes():
+    """6000 voc boxes, a 36M pair IoU matrix."""
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 4000, (6000, 2))
+    return np.c_[corners, corners + rng.uniform(5, 200, (6000, 2))]
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_iou_matrix_workers(benchmark, large_boxes, workers):
+    benchmark.pedantic(
+        compute_iou_matrix, args=(large_boxes, large_boxes), kwargs=dict(bbox_type="voc", workers=workers), rounds=3
+    )
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_rotated_iou_matrix_workers(benchmark, large_boxes, workers):
+    rng = np.random.default_rng(1)
+    centers = (large_boxes[:3000, :2] + large_boxes[:3000, 2:]) / 2
+    boxes = RotatedBoxArray(np.c_[centers, rng.uniform(5, 40, (3000, 2)), rng.uniform(-np.pi, np.pi, 3000)])
+    benchmark.pedantic(boxes.iou_matrix, args=(boxes,), kwargs=dict(workers=workers), rounds=3)
+
+
+@pytest.mark.parametrize("threads", THREADS)
+def test_iou_matrix_threads(benchmark, large_boxes, threads):
+    benchmark.pedantic(
+        compute_iou_matrix, args=(large_boxes, large_boxes), kwargs=dict(bbox_type="voc", threads=threads), rounds=3
+    )
+
+
+@pytest.mark.parametrize("threads", THREADS)
+def test_convert_threads(benchmark, threads):
+    rng = np.random.default_rng(2)
+    corners = rng.uniform(0, 1800, (4000000, 2))
+    boxes = BoxArray(np.c_[corners, corners + rng.uniform(5, 100, (4000000, 2))], image_size=(1920, 1080))
+    benchmark.pedantic(boxes.convert, args=("yolo",), kwargs=dict(threads=threads), rounds=3)
+
+
+@pytest.mark.parametrize("threads", THREADS)
+def test_clamp_threads(benchmark, large_boxes, threads):
+    boxes = BoxArray(np.tile(large_boxes, (500, 1)), image_size=(4000, 4000))
+    benchmark.pedantic(boxes.clamp, kwargs=dict(threads=threads), rounds=3)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from pybboxes import RotatedBoxArray
+
+
+@pytest.fixture(scope="module")
+def rotated_boxes():
+    """100k oriented boxes on a 4000x4000 aerial image and jittered detections of them."""
+    rng = np.random.default_rng(0)
+    boxes = np.c_[
+        rng.uniform(0, 4000, (100000, 2)), rng.uniform(5, 40, (100000, 2)), rng.uniform(-np.pi, np.pi, 100000)
+    ]
+    detections = boxes + np.c_[rng.normal(0, 2, (100000, 2)), rng.normal(0, 1, (100000, 2)), rng.normal(0, 0.1, 100000)]
+    return RotatedBoxArray(boxes, (4000, 4000)), RotatedBoxArray(detections, (4000, 4000))
+
+
+def test_to_polygons(benchmark, rotated_boxes):
+    benchmark(rotated_boxes[0].to_polygons)
+
+
+def test_iou_elementwise(benchmark, rotated_boxes):
+    boxes, detections = rotated_boxes
+    benchmark(boxes.iou, detections)
+
+
+def test_iou_matrix(benchmark, rotated_boxes):
+    boxes, detections = rotated_boxes
+    benchmark.pedantic(boxes[:5000].iou_matrix, args=(detections[:5000],), rounds=3)
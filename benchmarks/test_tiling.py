@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from pybboxes.tiling import tile_boxes, tile_windows, untile_boxes
+
+IMAGE_SIZE = (8192, 8192)
+
+
+@pytest.fixture(scope="module")
+def boxes():
+    """50k small objects on an 8K aerial image."""
+    rng = np.random.default_rng(0)
+    return np.c_[rng.uniform(0, 8100, (50000, 2)), rng.uniform(5, 80, (50000, 2))]
+
+
+def test_tile_boxes(benchmark, boxes):
+    windows = tile_windows(IMAGE_SIZE, tile_size=1024, overlap=0.2)
+    benchmark(tile_boxes, boxes, windows, bbox_type="coco", min_visibility=0.3)
+
+
+def test_untile_boxes(benchmark, boxes):
+    windows = tile_windows(IMAGE_SIZE, tile_size=1024, overlap=0.2)
+    per_tile = tile_boxes(boxes, windows, bbox_type="coco").split()
+    benchmark(untile_boxes, per_tile, windows, bbox_type="coco")
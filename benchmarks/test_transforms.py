@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoundingBox, BoxArray
+from pybboxes.transforms import Compose, Crop, HorizontalFlip, Letterbox, Rot90
+
+IMAGE_SIZE = (1920, 1080)
+
+
+@pytest.fixture(scope="module")
+def voc_boxes():
+    rng = np.random.default_rng(0)
+    top_left = rng.uniform(0, 1800, (100000, 2)) * [1, 0.5]
+    return np.c_[top_left, top_left + rng.uniform(10, 100, (100000, 2))]
+
+
+def test_fused_pipeline(benchmark, voc_boxes):
+    pipeline = Compose([Letterbox((640, 640)), HorizontalFlip(), Rot90(), Crop(0, 0, 640, 512)])
+    boxes = BoxArray(voc_boxes, bbox_type="voc", image_size=IMAGE_SIZE)
+    benchmark(pipeline, boxes, clip=True, min_visibility=0.3)
+
+
+def test_per_box_scale_and_shift(benchmark, voc_boxes):
+    """The per box baseline of a letterbox: scale then shift each box object."""
+
+    def letterbox(boxes):
+        for values in boxes:
+            BoundingBox(*values, image_size=IMAGE_SIZE).scale(1 / 9).shift((0, 140)).clamp()
+
+    benchmark.pedantic(letterbox, args=(voc_boxes[:1000].tolist(),), rounds=3)
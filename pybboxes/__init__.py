@@ -1,8 +1,15 @@
 from pybboxes.boxes import (
     AlbumentationsBoundingBox,
     BoundingBox,
+    BoundingBox3D,
+    BoxArray,
+    BoxArray3D,
+    CenterBoundingBox3D,
+    ChunkedBoxArray,
     CocoBoundingBox,
     FiftyoneBoundingBox,
+    RotatedBoundingBox,
+    RotatedBoxArray,
     VocBoundingBox,
     YoloBoundingBox,
 )
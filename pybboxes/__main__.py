@@ -0,0 +1,5 @@
+import sys
+
+from pybboxes.cli import main
+
+sys.exit(main())
@@ -1,4 +1,4 @@
-from typing import Sequence, Tuple, Union
+from typing import List, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -6,3 +6,5 @@ GenericBboxType = Union[
     np.ndarray, Tuple[float, float, float, float], Tuple[int, int, int, int], Sequence[float], Sequence[int]
 ]
 BboxType = Union[Tuple[float, float, float, float], Tuple[int, int, int, int]]
+# (image_name, image_size, boxes, labels) where boxes is a (k, 4) array and labels are label names.
+AnnotationRecordType = Tuple[str, Tuple[int, int], np.ndarray, List[str]]
@@ -2,4 +2,6 @@
 https://medium.com/red-buffer/converting-a-custom-dataset-from-coco-format-to-yolo-format-6d98a4fd43fc
 https://blog.roboflow.com/train-yolov7-instance-segmentation-on-custom-data/
 """
-from pybboxes.annotations.base import Annotations
+from pybboxes.annotations.base import Annotations, AnnotationsView
+from pybboxes.annotations.streaming import convert_records, write_coco, write_voc, write_yolo
+from pybboxes.annotations.table import AnnotationTable
@@ -1,13 +1,29 @@
-import json
 import os
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from typing import List
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
+import numpy as np
 from pycocotools.coco import COCO
 
+from pybboxes import instrumentation
+from pybboxes._typing import AnnotationRecordType
+from pybboxes.annotations.dataframe import dataframe_to_table, table_to_dataframe
+from pybboxes.annotations.merge import concat_tables, duplicate_rows
+from pybboxes.annotations.streaming import (
+    iter_coco,
+    list_voc_files,
+    list_yolo_files,
+    read_voc_file,
+    read_yolo_file,
+    record_boxes,
+    write_coco,
+    write_voc,
+    write_yolo,
+)
+from pybboxes.annotations.table import AnnotationTable
 from pybboxes.boxes import BoundingBox
-from pybboxes.utils.io import get_image_size
+from pybboxes.interop import ArrayInterop, read_only
 
 
 @dataclass
@@ -25,10 +41,13 @@ class Annotation:
     image_height: int = None
 
 
-class Annotations:
+class Annotations(ArrayInterop):
     def __init__(self, annotation_type: str):
         """Initializes Annotations of defined format
 
+        Boxes are stored columnar in an `AnnotationTable` (see `table`), in the annotation type as loaded.
+        `np.asarray(annotations)` and DLPack consumers get the (N, 4) box values without a copy, read-only.
+
         Parameters
         ----------
         annotation_type : str
@@ -45,7 +64,58 @@ class Annotations:
 
         self._annotation_type = annotation_type
         self._class_names: List[str] = []
-        self._objects: dict[str, List[Annotation]] = dict()
+        self._table = AnnotationTable.empty(annotation_type)
+        self._pending: List[AnnotationTable] = []
+
+    @property
+    def table(self) -> AnnotationTable:
+        """columnar storage of the annotations, boxes added since the last access are appended on access
+
+        Returns
+        -------
+        AnnotationTable
+        """
+        if self._pending:
+            # Pending batches are joined in a single pass, not appended to the table one by one
+            pending = self._pending[0] if len(self._pending) == 1 else concat_tables(self._pending)[0]
+            self._table, self._pending = self._table.concat(pending), []
+        return self._table
+
+    @property
+    def values(self) -> np.ndarray:
+        """(N, 4) box values of all annotations in the annotation type, read-only"""
+        return self.table.values
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @property
+    def _objects(self) -> Mapping[str, Tuple[Annotation, ...]]:
+        """
+        read-only snapshot of the annotations as `Annotation` objects per image name, materialized from the table
+        on each access; edit the annotations through `table`, `remove` or `merge` instead
+        """
+        table = self.table
+        from_type = getattr(BoundingBox, f"from_{self._annotation_type}")
+        objects = {}
+        for image_id, image_name in enumerate(table.image_names):
+            rows = table.image_rows(image_id)
+            image_width, image_height = table.image_sizes[image_id].tolist()
+            objects[image_name] = tuple(
+                Annotation(
+                    box=from_type(*values, image_size=(image_width, image_height)),
+                    label_id=label_id,
+                    label_name=self._class_names[label_id],
+                    annotation_id=annotation_id if annotation_id >= 0 else None,
+                    annotation_type=self._annotation_type,
+                    image_width=image_width,
+                    image_height=image_height,
+                )
+                for values, label_id, annotation_id in zip(
+                    table.values[rows].tolist(), table.label_ids[rows].tolist(), table.annotation_ids[rows].tolist()
+                )
+            )
+        return MappingProxyType(objects)
 
     @property
     def names_mapping(self):
@@ -90,74 +160,231 @@ class Annotations:
         """
         return self._class_names[label_id]
 
-    def load_from_albumentations(self):
-        raise NotImplementedError
+    def label_indices(self, label: Union[str, int]) -> np.ndarray:
+        """rows of all boxes of a class, O(k) in the number of boxes k of the class
 
-    def load_from_fiftyone(self):
-        raise NotImplementedError
+        Rows index `values` and the columns of `table`.
 
-    def load_from_voc(self, labels_dir: str):
+        Parameters
+        ----------
+        label : Union[str, int]
+            class name or class id
+
+        Returns
+        -------
+        np.ndarray
+            rows in ascending order
         """
-        initializes Annotations from xml annotations in pascal voc format
+        label_id = self.label2id(label) if isinstance(label, str) else label
+        return self.table.index.label_rows(label_id)
+
+    def label_counts(self) -> Dict[str, int]:
+        """number of boxes per class, from the index
+
+        Returns
+        -------
+        dict
+            in {class_name: count, ...} format, including classes without boxes
+        """
+        counts = self.table.index.label_counts(len(self._class_names))
+        return dict(zip(self._class_names, counts.tolist()))
+
+    def image_indices(self, image_name: str) -> slice:
+        """rows of the boxes of an image, which are contiguous
 
         Parameters
         ----------
-        labels_dir : str
-            provide path to directory that houses xml annotations in pascal voc format
+        image_name : str
+
+        Returns
+        -------
+        slice
+            empty for images without boxes
         """
-        if self._annotation_type != "voc":
-            raise TypeError(f"this instance of Annotations can only process {self._annotation_type} annotation file(s)")
+        table = self.table
+        image_id = table.image_lookup.get(image_name)
+        return table.image_rows(image_id) if image_id is not None else slice(0, 0)
 
-        if not os.path.exists(labels_dir):
-            raise FileNotFoundError(f"{labels_dir} doesn't exists")
+    def area_indices(self, min_area: Optional[float] = None, max_area: Optional[float] = None) -> np.ndarray:
+        """rows of the boxes with `min_area` <= area <= `max_area` in pixels, O(log N + k) from the index
+
+        Parameters
+        ----------
+        min_area : float, optional
+        max_area : float, optional
 
-        for filename in os.listdir(labels_dir):
-            if filename.endswith(".xml"):
-                tree = ET.parse(os.path.join(labels_dir, filename))
-                root = tree.getroot()
-
-                image_name = root.find("filename").text
-                size = root.find("size")
-                img_w = int(size.find("width").text)
-                img_h = int(size.find("height").text)
-
-                for obj in root.findall("object"):
-                    label_name = obj.find("name").text
-                    if label_name not in self._class_names:
-                        self._class_names.append(label_name)
-                    label_id = self.label2id(label_name)
-
-                    bbox = obj.find("bndbox")
-                    xmin = float(bbox.find("xmin").text)
-                    ymin = float(bbox.find("ymin").text)
-                    xmax = float(bbox.find("xmax").text)
-                    ymax = float(bbox.find("ymax").text)
-
-                    bbox = BoundingBox.from_voc(xmin, ymin, xmax, ymax, image_size=(img_w, img_h))
-
-                    annotatation = Annotation(
-                        box=bbox,
-                        label_id=label_id,
-                        label_name=label_name,
-                        annotation_type="voc",
-                        image_width=img_w,
-                        image_height=img_h,
-                    )
-
-                    if image_name in self._objects:
-                        self._objects[image_name].append(annotatation)
-                    else:
-                        self._objects[image_name] = [annotatation]
-
-    def load_from_coco(self, json_path: str):
+        Returns
+        -------
+        np.ndarray
+            rows by ascending area
         """
-        initializes Annotations from coco annotation file (json files)
+        return self.table.index.area_rows(min_area, max_area)
+
+    def merge(self, *others: "Annotations", dedup_iou: Optional[float] = None) -> "Annotations":
+        """merges the annotations of other datasets into new annotations of this annotation type
+
+        Label vocabularies are joined by class name, classes of `others` unknown to this dataset are appended in
+        order. Images are joined by name, the boxes of an image keep the order of the datasets and the image size
+        of the first dataset having the image is kept. Boxes of other annotation types are converted.
 
         Parameters
         ----------
-        json_path : str
-            provide path to coco annotation  file in json format
+        *others : Annotations
+            datasets to merge, in order of precedence after this one
+        dedup_iou : float, optional
+            drops the boxes matching a box of an earlier dataset of the same image and class with an IoU of at
+            least `dedup_iou`, computed with vectorized IoU over the boxes grouped by image and class. Boxes of a
+            single dataset are never dropped as duplicates of each other, and boxes that do not overlap never
+            match, even with a zero `dedup_iou`. No boxes are dropped by default.
+
+        Returns
+        -------
+        Annotations
+        """
+        class_names = list(self._class_names)
+        mapping = {name: id_ for id_, name in enumerate(class_names)}
+        label_remaps = [np.arange(len(class_names), dtype=np.int64)]
+        for other in others:
+            label_remaps.append(
+                np.array([mapping.setdefault(name, len(mapping)) for name in other._class_names], dtype=np.int64)
+            )
+        class_names = list(mapping)
+
+        tables = [self.table] + [other.table.convert(self._annotation_type) for other in others]
+        table, sources = concat_tables(tables, label_remaps)
+        if dedup_iou is not None:
+            duplicates = duplicate_rows(table.to_voc_array(), table.image_ids, table.label_ids, sources, dedup_iou)
+            if duplicates.any():
+                table = table.remove(duplicates)
+
+        merged = Annotations(self._annotation_type)
+        merged._class_names, merged._table = class_names, table
+        return merged
+
+    def filter(
+        self,
+        labels: Optional[Iterable[Union[str, int]]] = None,
+        area_min: Optional[float] = None,
+        area_max: Optional[float] = None,
+        aspect_min: Optional[float] = None,
+        aspect_max: Optional[float] = None,
+        oob: Optional[bool] = None,
+    ) -> "AnnotationsView":
+        """selects the boxes matching all given predicates, evaluated as vectorized masks over the columns
+
+        The result is a view holding the rows of the current table, no box is copied until the view is saved or
+        changed. Views can be filtered further.
+
+        Parameters
+        ----------
+        labels : Iterable[Union[str, int]], optional
+            class names or class ids to keep
+        area_min, area_max : float, optional
+            inclusive bounds of the box area in pixels
+        aspect_min, aspect_max : float, optional
+            inclusive bounds of the aspect ratio (w / h)
+        oob : bool, optional
+            keep only out of bounds boxes if True, only boxes within the image if False
+
+        Returns
+        -------
+        AnnotationsView
+
+        Raises
+        ------
+        ValueError
+            if a class name is unknown
         """
+        label_ids = None
+        if labels is not None:
+            names_mapping = self.names_mapping
+            unknown = [label for label in labels if isinstance(label, str) and label not in names_mapping]
+            if unknown:
+                raise ValueError(f"Unknown labels {unknown}, expected names of {self._class_names}.")
+            label_ids = [names_mapping[label] if isinstance(label, str) else label for label in labels]
+        table, rows = self._view_source()
+        rows = table.query(rows, label_ids, area_min, area_max, aspect_min, aspect_max, oob)
+        return AnnotationsView(self._annotation_type, self._class_names, table, rows)
+
+    def _view_source(self):
+        """table and rows (None for all) views of these annotations select from"""
+        return self.table, None
+
+    def remove(self, indices) -> None:
+        """removes the boxes at the given rows, rows after them are renumbered
+
+        The indexes are updated without a rebuild. Images left without boxes are removed as well.
+
+        Parameters
+        ----------
+        indices : array-like or slice
+            rows, e.g. as returned by `label_indices`, or a boolean mask over the rows
+        """
+        self._table = self.table.remove(indices)
+
+    def to_dataframe(self, bbox_type: str = None):
+        """exports the annotations as a pandas DataFrame, one row per box (requires the `pandas` extra)
+
+        Parameters
+        ----------
+        bbox_type : str, optional
+            format of the box columns, the annotation type by default
+
+        Returns
+        -------
+        pandas.DataFrame
+            with categorical `image_name` and `label` columns, see :py:mod:`pybboxes.annotations.dataframe`
+        """
+        return table_to_dataframe(self.table, self._class_names, bbox_type)
+
+    @classmethod
+    def from_dataframe(cls, df, annotation_type: str, bbox_type: str = None, class_names: List[str] = None):
+        """initializes Annotations from a pandas DataFrame in the layout of `to_dataframe`
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            one row per box, `annotation_id` and `label_id` columns are optional (labels are taken by name)
+        annotation_type : str
+            should be within (yolo, coco, voc, albumentations and fiftyone)
+        bbox_type : str, optional
+            format of the box columns, `annotation_type` by default
+        class_names : List[str], optional
+            label vocabulary, labels not in it are appended in the order of appearance
+
+        Returns
+        -------
+        Annotations
+        """
+        annotations = cls(annotation_type)
+        table, annotations._class_names = dataframe_to_table(df, annotation_type, bbox_type, class_names)
+        table.validate()
+        annotations._table = table
+        return annotations
+
+    def load_from_albumentations(self):
+        raise NotImplementedError
+
+    def load_from_fiftyone(self):
+        raise NotImplementedError
+
+    def _add_records(self, records: Iterable[AnnotationRecordType], annotation_ids=None, strict: bool = False) -> None:
+        """validates and stores records with boxes in the annotation type, in one batch"""
+        table = AnnotationTable.from_records(self._annotation_type, records, self.names_mapping, annotation_ids)
+        table.validate(strict=strict)
+        self._pending.append(table)
+
+    def _update_class_names(self, labels: List[str]) -> None:
+        for label_name in labels:
+            if label_name not in self._class_names:
+                self._class_names.append(label_name)
+
+    def _iter_records(self) -> Iterator[AnnotationRecordType]:
+        """yields loaded annotations as (image_name, image_size, boxes, labels) records with voc boxes"""
+        for image_name, image_size, boxes, labels in self.table.iter_records(self._class_names):
+            yield image_name, image_size, record_boxes(boxes, "voc"), labels
+
+    def _load_coco(self, json_path: str) -> COCO:
         if self._annotation_type != "coco":
             raise TypeError(f"this instance of Annotations can only process {self._annotation_type} annotation file(s)")
 
@@ -165,35 +392,64 @@ class Annotations:
             raise FileNotFoundError(f"{json_path} doesn't exists")
 
         coco = COCO(json_path)
+        instrumentation.record_file_read(json_path)
 
         categories = coco.loadCats(coco.getCatIds())
         self._class_names = [category["name"] for category in categories]  # we just need the names
+        return coco
 
-        for ann_id in coco.getAnnIds():
-            ann = coco.loadAnns(ann_id)[0]
-            img = coco.loadImgs(ann["image_id"])[0]
-            associated_img_filename = img["file_name"]
-
-            bbox = BoundingBox.from_coco(*ann["bbox"], image_size=(img["width"], img["height"]))
-
-            annotation = Annotation(
-                box=bbox,
-                label_id=ann["category_id"],
-                label_name=self.id2label(ann["category_id"]),
-                annotation_type="coco",
-                annotation_id=ann["id"],
-                image_width=img["width"],
-                image_height=img["height"],
-            )
+    def iter_from_voc(self, labels_dir: str) -> Iterator[AnnotationRecordType]:
+        """
+        streams xml annotations in pascal voc format one image at a time, without storing them
+
+        Parameters
+        ----------
+        labels_dir : str
+            provide path to directory that houses xml annotations in pascal voc format
+
+        Returns
+        -------
+        Iterator
+            of (image_name, image_size, boxes, labels) records where boxes is a (k, 4) array in voc format and
+            labels are the label names. New label names are registered as they are encountered.
+        """
+        if self._annotation_type != "voc":
+            raise TypeError(f"this instance of Annotations can only process {self._annotation_type} annotation file(s)")
+
+        if not os.path.exists(labels_dir):
+            raise FileNotFoundError(f"{labels_dir} doesn't exists")
 
-            # if the entry for this file already exists
-            if associated_img_filename in self._objects:
-                self._objects[associated_img_filename].append(annotation)
-            else:
-                self._objects[associated_img_filename] = [annotation]
+        def records():
+            for labels_path in list_voc_files(labels_dir):
+                record = read_voc_file(labels_path)
+                self._update_class_names(record[3])
+                yield record
 
-    def load_from_yolo(self, labels_dir: str, images_dir: str, classes_file: str):
-        """load annoations in yolo format
+        return records()
+
+    def iter_from_coco(self, json_path: str, boxes_from_segmentations: bool = False) -> Iterator[AnnotationRecordType]:
+        """
+        streams coco annotations one image at a time, without storing them
+
+        Note that the json file itself is parsed at once, only the per-image box objects are streamed.
+
+        Parameters
+        ----------
+        json_path : str
+            provide path to coco annotation  file in json format
+        boxes_from_segmentations : bool
+            recompute the boxes of annotations with a segmentation from the segmentation (polygons or RLE)
+
+        Returns
+        -------
+        Iterator
+            of (image_name, image_size, boxes, labels) records where boxes is a (k, 4) array in coco format and
+            labels are the label names.
+        """
+        return iter_coco(self._load_coco(json_path), boxes_from_segmentations=boxes_from_segmentations)
+
+    def iter_from_yolo(self, labels_dir: str, images_dir: str, classes_file: str) -> Iterator[AnnotationRecordType]:
+        """streams annotations in yolo format one image at a time, without storing them
 
         Parameters
         ----------
@@ -203,8 +459,13 @@ class Annotations:
             immediate parent directory that houses all the images (we need corresponding images to labels to extract image dimensions)
         classes_file : str
             path to classes.txt that lists all the class labels used in the annotation
-        """
 
+        Returns
+        -------
+        Iterator
+            of (image_name, image_size, boxes, labels) records where boxes is a (k, 4) array in yolo format and
+            labels are the label names.
+        """
         if self._annotation_type != "yolo":
             raise TypeError(f"this instance of Annotations can only process {self._annotation_type} annotation file(s)")
 
@@ -220,41 +481,63 @@ class Annotations:
         with open(classes_file, "r") as f:
             self._class_names = [line.strip() for line in f.readlines()]
 
-        for filename in os.listdir(labels_dir):
-            if filename.endswith(".txt"):
-                if "classes" in filename:
-                    continue  # if this is classes label, we have to skip as it donot contains bounding boxes data
-
-                image_name = filename.replace(".txt", ".jpg")  # we are assuming jpg extension
-                if not os.path.exists(os.path.join(images_dir, image_name)):
-                    image_name = filename.replace(".jpg", ".jpeg")  # see if image with jpeg extension exits
-                    if not os.path.exists(image_name):
-                        raise FileNotFoundError(f"{image_name} not found in images directory")
-
-                image_size = get_image_size(os.path.join(images_dir, image_name))  # we need for yolo format
-
-                with open(os.path.join(labels_dir, filename), "r") as f:
-                    for line in f:
-                        parts = line.strip().split()
-                        label_id = int(parts[0])  # extract the class/label id
-                        x_c, y_c, w, h = map(float, parts[1:5])
-
-                        bbox = BoundingBox.from_yolo(x_c, y_c, w, h, image_size=image_size)
-
-                        annotation = Annotation(
-                            box=bbox,
-                            label_id=label_id,
-                            label_name=self.id2label(label_id),
-                            annotation_type="yolo",
-                            image_width=image_size[0],
-                            image_height=image_size[1],
-                        )
-
-                        if image_name not in self._objects.keys():
-                            self._objects[image_name] = [annotation]
-                        else:
-                            self._objects[image_name].append(annotation)
+        def records():
+            for labels_path in list_yolo_files(labels_dir):
+                yield read_yolo_file(labels_path, images_dir, self._class_names)
+
+        return records()
+
+    @instrumentation.timed("annotations.load_from_voc")
+    def load_from_voc(self, labels_dir: str):
+        """
+        initializes Annotations from xml annotations in pascal voc format
+
+        Parameters
+        ----------
+        labels_dir : str
+            provide path to directory that houses xml annotations in pascal voc format
+        """
+        # labels are registered while reading, so the records are read before mapping them to ids
+        records = list(self.iter_from_voc(labels_dir))
+        self._add_records(records, strict=True)  # as BoundingBox.from_voc
+
+    @instrumentation.timed("annotations.load_from_coco")
+    def load_from_coco(self, json_path: str, boxes_from_segmentations: bool = False):
+        """
+        initializes Annotations from coco annotation file (json files)
+
+        Label ids are positions in the `categories` list of the file, not the `category_id` of the annotations,
+        so non-contiguous or 1-based category ids map to `0..K-1`.
+
+        Parameters
+        ----------
+        json_path : str
+            provide path to coco annotation  file in json format
+        boxes_from_segmentations : bool
+            recompute the boxes of annotations with a segmentation from the segmentation (polygons or RLE),
+            e.g. when `bbox` is missing or stale
+        """
+        coco = self._load_coco(json_path)
+        records = iter_coco(coco, boxes_from_segmentations=boxes_from_segmentations)
+        annotation_ids = ([ann["id"] for ann in coco.imgToAnns.get(image_id, [])] for image_id in coco.imgs)
+        self._add_records(records, annotation_ids)
+
+    @instrumentation.timed("annotations.load_from_yolo")
+    def load_from_yolo(self, labels_dir: str, images_dir: str, classes_file: str):
+        """load annoations in yolo format
 
+        Parameters
+        ----------
+        labels_dir : str
+            immediate parent directory that houses all the image annoatations
+        images_dir : str
+            immediate parent directory that houses all the images (we need corresponding images to labels to extract image dimensions)
+        classes_file : str
+            path to classes.txt that lists all the class labels used in the annotation
+        """
+        self._add_records(self.iter_from_yolo(labels_dir, images_dir, classes_file))
+
+    @instrumentation.timed("annotations.save_as_yolo")
     def save_as_yolo(self, export_dir: str):
         """writes loaded annotations in yolo format
 
@@ -266,25 +549,9 @@ class Annotations:
         this will write annotation files for all the corresponding images and also 'classes.txt' that defines all the class
         used for the annotation
         """
-        os.makedirs(export_dir, exist_ok=True)
-
-        # write class file
-        with open(os.path.join(export_dir, "classes.txt"), "w") as f:
-            for cls in self._class_names:
-                f.write(f"{cls}\n")
-
-        for image_name in self._objects.keys():
-
-            filename = f"{os.path.splitext(image_name)[0]}.txt"
-            filepath = os.path.join(export_dir, filename)
-
-            with open(filepath, mode="a") as f:
-                for annotation in self._objects[image_name]:
-                    yolo_box = annotation.box.to_yolo().raw_values
-                    yolo_box = [f"{x:.4f}" for x in yolo_box]
-                    yolo_box.insert(0, str(annotation.label_id))  # append class/label id at the beginning
-                    f.write(f"{' '.join(yolo_box)}\n")
+        write_yolo(self._iter_records(), export_dir, bbox_type="voc", class_names=self._class_names)
 
+    @instrumentation.timed("annotations.save_as_voc")
     def save_as_voc(self, export_dir: str, n_channels: int = 3):
         """writes loaded annotations in voc format
 
@@ -293,42 +560,9 @@ class Annotations:
         export_dir : str
             path to directory where all the annotation files should be written
         """
-        os.makedirs(export_dir, exist_ok=True)
-        for image_name in self._objects.keys():
-            filename = os.path.splitext(image_name)[0] + ".xml"
-            filepath = os.path.join(export_dir, filename)
-
-            root = ET.Element("annotation")
-            ET.SubElement(root, "filename").text = image_name
-            size = ET.SubElement(root, "size")
-
-            if len(self._objects[image_name]) == 0:
-                raise ValueError(f"no associated annotations for {image_name}")
-
-            # get the first sample from list because it contains image dimensions
-            sample_annotation = self._objects[image_name][0]
-            ET.SubElement(size, "width").text = str(sample_annotation.image_width)
-            ET.SubElement(size, "height").text = str(sample_annotation.image_height)
-            ET.SubElement(size, "depth").text = str(n_channels)
-            del sample_annotation  # after we have extracted image width and height, we donot need it anymore
-
-            for annotation in self._objects[image_name]:
-                obj = ET.SubElement(root, "object")
-                ET.SubElement(obj, "name").text = annotation.label_name
-                ET.SubElement(obj, "pose").text = "Unspecified"
-                ET.SubElement(obj, "truncated").text = "0"
-                ET.SubElement(obj, "difficult").text = "0"
-
-                bbox = ET.SubElement(obj, "bndbox")
-                voc_box = annotation.box.to_voc().raw_values
-                ET.SubElement(bbox, "xmin").text = str(int(voc_box[0]))
-                ET.SubElement(bbox, "ymin").text = str(int(voc_box[1]))
-                ET.SubElement(bbox, "xmax").text = str(int(voc_box[2]))
-                ET.SubElement(bbox, "ymax").text = str(int(voc_box[3]))
-
-            tree = ET.ElementTree(root)
-            tree.write(filepath)
+        write_voc(self._iter_records(), export_dir, bbox_type="voc", n_channels=n_channels)
 
+    @instrumentation.timed("annotations.save_as_coco")
     def save_as_coco(self, export_file: str):
         """writes loaded annotation in coco format (json format)
 
@@ -337,47 +571,85 @@ class Annotations:
         export_file : str
             name (or path) for the annotation file
         """
-        coco_data = {"images": [], "categories": [], "annotations": []}
-
-        # embed categorical information
-        for i, name in enumerate(self._class_names):
-            coco_data["categories"].append({"id": i, "name": name, "supercategory": "none"})
-
-        image_id = 0
-        ann_id = 0
-        for image_name in self._objects.keys():
-            for annotation in self._objects[image_name]:
-                # embed image metadata
-                coco_data["images"].append(
-                    {
-                        "id": image_id,
-                        "file_name": image_name,
-                        "width": annotation.image_width,
-                        "height": annotation.image_height,
-                    }
-                )
-
-                # embed annotation metadata
-                coco_box = annotation.box.to_coco().raw_values
-                coco_data["annotations"].append(
-                    {
-                        "id": ann_id,
-                        "image_id": image_id,
-                        "category_id": annotation.label_id,
-                        "bbox": coco_box,
-                        "area": coco_box[2] * coco_box[3],
-                        "iscrowd": 0,
-                    }
-                )
-
-                ann_id += 1
-            image_id += 1
-
-        with open(export_file, "w", encoding="utf-8") as f:
-            json.dump(coco_data, f)
+        write_coco(self._iter_records(), export_file, bbox_type="voc", class_names=self._class_names)
 
     def save_as_albumentations(self):
         raise NotImplementedError
 
     def save_as_fiftyone(self):
         raise NotImplementedError
+
+
+class AnnotationsView(Annotations):
+    """rows of the table of `Annotations` selected by `Annotations.filter`
+
+    The view holds the table it was created from and the selected rows only, `values` and `len` are read from
+    them. The rows are copied into a table of their own (materialized) on the first access of `table`, by saving,
+    adding or removing boxes and by the queries of `Annotations`. The view is a snapshot, later changes of the
+    source annotations do not affect it (and vice versa).
+
+    Until it is materialized, the view has no values array of its own: `values`, `np.asarray(view)` and DLPack
+    exports are read-only copies of the selected rows, and requests for an export without a copy (``copy=False``)
+    raise. Access `table` first to get zero-copy exports.
+
+    Parameters
+    ----------
+    annotation_type : str
+        annotation type of the source annotations
+    class_names : List[str]
+        class names of the source annotations
+    source : AnnotationTable
+        table the rows are selected from
+    rows : np.ndarray
+        ascending rows of `source`
+    """
+
+    def __init__(self, annotation_type: str, class_names: List[str], source: AnnotationTable, rows: np.ndarray):
+        super().__init__(annotation_type)
+        self._class_names = list(class_names)
+        self._source: Optional[AnnotationTable] = source
+        self._rows: Optional[np.ndarray] = rows
+
+    def __repr__(self):
+        state = "materialized" if self.is_materialized else f"{len(self)} of {len(self._source)} boxes"
+        return f"<AnnotationsView {self._annotation_type} ({state})>"
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._source is None
+
+    @property
+    def indices(self) -> Optional[np.ndarray]:
+        """rows of the source table, None once materialized"""
+        return self._rows
+
+    @property
+    def table(self) -> AnnotationTable:
+        if self._source is not None:
+            self._table = self._source.take(self._rows)
+            self._source, self._rows = None, None
+        return super().table
+
+    @property
+    def values(self) -> np.ndarray:
+        if self._source is not None:
+            return read_only(self._source.values[self._rows])
+        return super().values
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy is False and self._source is not None:
+            raise ValueError("Values of a view are copied until it is materialized, access `table` first.")
+        return super().__array__(dtype, copy)
+
+    def __dlpack__(self, **kwargs):
+        if kwargs.get("copy") is False and self._source is not None:
+            raise BufferError("Values of a view are copied until it is materialized, access `table` first.")
+        return super().__dlpack__(**kwargs)
+
+    def __len__(self) -> int:
+        return len(self._rows) if self._source is not None else super().__len__()
+
+    def _view_source(self):
+        if self._source is not None:
+            return self._source, self._rows
+        return super()._view_source()
@@ -0,0 +1,141 @@
+"""
+pandas DataFrame import/export of annotation tables, requires the optional `pandas` extra
+(``pip install pybboxes[pandas]``). Columns are built from the table arrays at once, image and label names are
+categorical columns built from their codes, so no per-row Python work is done either way.
+
+A frame has one row per box with the columns ``image_name``, ``image_width``, ``image_height``, ``label``,
+``label_id``, ``annotation_id`` (-1 where unknown) and the box columns of the format, see `BOX_COLUMNS`.
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from pybboxes import ops, precision
+from pybboxes.annotations.table import AnnotationTable
+
+BOX_COLUMNS = {
+    "albumentations": ("x_tl", "y_tl", "x_br", "y_br"),
+    "coco": ("x_tl", "y_tl", "w", "h"),
+    "fiftyone": ("x_tl", "y_tl", "w", "h"),
+    "voc": ("x_tl", "y_tl", "x_br", "y_br"),
+    "yolo": ("x_c", "y_c", "w", "h"),
+}
+
+
+def _import_pandas():
+    try:
+        import pandas
+    except ImportError as e:
+        raise ImportError(
+            "pandas is required for DataFrame import/export, install it with `pip install pybboxes[pandas]`."
+        ) from e
+    return pandas
+
+
+def _convert(values: np.ndarray, from_type: str, to_type: str, image_sizes: np.ndarray) -> np.ndarray:
+    """converts through voc with the rounding of the box classes"""
+    if from_type == to_type:
+        return values
+    voc_values = ops.to_voc_array(values, from_type, image_sizes)
+    return ops.from_voc_array(voc_values, to_type, image_sizes)
+
+
+def table_to_dataframe(table: AnnotationTable, class_names: List[str], bbox_type: Optional[str] = None):
+    """builds a DataFrame of the rows of `table`
+
+    Parameters
+    ----------
+    table : AnnotationTable
+        annotations to export
+    class_names : List[str]
+        label names by label id
+    bbox_type : str, optional
+        format of the box columns, the format of the table by default (values as stored, no conversion)
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    pd = _import_pandas()
+    bbox_type = bbox_type or table.bbox_type
+    ops._check_bbox_type(bbox_type)
+    row_image_sizes = table.row_image_sizes
+    if bbox_type == table.bbox_type:
+        values = table.values
+    else:
+        values = ops.from_voc_array(table.to_voc_array(), bbox_type, row_image_sizes)
+        values = precision.cast(values, precision.storage_dtype(bbox_type, values))
+    columns = {
+        "image_name": pd.Categorical.from_codes(table.image_ids, categories=pd.Index(table.image_names)),
+        "image_width": row_image_sizes[:, 0],
+        "image_height": row_image_sizes[:, 1],
+        "label": pd.Categorical.from_codes(table.label_ids, categories=pd.Index(class_names)),
+        "label_id": table.label_ids,
+        "annotation_id": table.annotation_ids,
+    }
+    columns.update(zip(BOX_COLUMNS[bbox_type], values.T))
+    # the frame owns its columns, the table arrays are read-only and shared by the index and caches
+    return pd.DataFrame(columns, copy=True)
+
+
+def _factorize(column) -> Tuple[np.ndarray, list]:
+    pd = _import_pandas()
+    codes, uniques = pd.factorize(column)
+    if (codes < 0).any():
+        raise ValueError(f"Column '{column.name}' has missing values.")
+    return codes.astype(np.int64), list(uniques)
+
+
+def dataframe_to_table(
+    df, annotation_type: str, bbox_type: Optional[str] = None, class_names: Optional[List[str]] = None
+) -> Tuple[AnnotationTable, List[str]]:
+    """builds an annotation table from a DataFrame in the layout of :py:func:`table_to_dataframe`
+
+    Images keep the order of their first row, the size of an image is taken from its first row.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        annotations, one row per box
+    annotation_type : str
+        format of the resulting table
+    bbox_type : str, optional
+        format of the box columns, `annotation_type` by default
+    class_names : List[str], optional
+        label vocabulary, labels not in it are appended in the order of appearance. The categories of a
+        categorical `label` column by default.
+
+    Returns
+    -------
+    tuple
+        (table, class_names)
+    """
+    bbox_type = bbox_type or annotation_type
+    ops._check_bbox_type(bbox_type)
+    required = ("image_name", "image_width", "image_height", "label") + BOX_COLUMNS[bbox_type]
+    missing = [column for column in required if column not in df.columns]
+    if missing:
+        raise ValueError(f"DataFrame is missing the columns {missing} for {bbox_type} boxes.")
+
+    pd = _import_pandas()
+    image_ids, image_names = _factorize(df["image_name"])
+    codes, labels = _factorize(df["label"])
+    if class_names is None and isinstance(df["label"].dtype, pd.CategoricalDtype):
+        # keeps the vocabulary of exported frames, including labels without boxes
+        class_names = df["label"].cat.categories
+    class_names = list(class_names) if class_names is not None else []
+    mapping = {name: id_ for id_, name in enumerate(class_names)}
+    for label in labels:
+        if label not in mapping:
+            mapping[label] = len(class_names)
+            class_names.append(label)
+    label_ids = np.array([mapping[label] for label in labels], dtype=np.int64)[codes]
+
+    sizes = df[["image_width", "image_height"]].to_numpy(dtype=np.int64)
+    _, first_rows = np.unique(image_ids, return_index=True)
+    values = _convert(df[list(BOX_COLUMNS[bbox_type])].to_numpy(dtype=float), bbox_type, annotation_type, sizes)
+    annotation_ids = df["annotation_id"].to_numpy(dtype=np.int64) if "annotation_id" in df.columns else None
+    table = AnnotationTable.from_rows(
+        annotation_type, values, label_ids, image_ids, image_names, sizes[first_rows], annotation_ids
+    )
+    return table, class_names
@@ -0,0 +1,110 @@
+"""
+Query indexes over the rows of an :py:class:`pybboxes.annotations.table.AnnotationTable`. Rows are grouped by label
+(label id -> rows, as CSR offsets into a row permutation) and sorted by box area, so class and area range queries
+return their k rows as a slice of a precomputed array, O(k) (plus O(log N) for the area bounds) instead of a scan of
+the N rows. Images need no index, the rows of an image are contiguous in the table.
+
+Indexes are updated in place of a rebuild as rows come and go: appended rows are merged in (the stable sorts merge
+the two sorted runs in linear time), removed rows are filtered out keeping the order, so no sort of the whole
+table is repeated. The index arrays are read-only, as are the table columns they are built from, so the rows
+returned by queries (views of the index) cannot be changed behind its back.
+"""
+from typing import Optional
+
+import numpy as np
+
+from pybboxes.interop import read_only
+
+
+class AnnotationIndex:
+    """label and area indexes of N table rows
+
+    Parameters
+    ----------
+    label_order : np.ndarray
+        (N,) rows grouped by label id, ascending within a label
+    label_offsets : np.ndarray
+        (L + 1,) offsets of the rows of each label id into `label_order`
+    area_order : np.ndarray
+        (N,) rows by ascending area
+    sorted_areas : np.ndarray
+        (N,) areas of the rows of `area_order`
+    """
+
+    def __init__(
+        self, label_order: np.ndarray, label_offsets: np.ndarray, area_order: np.ndarray, sorted_areas: np.ndarray
+    ):
+        self.label_order = read_only(label_order)
+        self.label_offsets = read_only(label_offsets)
+        self.area_order = read_only(area_order)
+        self.sorted_areas = read_only(sorted_areas)
+
+    @classmethod
+    def build(cls, label_ids: np.ndarray, areas: np.ndarray) -> "AnnotationIndex":
+        """indexes rows of the given label ids and box areas"""
+        label_ids, areas = np.asarray(label_ids, dtype=np.int64), np.asarray(areas, dtype=float)
+        label_order = np.argsort(label_ids, kind="stable")
+        area_order = np.argsort(areas, kind="stable")
+        return cls(label_order, _offsets(label_ids), area_order, areas[area_order])
+
+    def __len__(self) -> int:
+        return len(self.label_order)
+
+    @property
+    def num_labels(self) -> int:
+        return len(self.label_offsets) - 1
+
+    def label_rows(self, label_id: int) -> np.ndarray:
+        """rows of `label_id` in ascending order, a view of the index"""
+        if not 0 <= label_id < self.num_labels:
+            return self.label_order[:0]
+        return self.label_order[self.label_offsets[label_id] : self.label_offsets[label_id + 1]]
+
+    def label_counts(self, num_labels: Optional[int] = None) -> np.ndarray:
+        """(L,) number of rows of each label id, padded with zeros up to `num_labels`"""
+        counts = np.diff(self.label_offsets)
+        if num_labels is not None and num_labels > len(counts):
+            counts = np.concatenate([counts, np.zeros(num_labels - len(counts), dtype=counts.dtype)])
+        return counts
+
+    def area_rows(self, min_area: Optional[float] = None, max_area: Optional[float] = None) -> np.ndarray:
+        """rows with `min_area` <= area <= `max_area` by ascending area, a view of the index"""
+        start = 0 if min_area is None else np.searchsorted(self.sorted_areas, min_area, side="left")
+        stop = len(self) if max_area is None else np.searchsorted(self.sorted_areas, max_area, side="right")
+        return self.area_order[start:stop]
+
+    def _sorted_labels(self) -> np.ndarray:
+        """label id of each entry of `label_order`"""
+        return np.repeat(np.arange(self.num_labels), self.label_counts())
+
+    def append(self, label_ids: np.ndarray, areas: np.ndarray) -> "AnnotationIndex":
+        """index with rows of the given label ids and areas appended after the indexed rows"""
+        label_ids, areas = np.asarray(label_ids, dtype=np.int64), np.asarray(areas, dtype=float)
+        num_rows = len(self)
+        new_label_order = np.argsort(label_ids, kind="stable")
+        labels = np.concatenate([self._sorted_labels(), label_ids[new_label_order]])
+        merge = np.argsort(labels, kind="stable")
+        label_order = np.concatenate([self.label_order, new_label_order + num_rows])[merge]
+
+        new_area_order = np.argsort(areas, kind="stable")
+        sorted_areas = np.concatenate([self.sorted_areas, areas[new_area_order]])
+        merge = np.argsort(sorted_areas, kind="stable")
+        area_order = np.concatenate([self.area_order, new_area_order + num_rows])[merge]
+        return AnnotationIndex(label_order, _offsets(labels, self.num_labels), area_order, sorted_areas[merge])
+
+    def remove(self, keep: np.ndarray) -> "AnnotationIndex":
+        """index of the rows where the (N,) mask `keep` is True, renumbered as the kept rows"""
+        keep = np.asarray(keep, dtype=bool)
+        new_rows = np.cumsum(keep) - 1
+        label_kept = keep[self.label_order]
+        area_kept = keep[self.area_order]
+        return AnnotationIndex(
+            new_rows[self.label_order[label_kept]],
+            _offsets(self._sorted_labels()[label_kept], self.num_labels),
+            new_rows[self.area_order[area_kept]],
+            self.sorted_areas[area_kept],
+        )
+
+
+def _offsets(label_ids: np.ndarray, num_labels: int = 0) -> np.ndarray:
+    return np.concatenate([[0], np.cumsum(np.bincount(label_ids, minlength=num_labels))]).astype(np.int64)
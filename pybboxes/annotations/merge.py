@@ -0,0 +1,145 @@
+"""
+Merging of annotation tables of several datasets. Images are joined by name and the rows of all datasets are
+grouped by image in a single stable sort, so the rows of an image keep the order of the datasets.
+
+Near-duplicate boxes, i.e. boxes of the same image and label with an IoU of at least a threshold, are found without
+any per-image Python loop: rows are sorted by (image, label), all pairs within these groups are enumerated with
+index arithmetic in chunks of at most `PAIRS_PER_CHUNK` pairs and their IoU is computed at once. Groups larger than
+`MAX_DENSE_GROUP` (e.g. crowds of a single class) go through :py:func:`pybboxes.ops.sparse_pairwise_iou` instead of
+enumerating all their pairs.
+"""
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pybboxes import ops
+from pybboxes.annotations.table import AnnotationTable
+
+PAIRS_PER_CHUNK = 1 << 22
+MAX_DENSE_GROUP = 2048
+
+
+def concat_tables(
+    tables: Sequence[AnnotationTable], label_remaps: Optional[Sequence[np.ndarray]] = None
+) -> Tuple[AnnotationTable, np.ndarray]:
+    """concatenates tables of the same box format, joining images by name
+
+    Parameters
+    ----------
+    tables : Sequence[AnnotationTable]
+        tables to concatenate, the image size of the first table of an image is kept
+    label_remaps : Sequence[np.ndarray], optional
+        per table, maps the label ids of the table to label ids of the result
+
+    Returns
+    -------
+    tuple
+        (table, sources) where sources holds the index of the table of each row
+    """
+    bbox_type = tables[0].bbox_type
+    image_index, image_names, image_sizes = {}, [], []
+    values, label_ids, image_ids, annotation_ids, sources = [], [], [], [], []
+    for source, table in enumerate(tables):
+        if table.bbox_type != bbox_type:
+            raise ValueError(f"Cannot concatenate {table.bbox_type} annotations to {bbox_type} annotations.")
+        image_remap = np.empty(table.num_images, dtype=np.int64)
+        num_images = len(image_names)
+        for i, name in enumerate(table.image_names):
+            image_id = image_index.setdefault(name, len(image_index))
+            if image_id == len(image_names):
+                image_names.append(name)
+            image_remap[i] = image_id
+        image_sizes.append(table.image_sizes[image_remap >= num_images])
+        values.append(table.values)
+        label_ids.append(table.label_ids if label_remaps is None else np.asarray(label_remaps[source])[table.label_ids])
+        image_ids.append(image_remap[table.image_ids])
+        annotation_ids.append(table.annotation_ids)
+        sources.append(np.full(len(table), source, dtype=np.int64))
+
+    image_ids = np.concatenate(image_ids)
+    order = np.argsort(image_ids, kind="stable")
+    sources = np.concatenate(sources)[order]
+    dtype = np.result_type(*(table.values.dtype for table in tables))
+    table = AnnotationTable(
+        bbox_type,
+        np.concatenate(values).astype(dtype, copy=False)[order],
+        np.concatenate(label_ids)[order],
+        image_ids[order],
+        image_names,
+        np.concatenate(image_sizes),
+        np.concatenate(annotation_ids)[order],
+    )
+    table._image_lookup = image_index
+    return table, sources
+
+
+def _iter_pairs(counts: np.ndarray) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Yields the pairs (i, j) with i < j <= i + counts[i] of the positions of `counts`, in chunks of about
+    `PAIRS_PER_CHUNK` pairs.
+    """
+    cumulative = np.cumsum(counts)
+    start = 0
+    while start < len(counts):
+        base = cumulative[start - 1] if start else 0
+        stop = max(int(np.searchsorted(cumulative, base + PAIRS_PER_CHUNK, side="right")), start + 1)
+        chunk_counts = counts[start:stop]
+        left = np.repeat(np.arange(start, stop), chunk_counts)
+        # Offset of each pair within the pairs of its left position
+        within = np.arange(len(left)) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+        yield left, left + 1 + within
+        start = stop
+
+
+def duplicate_rows(
+    voc_values: np.ndarray, image_ids: np.ndarray, label_ids: np.ndarray, sources: np.ndarray, iou_threshold: float
+) -> np.ndarray:
+    """rows matching a box of an earlier source of the same image and label with IoU >= `iou_threshold`
+
+    Boxes of the same source are never compared, duplicates within a dataset are left as they are. Only
+    overlapping boxes match, so a zero threshold drops the boxes overlapping an earlier one at all, as the
+    sparse path of large groups does.
+
+    Parameters
+    ----------
+    voc_values : np.ndarray
+        (N, 4) voc boxes
+    image_ids, label_ids, sources : np.ndarray
+        (N,) image, label and source of each row
+
+    Returns
+    -------
+    np.ndarray
+        (N,) boolean mask of the duplicate rows
+    """
+    duplicates = np.zeros(len(voc_values), dtype=bool)
+    if not len(voc_values):
+        return duplicates
+    order = np.lexsort((sources, label_ids, image_ids))
+    group_keys = np.stack([image_ids[order], label_ids[order]], axis=1)
+    is_start = np.concatenate([[True], np.any(group_keys[1:] != group_keys[:-1], axis=1)])
+    group_starts = np.flatnonzero(is_start)
+    group_ends = np.append(group_starts[1:], len(order))
+    sizes = group_ends - group_starts
+    # Groups of boxes of a single source have no pairs to compare
+    sorted_sources = sources[order]
+    mixed = sorted_sources[group_starts] != sorted_sources[group_ends - 1]
+    dense = mixed & (sizes <= MAX_DENSE_GROUP)
+
+    # Every position of a dense group is paired with the following positions of its group
+    group_of = np.repeat(np.arange(len(group_starts)), sizes)
+    counts = np.where(dense[group_of], group_ends[group_of] - np.arange(len(order)) - 1, 0)
+    for left, right in _iter_pairs(counts):
+        rows1, rows2 = order[left], order[right]
+        candidates = sources[rows1] < sources[rows2]
+        rows1, rows2 = rows1[candidates], rows2[candidates]
+        ious = ops.box_iou(voc_values[rows1].astype(float), voc_values[rows2].astype(float))
+        duplicates[rows2[(ious >= iou_threshold) & (ious > 0)]] = True
+
+    for start, end in zip(group_starts[mixed & ~dense], group_ends[mixed & ~dense]):
+        rows = order[start:end]
+        boxes = voc_values[rows].astype(float)
+        pair_rows, pair_cols, _ = ops.sparse_pairwise_iou(boxes, boxes, min_iou=iou_threshold)
+        later = sources[rows[pair_rows]] < sources[rows[pair_cols]]
+        duplicates[rows[pair_cols[later]]] = True
+    return duplicates
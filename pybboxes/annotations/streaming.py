@@ -0,0 +1,394 @@
+"""
+Streaming readers and writers for annotation files. Records are processed one image at a time so that
+a conversion between annotation formats runs in memory bounded by the largest image, not the dataset.
+
+A record is a tuple of ``(image_name, image_size, boxes, labels)`` where ``boxes`` is an array of
+shape (k, 4) holding the box values in the format the record was read from, and ``labels`` is a list of
+``k`` label names. Boxes are float64 unless a :py:mod:`pybboxes.precision` dtype policy is active.
+"""
+import json
+import os
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from pycocotools import mask as mask_utils
+
+from pybboxes import instrumentation, precision
+from pybboxes._typing import AnnotationRecordType
+from pybboxes.functional import convert_bbox, pack_polygons, polygons_to_bbox
+from pybboxes.utils.io import get_image_size
+
+YOLO_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+def record_boxes(boxes: list, bbox_type: str) -> np.ndarray:
+    """boxes of a record as a (k, 4) array in the storage dtype of `bbox_type`"""
+    boxes = np.array(boxes, dtype=float).reshape(-1, 4)
+    return precision.cast(boxes, precision.storage_dtype(bbox_type, boxes))
+
+
+def _convert_boxes(
+    boxes: np.ndarray, from_type: str, to_type: str, image_size: Tuple[int, int]
+) -> List[Tuple[float, float, float, float]]:
+    if from_type == to_type:
+        return np.asarray(boxes).tolist()
+    return [
+        convert_bbox(values, from_type=from_type, to_type=to_type, image_size=image_size)
+        for values in np.asarray(boxes).tolist()
+    ]
+
+
+def _vocabulary(class_names: Optional[List[str]]) -> Tuple[List[str], dict]:
+    class_names = list(class_names) if class_names is not None else []
+    return class_names, {name: id_ for id_, name in enumerate(class_names)}
+
+
+def _label_id(name: str, class_names: List[str], mapping: dict) -> int:
+    if name not in mapping:
+        mapping[name] = len(class_names)
+        class_names.append(name)
+    return mapping[name]
+
+
+def list_yolo_files(labels_dir: str) -> List[str]:
+    """lists yolo label files (excluding the classes file) under the given directory in sorted order"""
+    # if this is classes label, we have to skip as it donot contains bounding boxes data
+    return [
+        os.path.join(labels_dir, filename)
+        for filename in sorted(os.listdir(labels_dir))
+        if filename.endswith(".txt") and "classes" not in filename
+    ]
+
+
+def list_voc_files(labels_dir: str) -> List[str]:
+    """lists pascal voc xml files under the given directory in sorted order"""
+    return [
+        os.path.join(labels_dir, filename) for filename in sorted(os.listdir(labels_dir)) if filename.endswith(".xml")
+    ]
+
+
+def convert_records(
+    records: Iterable[AnnotationRecordType], from_type: str, to_type: str
+) -> Iterator[AnnotationRecordType]:
+    """converts the boxes of each record from `from_type` to `to_type` lazily
+
+    Parameters
+    ----------
+    records : Iterable
+        (image_name, image_size, boxes, labels) records
+    from_type : str
+        format of the boxes in the records
+    to_type : str
+        format of the boxes in the resulting records
+
+    Returns
+    -------
+    Iterator
+        of records whose boxes are in `to_type` format
+    """
+    for image_name, image_size, boxes, labels in records:
+        converted = _convert_boxes(boxes, from_type, to_type, image_size)
+        yield image_name, image_size, record_boxes(converted, to_type), labels
+
+
+def find_yolo_image(images_dir: str, labels_filename: str) -> str:
+    """finds the image file corresponding to a yolo label file
+
+    Parameters
+    ----------
+    images_dir : str
+        directory that houses the images
+    labels_filename : str
+        name of the label file, e.g. `image_0001.txt`
+
+    Returns
+    -------
+    str
+        name of the image file (not the full path)
+
+    Raises
+    ------
+    FileNotFoundError
+        if there is no image with a supported extension for the label file
+    """
+    stem = os.path.splitext(labels_filename)[0]
+    for extension in YOLO_IMAGE_EXTENSIONS:
+        image_name = stem + extension
+        if os.path.exists(os.path.join(images_dir, image_name)):
+            return image_name
+    raise FileNotFoundError(f"{stem}{YOLO_IMAGE_EXTENSIONS[0]} not found in images directory")
+
+
+@instrumentation.timed("read_yolo_file")
+def read_yolo_file(labels_path: str, images_dir: str, class_names: List[str]) -> AnnotationRecordType:
+    """reads a single yolo label file into a record
+
+    Parameters
+    ----------
+    labels_path : str
+        path to the label file
+    images_dir : str
+        directory that houses the images (needed to extract image dimensions)
+    class_names : List[str]
+        class labels listed in classes.txt
+
+    Returns
+    -------
+    tuple
+        (image_name, image_size, boxes, labels) where boxes are in yolo format
+    """
+    image_name = find_yolo_image(images_dir, os.path.basename(labels_path))
+    image_size = get_image_size(os.path.join(images_dir, image_name))
+
+    boxes, labels = [], []
+    with open(labels_path, "r") as f:
+        for line in f:
+            parts = line.strip().split()
+            if not parts:
+                continue
+            labels.append(class_names[int(parts[0])])
+            boxes.append([float(v) for v in parts[1:5]])
+    instrumentation.record_file_read(labels_path)
+    return image_name, image_size, record_boxes(boxes, "yolo"), labels
+
+
+@instrumentation.timed("read_voc_file")
+def read_voc_file(labels_path: str) -> AnnotationRecordType:
+    """reads a single pascal voc xml file into a record
+
+    Parameters
+    ----------
+    labels_path : str
+        path to the xml annotation file
+
+    Returns
+    -------
+    tuple
+        (image_name, image_size, boxes, labels) where boxes are in voc format
+    """
+    root = ET.parse(labels_path).getroot()
+    instrumentation.record_file_read(labels_path)
+
+    image_name = root.find("filename").text
+    size = root.find("size")
+    image_size = int(size.find("width").text), int(size.find("height").text)
+
+    boxes, labels = [], []
+    for obj in root.findall("object"):
+        labels.append(obj.find("name").text)
+        bbox = obj.find("bndbox")
+        boxes.append([float(bbox.find(tag).text) for tag in ("xmin", "ymin", "xmax", "ymax")])
+    return image_name, image_size, record_boxes(boxes, "voc"), labels
+
+
+def segmentation_boxes(coco) -> dict:
+    """computes coco boxes of the annotations of a loaded `pycocotools.coco.COCO` object from their segmentations
+
+    Polygons of all annotations are packed and reduced at once, RLE masks (crowd annotations) are handled by
+    pycocotools. Annotations without a segmentation are left out.
+
+    Parameters
+    ----------
+    coco : COCO
+        loaded coco api object
+
+    Returns
+    -------
+    dict
+        {annotation_id: (x_tl, y_tl, w, h), ...}
+    """
+    polygon_anns, rle_anns = [], []
+    for ann in coco.anns.values():
+        segmentation = ann.get("segmentation")
+        if isinstance(segmentation, list) and any(segmentation):
+            polygon_anns.append(ann)
+        elif isinstance(segmentation, dict):
+            rle_anns.append(ann)
+
+    boxes = {}
+    if polygon_anns:
+        coords, offsets = pack_polygons([ann["segmentation"] for ann in polygon_anns])
+        polygon_boxes = polygons_to_bbox(coords, offsets, bbox_type="coco")
+        boxes.update(zip((ann["id"] for ann in polygon_anns), polygon_boxes.tolist()))
+    if rle_anns:
+        rles = []
+        for ann in rle_anns:
+            segmentation = ann["segmentation"]
+            if isinstance(segmentation["counts"], list):
+                height, width = segmentation["size"]
+                segmentation = mask_utils.frPyObjects(segmentation, height, width)
+            rles.append(segmentation)
+        boxes.update(zip((ann["id"] for ann in rle_anns), mask_utils.toBbox(rles).tolist()))
+    return boxes
+
+
+def iter_coco(coco, boxes_from_segmentations: bool = False) -> Iterator[AnnotationRecordType]:
+    """yields records from a loaded `pycocotools.coco.COCO` object, one image at a time
+
+    Parameters
+    ----------
+    coco : COCO
+        loaded coco api object
+    boxes_from_segmentations : bool
+        recompute the boxes of annotations with a segmentation as the tight box of the segmentation, instead
+        of using their (possibly missing or stale) `bbox`
+
+    Yields
+    ------
+    tuple
+        (image_name, image_size, boxes, labels) where boxes are in coco format
+    """
+    category_names = {category["id"]: category["name"] for category in coco.loadCats(coco.getCatIds())}
+    recomputed = segmentation_boxes(coco) if boxes_from_segmentations else {}
+    for image_id, img in coco.imgs.items():
+        anns = coco.imgToAnns.get(image_id, [])
+        boxes = record_boxes([recomputed.get(ann["id"]) or ann["bbox"] for ann in anns], "coco")
+        labels = [category_names[ann["category_id"]] for ann in anns]
+        yield img["file_name"], (img["width"], img["height"]), boxes, labels
+
+
+@instrumentation.timed("write_yolo")
+def write_yolo(
+    records: Iterable[AnnotationRecordType],
+    export_dir: str,
+    bbox_type: str,
+    class_names: Optional[List[str]] = None,
+) -> List[str]:
+    """writes records in yolo format, one label file per image
+
+    Parameters
+    ----------
+    records : Iterable
+        (image_name, image_size, boxes, labels) records, e.g. from `Annotations.iter_from_voc`
+    export_dir : str
+        path to directory where all the annotation files should be written
+    bbox_type : str
+        format of the boxes in the records
+    class_names : List[str], optional
+        initial class vocabulary, label names not in it are appended as they are encountered
+
+    Returns
+    -------
+    List[str]
+        class vocabulary which is also written to 'classes.txt'
+    """
+    os.makedirs(export_dir, exist_ok=True)
+    class_names, mapping = _vocabulary(class_names)
+
+    for image_name, image_size, boxes, labels in records:
+        filepath = os.path.join(export_dir, f"{os.path.splitext(image_name)[0]}.txt")
+        with open(filepath, mode="a") as f:
+            for yolo_box, label_name in zip(_convert_boxes(boxes, bbox_type, "yolo", image_size), labels):
+                label_id = _label_id(label_name, class_names, mapping)
+                f.write(f"{label_id} {' '.join(f'{x:.4f}' for x in yolo_box)}\n")
+        instrumentation.record_file_written(filepath)
+
+    with open(os.path.join(export_dir, "classes.txt"), "w") as f:
+        for cls in class_names:
+            f.write(f"{cls}\n")
+    instrumentation.record_file_written(os.path.join(export_dir, "classes.txt"))
+    return class_names
+
+
+@instrumentation.timed("write_voc")
+def write_voc(records: Iterable[AnnotationRecordType], export_dir: str, bbox_type: str, n_channels: int = 3) -> None:
+    """writes records in voc format, one xml file per image
+
+    Parameters
+    ----------
+    records : Iterable
+        (image_name, image_size, boxes, labels) records, e.g. from `Annotations.iter_from_coco`
+    export_dir : str
+        path to directory where all the annotation files should be written
+    bbox_type : str
+        format of the boxes in the records
+    n_channels : int
+        image depth written to the `size` element
+    """
+    os.makedirs(export_dir, exist_ok=True)
+    for image_name, image_size, boxes, labels in records:
+        filepath = os.path.join(export_dir, os.path.splitext(image_name)[0] + ".xml")
+
+        root = ET.Element("annotation")
+        ET.SubElement(root, "filename").text = image_name
+        size = ET.SubElement(root, "size")
+        ET.SubElement(size, "width").text = str(image_size[0])
+        ET.SubElement(size, "height").text = str(image_size[1])
+        ET.SubElement(size, "depth").text = str(n_channels)
+
+        for voc_box, label_name in zip(_convert_boxes(boxes, bbox_type, "voc", image_size), labels):
+            obj = ET.SubElement(root, "object")
+            ET.SubElement(obj, "name").text = label_name
+            ET.SubElement(obj, "pose").text = "Unspecified"
+            ET.SubElement(obj, "truncated").text = "0"
+            ET.SubElement(obj, "difficult").text = "0"
+
+            bbox = ET.SubElement(obj, "bndbox")
+            for tag, value in zip(("xmin", "ymin", "xmax", "ymax"), voc_box):
+                ET.SubElement(bbox, tag).text = str(int(value))
+
+        ET.ElementTree(root).write(filepath)
+        instrumentation.record_file_written(filepath)
+
+
+@instrumentation.timed("write_coco")
+def write_coco(
+    records: Iterable[AnnotationRecordType],
+    export_file: str,
+    bbox_type: str,
+    class_names: Optional[List[str]] = None,
+) -> List[str]:
+    """writes records to a coco annotation file (json format)
+
+    Annotations are streamed to the output file as they arrive and image entries are spooled to a
+    temporary file, so memory use does not grow with the number of records.
+
+    Parameters
+    ----------
+    records : Iterable
+        (image_name, image_size, boxes, labels) records, e.g. from `Annotations.iter_from_yolo`
+    export_file : str
+        name (or path) for the annotation file
+    bbox_type : str
+        format of the boxes in the records
+    class_names : List[str], optional
+        initial class vocabulary, label names not in it are appended as they are encountered
+
+    Returns
+    -------
+    List[str]
+        class vocabulary, category ids are the indices in this list
+    """
+    class_names, mapping = _vocabulary(class_names)
+
+    ann_id = 0
+    with open(export_file, "w", encoding="utf-8") as f, tempfile.TemporaryFile("w+", encoding="utf-8") as images:
+        f.write('{"annotations": [')
+        for image_id, (image_name, image_size, boxes, labels) in enumerate(records):
+            width, height = image_size
+            images.write(", " if image_id else "")
+            json.dump({"id": image_id, "file_name": image_name, "width": width, "height": height}, images)
+
+            for coco_box, label_name in zip(_convert_boxes(boxes, bbox_type, "coco", image_size), labels):
+                annotation = {
+                    "id": ann_id,
+                    "image_id": image_id,
+                    "category_id": _label_id(label_name, class_names, mapping),
+                    "bbox": list(coco_box),
+                    "area": coco_box[2] * coco_box[3],
+                    "iscrowd": 0,
+                }
+                f.write(", " if ann_id else "")
+                json.dump(annotation, f)
+                ann_id += 1
+
+        f.write('], "images": [')
+        images.seek(0)
+        shutil.copyfileobj(images, f)
+        categories = [{"id": i, "name": name, "supercategory": "none"} for i, name in enumerate(class_names)]
+        f.write(f'], "categories": {json.dumps(categories)}}}')
+    instrumentation.record_file_written(export_file)
+    return class_names
@@ -0,0 +1,374 @@
+"""
+Columnar storage of :py:class:`pybboxes.annotations.Annotations`. All boxes of a dataset are held in a single
+(N, 4) array with one row per box, next to per-row label ids, image ids and annotation ids. Rows of an image are
+contiguous and images keep their insertion order, so the boxes of an image are a slice (a view) of the columns.
+Label and area queries go through an :py:class:`pybboxes.annotations.index.AnnotationIndex`, built on first use and
+carried over to the tables derived with `concat` and `remove`. Box values and the cached voc boxes are read-only,
+so the derived columns cannot go stale; changes make a new table.
+"""
+import itertools
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from pybboxes import ops, precision
+from pybboxes._typing import AnnotationRecordType
+from pybboxes.annotations.index import AnnotationIndex
+from pybboxes.interop import ArrayInterop, read_only
+
+
+class AnnotationTable(ArrayInterop):
+    """columnar annotations of a single box format
+
+    Parameters
+    ----------
+    bbox_type : str
+        format of the box values, the annotation type of the owning `Annotations`
+    values : np.ndarray
+        (N, 4) box values in `bbox_type`, as loaded (not rounded), held as a read-only view
+    label_ids : np.ndarray
+        (N,) label ids
+    image_ids : np.ndarray
+        (N,) index of the image of each row into `image_names` and `image_sizes`, rows of an image must be
+        contiguous
+    image_names : Sequence[str]
+        (I,) image names
+    image_sizes : np.ndarray
+        (I, 2) image sizes as (w, h)
+    annotation_ids : np.ndarray, optional
+        (N,) annotation ids, -1 where unknown
+    """
+
+    def __init__(
+        self,
+        bbox_type: str,
+        values: np.ndarray,
+        label_ids: np.ndarray,
+        image_ids: np.ndarray,
+        image_names: Sequence[str],
+        image_sizes: np.ndarray,
+        annotation_ids: Optional[np.ndarray] = None,
+    ):
+        ops._check_bbox_type(bbox_type)
+        values = np.asarray(values).reshape(-1, 4)
+        self.bbox_type = bbox_type
+        self.values = read_only(precision.cast(values, precision.storage_dtype(bbox_type, values)))
+        # Columns the index and the image offsets are derived from are read-only like the values
+        self.label_ids = read_only(np.asarray(label_ids, dtype=np.int64))
+        self.image_ids = read_only(np.asarray(image_ids, dtype=np.int64))
+        self.image_names = list(image_names)
+        self.image_sizes = np.asarray(image_sizes, dtype=np.int64).reshape(-1, 2)
+        if annotation_ids is None:
+            annotation_ids = np.full(len(values), -1, dtype=np.int64)
+        self.annotation_ids = np.asarray(annotation_ids, dtype=np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(self.image_ids, minlength=len(self.image_names)))])
+        self._voc_values = None
+        self._index: Optional[AnnotationIndex] = None
+        self._image_lookup: Optional[dict] = None
+
+    @classmethod
+    def empty(cls, bbox_type: str) -> "AnnotationTable":
+        return cls(bbox_type, np.empty((0, 4)), [], [], [], np.empty((0, 2)))
+
+    @classmethod
+    def from_records(
+        cls,
+        bbox_type: str,
+        records: Iterable[AnnotationRecordType],
+        label_mapping: dict,
+        annotation_ids: Optional[Iterable[Sequence[int]]] = None,
+    ) -> "AnnotationTable":
+        """builds a table from (image_name, image_size, boxes, labels) records with boxes in `bbox_type`
+
+        Images without boxes are left out. Records of the same image name are merged.
+
+        Parameters
+        ----------
+        bbox_type : str
+            format of the boxes of the records
+        records : Iterable
+            (image_name, image_size, boxes, labels) records
+        label_mapping : dict
+            {label_name: label_id, ...} covering all labels of the records
+        annotation_ids : Iterable, optional
+            annotation ids of the boxes of each record
+
+        Returns
+        -------
+        AnnotationTable
+        """
+        image_index, image_names, image_sizes = {}, [], []
+        image_ids, boxes, labels, ids = [], [], [], []
+        annotation_ids = iter(annotation_ids) if annotation_ids is not None else itertools.repeat(None)
+        for (image_name, image_size, record_boxes, record_labels), record_ids in zip(records, annotation_ids):
+            if len(record_labels) == 0:
+                continue
+            if image_name not in image_index:
+                image_index[image_name] = len(image_names)
+                image_names.append(image_name)
+                image_sizes.append(image_size)
+            image_ids.append(np.full(len(record_labels), image_index[image_name], dtype=np.int64))
+            boxes.append(np.asarray(record_boxes, dtype=float).reshape(-1, 4))
+            labels.append(record_labels)
+            ids.append(record_ids if record_ids is not None else np.full(len(record_labels), -1))
+        if not boxes:
+            return cls.empty(bbox_type)
+        num_boxes = sum(len(record_labels) for record_labels in labels)
+        label_ids = np.fromiter(
+            (label_mapping[label] for label in itertools.chain.from_iterable(labels)), dtype=np.int64, count=num_boxes
+        )
+        return cls.from_rows(
+            bbox_type,
+            np.concatenate(boxes),
+            label_ids,
+            np.concatenate(image_ids),
+            image_names,
+            image_sizes,
+            np.concatenate(ids),
+        )
+
+    @classmethod
+    def from_rows(
+        cls,
+        bbox_type: str,
+        values: np.ndarray,
+        label_ids: np.ndarray,
+        image_ids: np.ndarray,
+        image_names: Sequence[str],
+        image_sizes: np.ndarray,
+        annotation_ids: Optional[np.ndarray] = None,
+    ) -> "AnnotationTable":
+        """same as the constructor, but rows are (stably) grouped by image first if they are not contiguous"""
+        image_ids = np.asarray(image_ids, dtype=np.int64)
+        if np.any(image_ids[1:] < image_ids[:-1]):
+            order = np.argsort(image_ids, kind="stable")
+            values, label_ids, image_ids = np.asarray(values)[order], np.asarray(label_ids)[order], image_ids[order]
+            annotation_ids = np.asarray(annotation_ids)[order] if annotation_ids is not None else None
+        return cls(bbox_type, values, label_ids, image_ids, image_names, image_sizes, annotation_ids)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self):
+        return f"<AnnotationTable {self.bbox_type} ({len(self)} boxes, {self.num_images} images)>"
+
+    @property
+    def num_images(self) -> int:
+        return len(self.image_names)
+
+    def image_rows(self, image_id: int) -> slice:
+        """rows of the image at `image_id`"""
+        return slice(int(self.offsets[image_id]), int(self.offsets[image_id + 1]))
+
+    @property
+    def image_lookup(self) -> dict:
+        """{image_name: image_id, ...} (cached)"""
+        if self._image_lookup is None:
+            self._image_lookup = {name: i for i, name in enumerate(self.image_names)}
+        return self._image_lookup
+
+    @property
+    def areas(self) -> np.ndarray:
+        """(N,) box areas in pixels of the voc boxes of `to_voc_array`"""
+        return ops.box_area(self.to_voc_array())
+
+    @property
+    def index(self) -> AnnotationIndex:
+        """label and area index of the rows (built on first access)"""
+        if self._index is None:
+            self._index = AnnotationIndex.build(self.label_ids, self.areas)
+        return self._index
+
+    @property
+    def row_image_sizes(self) -> np.ndarray:
+        """(N, 2) image size of each row"""
+        return self.image_sizes[self.image_ids]
+
+    def to_voc_array(self) -> np.ndarray:
+        """
+        (N, 4) voc boxes rounded as `to_voc` of the box classes, in the storage dtype of the policy (cached,
+        read-only)
+        """
+        if self._voc_values is None:
+            sizes = self.row_image_sizes if self.bbox_type in ("albumentations", "fiftyone", "yolo") else None
+            voc_values = ops.to_voc_array(self.values, self.bbox_type, sizes)
+            self._voc_values = read_only(precision.cast(voc_values, precision.storage_dtype("voc", voc_values)))
+        return self._voc_values
+
+    def convert(self, bbox_type: str) -> "AnnotationTable":
+        """table with the boxes converted to `bbox_type` from the rounded voc boxes, this table if of `bbox_type`"""
+        if bbox_type == self.bbox_type:
+            return self
+        values = ops.from_voc_array(self.to_voc_array(), bbox_type, self.row_image_sizes)
+        values = precision.cast(values, precision.storage_dtype(bbox_type, values))
+        table = AnnotationTable(
+            bbox_type, values, self.label_ids, self.image_ids, self.image_names, self.image_sizes, self.annotation_ids
+        )
+        table._voc_values, table._index, table._image_lookup = self._voc_values, self._index, self._image_lookup
+        return table
+
+    def validate(self, strict: bool = False) -> None:
+        """raises ValueError for malformed boxes, and for out of bounds boxes if `strict` is True"""
+        ops.validate_voc_array(self.to_voc_array(), self.row_image_sizes, strict=strict)
+
+    def concat(self, other: "AnnotationTable", label_remap: Optional[np.ndarray] = None) -> "AnnotationTable":
+        """appends the rows of `other`, joining images by name
+
+        Rows of images present in both tables are appended to the rows of the image in this table, the image
+        size of this table is kept. The index of this table is updated with the rows of `other` if they are all
+        of new images, otherwise it is rebuilt on the next access.
+
+        Parameters
+        ----------
+        other : AnnotationTable
+            table of the same box format
+        label_remap : np.ndarray, optional
+            maps label ids of `other` to label ids of this table
+
+        Returns
+        -------
+        AnnotationTable
+        """
+        if other.bbox_type != self.bbox_type:
+            raise ValueError(f"Cannot concatenate {other.bbox_type} annotations to {self.bbox_type} annotations.")
+        image_names, image_index = list(self.image_names), dict(self.image_lookup)
+        new_sizes = []
+        image_remap = np.empty(other.num_images, dtype=np.int64)
+        for i, (name, size) in enumerate(zip(other.image_names, other.image_sizes)):
+            if name not in image_index:
+                image_index[name] = len(image_names)
+                image_names.append(name)
+                new_sizes.append(size)
+            image_remap[i] = image_index[name]
+        label_ids = other.label_ids if label_remap is None else np.asarray(label_remap)[other.label_ids]
+        table = AnnotationTable.from_rows(
+            self.bbox_type,
+            np.concatenate([self.values, other.values.astype(self.values.dtype, copy=False)]),
+            np.concatenate([self.label_ids, label_ids]),
+            np.concatenate([self.image_ids, image_remap[other.image_ids]]),
+            image_names,
+            np.concatenate([self.image_sizes, np.reshape(new_sizes, (-1, 2))]),
+            np.concatenate([self.annotation_ids, other.annotation_ids]),
+        )
+        table._image_lookup = image_index
+        if not np.any(image_remap < self.num_images):
+            # Rows of new images only, which are appended as they are, so derived columns carry over
+            if self._voc_values is not None:
+                table._voc_values = read_only(np.concatenate([self._voc_values, other.to_voc_array()]))
+            if self._index is not None:
+                table._index = self._index.append(label_ids, other.areas)
+        return table
+
+    def remove(self, rows) -> "AnnotationTable":
+        """table without the given rows (indices, slice or boolean mask), images left without rows are dropped"""
+        keep = np.ones(len(self), dtype=bool)
+        keep[rows] = False
+        return self._select(keep)
+
+    def take(self, rows) -> "AnnotationTable":
+        """table of the given rows (indices, slice or boolean mask) in table order, images without rows are dropped"""
+        keep = np.zeros(len(self), dtype=bool)
+        keep[rows] = True
+        return self._select(keep)
+
+    def query(
+        self,
+        rows: Optional[np.ndarray] = None,
+        label_ids: Optional[Sequence[int]] = None,
+        area_min: Optional[float] = None,
+        area_max: Optional[float] = None,
+        aspect_min: Optional[float] = None,
+        aspect_max: Optional[float] = None,
+        oob: Optional[bool] = None,
+    ) -> np.ndarray:
+        """rows matching all given predicates, each evaluated as a mask over the columns
+
+        Parameters
+        ----------
+        rows : np.ndarray, optional
+            ascending rows to select from, all rows by default
+        label_ids : Sequence[int], optional
+            keep boxes of these labels, taken from the index if it is built
+        area_min, area_max : float, optional
+            inclusive bounds of the box area in pixels
+        aspect_min, aspect_max : float, optional
+            inclusive bounds of the aspect ratio (w / h)
+        oob : bool, optional
+            keep only out of bounds boxes if True, only boxes within the image if False
+
+        Returns
+        -------
+        np.ndarray
+            ascending rows
+        """
+        if label_ids is not None:
+            label_ids = np.unique(np.asarray(label_ids, dtype=np.int64))
+            if rows is None and self._index is not None:
+                # O(k log k) in the rows of the labels instead of a pass over the table
+                rows = np.sort(np.concatenate([self._index.label_rows(label_id) for label_id in label_ids] + [[]]))
+                rows, label_ids = rows.astype(np.int64), None
+
+        def column(values: np.ndarray) -> np.ndarray:
+            return values if rows is None else values[rows]
+
+        mask = np.ones(len(self) if rows is None else len(rows), dtype=bool)
+        if label_ids is not None:
+            mask &= np.isin(column(self.label_ids), label_ids)
+        if {area_min, area_max, aspect_min, aspect_max, oob} != {None}:
+            x_tl, y_tl, x_br, y_br = column(self.to_voc_array()).T
+            width, height = x_br - x_tl, y_br - y_tl
+            if area_min is not None or area_max is not None:
+                mask &= _in_range(width * height, area_min, area_max)
+            if aspect_min is not None or aspect_max is not None:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    mask &= _in_range(width / height, aspect_min, aspect_max)
+            if oob is not None:
+                image_width, image_height = column(self.row_image_sizes).T
+                is_oob = (x_tl < 0) | (y_tl < 0) | (x_br > image_width) | (y_br > image_height)
+                mask &= is_oob if oob else ~is_oob
+        return np.flatnonzero(mask) if rows is None else rows[mask]
+
+    def _select(self, keep: np.ndarray) -> "AnnotationTable":
+        image_counts = np.bincount(self.image_ids[keep], minlength=self.num_images)
+        kept_images = np.flatnonzero(image_counts)
+        image_remap = np.cumsum(image_counts > 0) - 1
+        table = AnnotationTable(
+            self.bbox_type,
+            self.values[keep],
+            self.label_ids[keep],
+            image_remap[self.image_ids[keep]],
+            [self.image_names[i] for i in kept_images],
+            self.image_sizes[kept_images],
+            self.annotation_ids[keep],
+        )
+        if self._voc_values is not None:
+            table._voc_values = read_only(self._voc_values[keep])
+        if self._index is not None:
+            table._index = self._index.remove(keep)
+        return table
+
+    def iter_records(self, class_names: List[str], voc: bool = True) -> Iterable[AnnotationRecordType]:
+        """yields (image_name, image_size, boxes, labels) records, boxes are views of the columns
+
+        Parameters
+        ----------
+        class_names : List[str]
+            label names by label id
+        voc : bool
+            yield voc boxes (default) instead of the stored values
+        """
+        values = self.to_voc_array() if voc else self.values
+        names = np.array(class_names, dtype=object)
+        for image_id, image_name in enumerate(self.image_names):
+            rows = self.image_rows(image_id)
+            image_size = tuple(self.image_sizes[image_id].tolist())
+            yield image_name, image_size, values[rows], names[self.label_ids[rows]].tolist()
+
+
+def _in_range(values: np.ndarray, minimum: Optional[float], maximum: Optional[float]) -> np.ndarray:
+    mask = np.ones(len(values), dtype=bool)
+    if minimum is not None:
+        mask &= values >= minimum
+    if maximum is not None:
+        mask &= values <= maximum
+    return mask
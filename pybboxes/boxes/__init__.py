@@ -1,6 +1,12 @@
 from pybboxes.boxes.albumentations_bounding_box import AlbumentationsBoundingBox
 from pybboxes.boxes.bbox import BoundingBox
+from pybboxes.boxes.bbox_3d import BoundingBox3D, CenterBoundingBox3D
+from pybboxes.boxes.box_array import BoxArray
+from pybboxes.boxes.box_array_3d import BoxArray3D
+from pybboxes.boxes.chunked_box_array import ChunkedBoxArray
 from pybboxes.boxes.coco_bounding_box import CocoBoundingBox
 from pybboxes.boxes.fiftyone_bounding_box import FiftyoneBoundingBox
+from pybboxes.boxes.rotated_bounding_box import RotatedBoundingBox
+from pybboxes.boxes.rotated_box_array import RotatedBoxArray
 from pybboxes.boxes.voc_bounding_box import VocBoundingBox
 from pybboxes.boxes.yolo_bounding_box import YoloBoundingBox
@@ -3,6 +3,7 @@ from typing import List, Tuple, Union
 
 import numpy as np
 
+from pybboxes import cache, instrumentation
 from pybboxes.types.box_2d import Box
 
 NORMALIZED_BOXES = ["albumentations", "fiftyone", "yolo"]
@@ -18,11 +19,13 @@ class BaseBoundingBox(Box, ABC):
         image_size: Tuple[int, int] = None,
         strict: bool = False,
     ):
+        instrumentation.record_construction(self)
         self._image_size = image_size
         self.strict = strict
         self._is_oob = None
         self._validate_and_set_values(v1, v2, v3, v4)
-        voc_values = self.to_voc(return_values=True)
+        # constructing a box is not a conversion, it bypasses the conversion cache
+        voc_values = cache.uncached(type(self).to_voc)(self, return_values=True)
         super(BaseBoundingBox, self).__init__(*voc_values)
 
     def __repr__(self):
@@ -82,12 +85,15 @@ class BaseBoundingBox(Box, ABC):
         self._validate_values(*values)
         self._set_values(*values)
 
+    @cache.cached_conversion("albumentations")
     def to_albumentations(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self.to_voc().to_albumentations(return_values)
 
+    @cache.cached_conversion("coco")
     def to_coco(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self.to_voc().to_coco(return_values)
 
+    @cache.cached_conversion("fiftyone")
     def to_fiftyone(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self.to_voc().to_fiftyone(return_values)
 
@@ -95,6 +101,7 @@ class BaseBoundingBox(Box, ABC):
     def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         pass
 
+    @cache.cached_conversion("yolo")
     def to_yolo(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self.to_voc().to_yolo(return_values)
 
@@ -3,9 +3,11 @@ from typing import Tuple, Union
 
 from numpy import sqrt
 
+from pybboxes import cache, instrumentation
 from pybboxes.boxes.base import BaseBoundingBox
 
 
+@instrumentation.timed("load_bbox")
 def load_bbox(
     name: str, values, image_size: Tuple[int, int] = None, return_values: bool = False, from_voc: bool = False, **kwargs
 ) -> BaseBoundingBox:
@@ -108,20 +110,25 @@ class BoundingBox(BaseBoundingBox):
             strict=self.strict,
         )
 
+    @cache.cached_conversion("albumentations")
     def to_albumentations(
         self, return_values: bool = False, **kwargs
     ) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self._to_bbox_type("albumentations", return_values, **kwargs)
 
+    @cache.cached_conversion("coco")
     def to_coco(self, return_values: bool = False, **kwargs) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self._to_bbox_type("coco", return_values, **kwargs)
 
+    @cache.cached_conversion("fiftyone")
     def to_fiftyone(self, return_values: bool = False, **kwargs) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self._to_bbox_type("fiftyone", return_values, **kwargs)
 
+    @cache.cached_conversion("voc")
     def to_voc(self, return_values: bool = False, **kwargs) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self._to_bbox_type("voc", return_values, **kwargs)
 
+    @cache.cached_conversion("yolo")
     def to_yolo(self, return_values: bool = False, **kwargs) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         return self._to_bbox_type("yolo", return_values, **kwargs)
 
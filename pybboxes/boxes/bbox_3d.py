@@ -0,0 +1,138 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from pybboxes.types.box_3d import Box3D
+
+BOX_3D_TYPES = ("corners", "center")
+
+
+class BaseBoundingBox3D(Box3D, ABC):
+    name: str = None
+
+    def __init__(self, v1: float, v2: float, v3: float, v4: float, v5: float, v6: float):
+        self._validate_values(v1, v2, v3, v4, v5, v6)
+        self._values = (v1, v2, v3, v4, v5, v6)
+        super(BaseBoundingBox3D, self).__init__(*self.to_corners(return_values=True))
+
+    def __repr__(self):
+        str_vals = " ".join(f"{v:.4f}" for v in self.values)
+        size_x, size_y, size_z = self.size
+        return f"<[{str_vals}] ({size_x:.4f}x{size_y:.4f}x{size_z:.4f})>"
+
+    @property
+    def values(self) -> Tuple:
+        return self._values
+
+    @abstractmethod
+    def _validate_values(self, *values):
+        pass
+
+    @abstractmethod
+    def to_corners(self, return_values: bool = False) -> Union[Tuple, "BoundingBox3D"]:
+        pass
+
+    def to_center(self, return_values: bool = False) -> Union[Tuple, "CenterBoundingBox3D"]:
+        return CenterBoundingBox3D.from_corners(*self.to_corners(return_values=True), return_values=return_values)
+
+    @classmethod
+    @abstractmethod
+    def from_corners(
+        cls, x_min: float, y_min: float, z_min: float, x_max: float, y_max: float, z_max: float
+    ) -> "BaseBoundingBox3D":
+        pass
+
+    @classmethod
+    def from_array(cls, ar: Union[Tuple, List, np.ndarray]) -> Union[np.ndarray, "BaseBoundingBox3D"]:
+        """
+        Takes input values containing at least a single box values, the last dimension (-1) must have length
+        of 6. See :py:meth:`pybboxes.BoundingBox.from_array`.
+        """
+        ar = np.asarray(ar, dtype=float)
+        if ar.shape[-1] != 6:
+            raise ValueError(f"Given input array must have 3D box values at dim -1 as 6, got shape {ar.shape}.")
+        if ar.ndim == 1:
+            return cls(*ar.tolist())
+        return np.vectorize(cls.from_array, signature="(n) -> ()")(ar)
+
+
+class BoundingBox3D(BaseBoundingBox3D):
+    """
+    3D box as its corners (x-min, y-min, z-min, x-max, y-max, z-max), the 3D counterpart of VOC.
+    """
+
+    name = "corners"
+
+    def _validate_values(self, x_min, y_min, z_min, x_max, y_max, z_max):
+        if x_min > x_max or y_min > y_max or z_min > z_max:
+            raise ValueError(
+                "Incorrect BoundingBox3D format. Must be in type [x-min, y-min, z-min, x-max, y-max, z-max]."
+            )
+
+    def to_corners(self, return_values: bool = False) -> Union[Tuple, "BoundingBox3D"]:
+        if return_values:
+            return self.values
+        return BoundingBox3D(*self.values)
+
+    @classmethod
+    def from_corners(
+        cls, x_min: float, y_min: float, z_min: float, x_max: float, y_max: float, z_max: float
+    ) -> "BoundingBox3D":
+        return cls(x_min, y_min, z_min, x_max, y_max, z_max)
+
+    @classmethod
+    def from_center(
+        cls, x_c: float, y_c: float, z_c: float, size_x: float, size_y: float, size_z: float
+    ) -> "BoundingBox3D":
+        return CenterBoundingBox3D(x_c, y_c, z_c, size_x, size_y, size_z).to_corners()
+
+
+class CenterBoundingBox3D(BaseBoundingBox3D):
+    """
+    3D box as its center and extents along the axes (x-c, y-c, z-c, size-x, size-y, size-z), e.g. the
+    (x, y, z, l, w, h) boxes of LiDAR datasets without heading.
+    """
+
+    name = "center"
+
+    def _validate_values(self, x_c, y_c, z_c, size_x, size_y, size_z):
+        if size_x < 0 or size_y < 0 or size_z < 0:
+            raise ValueError("Given sizes must be non-negative.")
+
+    def to_corners(self, return_values: bool = False) -> Union[Tuple, "BoundingBox3D"]:
+        x_c, y_c, z_c, size_x, size_y, size_z = self.values
+        corners = (
+            x_c - size_x / 2,
+            y_c - size_y / 2,
+            z_c - size_z / 2,
+            x_c + size_x / 2,
+            y_c + size_y / 2,
+            z_c + size_z / 2,
+        )
+        if return_values:
+            return corners
+        return BoundingBox3D(*corners)
+
+    @classmethod
+    def from_corners(
+        cls,
+        x_min: float,
+        y_min: float,
+        z_min: float,
+        x_max: float,
+        y_max: float,
+        z_max: float,
+        return_values: bool = False,
+    ) -> Union[Tuple, "CenterBoundingBox3D"]:
+        values = (
+            (x_min + x_max) / 2,
+            (y_min + y_max) / 2,
+            (z_min + z_max) / 2,
+            x_max - x_min,
+            y_max - y_min,
+            z_max - z_min,
+        )
+        if return_values:
+            return values
+        return cls(*values)
@@ -0,0 +1,147 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from pybboxes import ops, precision
+from pybboxes.boxes.base import NORMALIZED_BOXES
+from pybboxes.interop import ArrayInterop, from_dlpack
+
+
+class BoxArray(ArrayInterop):
+    """
+    Array of N boxes of the same format on the same image, the batch counterpart of the box classes. Values
+    are held in a single (N, 4) array. Floating values are not rounded, so subpixel coordinates (e.g. of
+    predictions or of transformed boxes) are kept.
+
+    The array keeps the dtype of floating values and stores anything else as float64, unless `dtype` or a
+    :py:mod:`pybboxes.precision` policy is given. Computations run in float, see
+    :py:func:`pybboxes.precision.compute_dtype`. The values are shared with NumPy and DLPack consumers without a
+    copy, see :py:mod:`pybboxes.interop`.
+
+    Args:
+        values: (array-like) Boxes of shape (N, 4) in `bbox_type`.
+        bbox_type: (str) Format of the boxes. It's 'voc' [x-tl, y-tl, x-br, y-br] by default.
+        image_size: (tuple(int,int)) Image size as (w, h), required for the normalized formats.
+        dtype: (dtype) Storage dtype, values are rounded half to even for integer dtypes.
+    """
+
+    def __init__(
+        self,
+        values,
+        bbox_type: str = "voc",
+        image_size: Optional[Tuple[int, int]] = None,
+        dtype: Optional[np.dtype] = None,
+    ):
+        ops._check_bbox_type(bbox_type)
+        if bbox_type in NORMALIZED_BOXES and image_size is None:
+            raise ValueError(f"'image_size' is required for {bbox_type} boxes.")
+        values = np.asarray(values)
+        if values.shape[-1:] != (4,):
+            raise ValueError(
+                f"Given input array must have bounding box values at dim -1 as 4, got shape {values.shape}."
+            )
+        self.values = precision.cast(values, precision.storage_dtype(bbox_type, values, dtype)).reshape(-1, 4)
+        self.name = bbox_type
+        self.image_size = tuple(image_size) if image_size is not None else None
+
+    @classmethod
+    def from_voc(
+        cls,
+        boxes,
+        bbox_type: str = "voc",
+        image_size: Optional[Tuple[int, int]] = None,
+        dtype: Optional[np.dtype] = None,
+        threads: Optional[int] = None,
+    ) -> "BoxArray":
+        """
+        Creates a box array of `bbox_type` from VOC boxes, stored in `dtype` as the constructor resolves it for
+        the VOC boxes. The conversion runs on `threads` threads, see :py:mod:`pybboxes.parallel`.
+        """
+        dtype = precision.storage_dtype(bbox_type, boxes, dtype)
+        values = ops.from_voc_array(boxes, bbox_type, image_size, round_values=False, dtype=dtype, threads=threads)
+        return cls(values, bbox_type, image_size, dtype)
+
+    @classmethod
+    def from_dlpack(
+        cls,
+        x,
+        bbox_type: str = "voc",
+        image_size: Optional[Tuple[int, int]] = None,
+        dtype: Optional[np.dtype] = None,
+    ) -> "BoxArray":
+        """
+        Creates a box array sharing memory with `x`, a CPU array or tensor implementing `__dlpack__`, unless a
+        cast to the storage dtype is needed.
+        """
+        return cls(from_dlpack(x), bbox_type, image_size, dtype)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> "BoxArray":
+        return BoxArray(self.values[index], self.name, self.image_size, self.values.dtype)
+
+    def __repr__(self):
+        image_width, image_height = self.image_size or (None, None)
+        return f"<BoxArray {self.name} ({len(self)} boxes) | Image: ({image_width or '?'}x{image_height or '?'})>"
+
+    def to_voc_array(self, threads: Optional[int] = None) -> np.ndarray:
+        """
+        VOC boxes in the compute dtype of the values.
+        """
+        return ops.to_voc_array(self.values, self.name, self.image_size, round_values=False, threads=threads)
+
+    def convert(
+        self,
+        to_type: str,
+        image_size: Optional[Tuple[int, int]] = None,
+        dtype: Optional[np.dtype] = None,
+        threads: Optional[int] = None,
+    ) -> "BoxArray":
+        """
+        Converts the boxes to `to_type`, `image_size` overrides the image size of the array. The result keeps
+        the dtype of the array if valid for `to_type`, unless `dtype` or a policy is given. Row chunks are
+        converted on `threads` threads, the default of :py:mod:`pybboxes.parallel` if None.
+        """
+        image_size = image_size if image_size is not None else self.image_size
+        dtype = precision.storage_dtype(to_type, self.values, dtype, keep_integer=True)
+        return BoxArray.from_voc(self.to_voc_array(threads), to_type, image_size, dtype, threads)
+
+    @property
+    def area(self) -> np.ndarray:
+        """
+        Areas of the boxes in pixels.
+        """
+        return ops.box_area(self.to_voc_array())
+
+    @property
+    def is_oob(self) -> Optional[np.ndarray]:
+        """
+        Whether each box is OOB (Out-of-bounds), None if the image size is unknown.
+        """
+        if self.image_size is None:
+            return None
+        x_tl, y_tl, x_br, y_br = self.to_voc_array().T
+        image_width, image_height = self.image_size
+        return (x_tl < 0) | (y_tl < 0) | (x_br > image_width) | (y_br > image_height)
+
+    def clamp(self, threads: Optional[int] = None) -> "BoxArray":
+        """
+        Clamps the boxes to the image borders as `clamp` of the box classes, returns a new array. Row chunks are
+        clamped on `threads` threads, the default of :py:mod:`pybboxes.parallel` if None.
+        """
+        if self.image_size is None:
+            return self
+        clamped = ops.box_clamp(self.to_voc_array(threads), self.image_size, threads)
+        return BoxArray.from_voc(clamped, self.name, self.image_size, self.values.dtype, threads)
+
+    def shift(self, amount: Tuple) -> "BoxArray":
+        """
+        Shifts the boxes by `amount` (dx, dy) as `shift` of the box classes, relative to the image size for the
+        normalized formats. Returns a new array.
+        """
+        if self.name in NORMALIZED_BOXES:
+            width, height = self.image_size
+            amount = (amount[0] * width, amount[1] * height)
+        shifted = ops.box_shift(self.to_voc_array(), amount)
+        return BoxArray.from_voc(shifted, self.name, self.image_size, self.values.dtype)
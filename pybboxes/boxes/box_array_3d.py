@@ -0,0 +1,84 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from pybboxes import ops, precision
+from pybboxes.boxes.bbox_3d import BOX_3D_TYPES
+from pybboxes.interop import ArrayInterop, from_dlpack
+
+
+class BoxArray3D(ArrayInterop):
+    """
+    Array of N axis-aligned 3D boxes of the same format, the batch counterpart of the 3D box classes. Values are
+    held in a single (N, 6) float array, shared with NumPy and DLPack consumers without a copy.
+
+    Args:
+        values: (array-like) Boxes of shape (N, 6) in `bbox_type`.
+        bbox_type: (str) 'corners' (x-min, y-min, z-min, x-max, y-max, z-max) by default, or 'center'
+            (x-c, y-c, z-c, size-x, size-y, size-z).
+    """
+
+    def __init__(self, values, bbox_type: str = "corners"):
+        if bbox_type not in BOX_3D_TYPES:
+            raise ValueError(f"Unsupported 3D bbox type '{bbox_type}', expected one of {BOX_3D_TYPES}.")
+        values = np.asarray(values)
+        values = values.astype(precision.compute_dtype(values), copy=False)
+        if values.shape[-1:] != (6,):
+            raise ValueError(f"Given input array must have 3D box values at dim -1 as 6, got shape {values.shape}.")
+        self.values = values.reshape(-1, 6)
+        self.name = bbox_type
+
+    @classmethod
+    def from_dlpack(cls, x, bbox_type: str = "corners") -> "BoxArray3D":
+        """
+        Creates a box array sharing memory with `x`, a CPU array or tensor of float32 or float64 values
+        implementing `__dlpack__`.
+        """
+        return cls(from_dlpack(x), bbox_type)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> "BoxArray3D":
+        return BoxArray3D(self.values[index], self.name)
+
+    def __repr__(self):
+        return f"<BoxArray3D {self.name} ({len(self)} boxes)>"
+
+    def to_corners_array(self) -> np.ndarray:
+        return ops.to_corners_array(self.values, self.name)
+
+    def convert(self, to_type: str) -> "BoxArray3D":
+        return BoxArray3D(ops.from_corners_array(self.to_corners_array(), to_type), to_type)
+
+    @property
+    def volume(self) -> np.ndarray:
+        return ops.box3d_volume(self.to_corners_array())
+
+    def intersection(self, other: "BoxArray3D") -> np.ndarray:
+        """
+        Elementwise intersection volumes with the boxes of `other`, broadcast against each other.
+        """
+        return ops.box3d_intersection(self.to_corners_array(), other.to_corners_array())
+
+    def iou(self, other: "BoxArray3D") -> np.ndarray:
+        """
+        Elementwise 3D IoU with the boxes of `other`, broadcast against each other.
+        """
+        return ops.box3d_iou(self.to_corners_array(), other.to_corners_array())
+
+    def iou_matrix(self, other: "BoxArray3D", workers: Optional[int] = None) -> np.ndarray:
+        """
+        3D IoU of all pairs of boxes, of shape (N, M), computed on `workers` processes if given.
+        """
+        return ops.pairwise(ops.box3d_iou, self.to_corners_array(), other.to_corners_array(), workers=workers)
+
+    def sparse_iou(self, other: "BoxArray3D", min_iou: float = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        3D IoU of the overlapping pairs of boxes in COO form, without the dense (N, M) matrix, for large scenes
+        of mostly disjoint boxes. See :py:func:`pybboxes.ops.sparse_pairwise_iou`.
+
+        Returns:
+            (rows, cols, ious) of the pairs with IoU > 0 and IoU >= `min_iou`, sorted by rows then cols.
+        """
+        return ops.sparse_pairwise_iou(self.to_corners_array(), other.to_corners_array(), min_iou=min_iou)
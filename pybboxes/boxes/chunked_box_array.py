@@ -0,0 +1,296 @@
+"""
+Out-of-core box arrays. Boxes of a file too large for memory are opened as a `np.memmap` and processed in chunks
+of a fixed number of rows, results are streamed to disk with :py:class:`ChunkWriter`, so the memory in use is
+bounded by the chunk size, not by the size of the file:
+
+    boxes = ChunkedBoxArray.open("detections.npy", bbox_type="yolo", image_size=(1920, 1080))
+    boxes.area_stats()
+    coco = boxes.convert("coco", "detections_coco.npy")
+    coco.drop_oob("detections_coco_inbounds.npy")
+
+Files are either .npy files or raw C-ordered binary files of (N, 4) rows, for which the dtype has to be given.
+"""
+import contextlib
+import os
+import struct
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from pybboxes import ops, precision
+from pybboxes.boxes.base import NORMALIZED_BOXES
+
+# Rows per chunk, 32 MiB of float64 boxes.
+DEFAULT_CHUNK_SIZE = 1 << 20
+# Row count the header of a .npy file is sized for while it is written.
+_MAX_ROWS = np.iinfo(np.int64).max
+
+ImageSizeType = Union[Tuple[int, int], np.ndarray]
+
+
+def open_array(path: str, dtype: Optional[np.dtype] = None, width: int = 4, mode: str = "r") -> np.ndarray:
+    """
+    Memory maps the (N, `width`) array of a .npy file, or of a raw binary file of `dtype` (float64 by default).
+    """
+    if path.endswith(".npy"):
+        array = np.load(path, mmap_mode=mode)
+        if array.ndim != 2 or array.shape[1] != width or not array.flags.c_contiguous:
+            raise ValueError(f"Expected a C-ordered array of shape (N, {width}) in '{path}', got {array.shape}.")
+        return array
+    dtype = np.dtype(dtype or np.float64)
+    size = os.path.getsize(path)
+    if size % (dtype.itemsize * width):
+        raise ValueError(f"Size of '{path}' ({size} bytes) is not a multiple of rows of {width} {dtype} values.")
+    if size == 0:
+        # empty files cannot be memory mapped
+        return np.empty((0, width), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=(size // (dtype.itemsize * width), width))
+
+
+def _npy_header(dtype: np.dtype, shape: Tuple[int, int], length: Optional[int] = None) -> bytes:
+    """version 1.0 .npy header, padded to `length` bytes if given so it can be rewritten in place"""
+    magic = np.lib.format.magic(1, 0)
+    header = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": shape})
+    if length is None:
+        # data is aligned to 64 bytes as numpy does
+        length = -(-(len(magic) + 2 + len(header) + 1) // 64) * 64
+    header = header.ljust(length - len(magic) - 2 - 1) + "\n"
+    return magic + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+class ChunkWriter:
+    """
+    Streaming writer of (k, `width`) chunks to a single (N, `width`) array file, .npy if `path` ends with .npy
+    and raw binary otherwise. Chunks are appended to a `<path>.part` file as they come, the row count of a .npy
+    header is filled in and the file is renamed to `path` on `close`, so `path` is never left half written. Used as
+    a context manager, the partial file is removed instead if an exception is raised. Values are cast to `dtype`
+    with :py:func:`pybboxes.precision.cast`.
+
+    Args:
+        path: (str) Output file, overwritten if it exists.
+        dtype: (dtype) Dtype of the file.
+        width: (int) Number of values per row.
+    """
+
+    def __init__(self, path: str, dtype: np.dtype = np.float64, width: int = 4):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.width = width
+        self.num_rows = 0
+        self._npy = path.endswith(".npy")
+        self._part_path = f"{path}.part"
+        self._file = open(self._part_path, "wb")
+        if self._npy:
+            self._header_length = len(_npy_header(self.dtype, (_MAX_ROWS, width)))
+            self._file.write(_npy_header(self.dtype, (_MAX_ROWS, width), self._header_length))
+
+    def write(self, values: np.ndarray) -> None:
+        values = np.ascontiguousarray(precision.cast(np.asarray(values).reshape(-1, self.width), self.dtype))
+        values.tofile(self._file)
+        self.num_rows += len(values)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        if self._npy:
+            self._file.seek(0)
+            self._file.write(_npy_header(self.dtype, (self.num_rows, self.width), self._header_length))
+        self._file.close()
+        os.replace(self._part_path, self.path)
+
+    def abort(self) -> None:
+        """Closes the writer and removes the partial file, leaving `path` untouched."""
+        if self._file.closed:
+            return
+        self._file.close()
+        os.remove(self._part_path)
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class AreaStats(NamedTuple):
+    count: int
+    mean: float
+    std: float
+    min: float
+    max: float
+
+
+class ChunkedBoxArray:
+    """
+    Boxes of the same format held on disk (or in any array-like supporting slicing, e.g. a `np.memmap`), processed
+    `chunk_size` rows at a time. Operations producing boxes write them to a file and return a new chunked array of
+    that file, see the module documentation.
+
+    Args:
+        values: (array-like) Boxes of shape (N, 4) in `bbox_type`, typically memory mapped.
+        bbox_type: (str) Format of the boxes. It's 'voc' [x-tl, y-tl, x-br, y-br] by default.
+        image_size: (tuple(int,int) or array) Image size as (w, h), or per box image sizes of shape (N, 2) (which
+            may be memory mapped as well). Required for the normalized formats.
+        chunk_size: (int) Number of rows processed at a time.
+    """
+
+    def __init__(
+        self,
+        values,
+        bbox_type: str = "voc",
+        image_size: Optional[ImageSizeType] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        ops._check_bbox_type(bbox_type)
+        if bbox_type in NORMALIZED_BOXES and image_size is None:
+            raise ValueError(f"'image_size' is required for {bbox_type} boxes.")
+        values = values if isinstance(values, np.ndarray) else np.asarray(values)
+        if values.ndim != 2 or values.shape[1] != 4:
+            raise ValueError(f"Given input array must be of shape (N, 4), got shape {values.shape}.")
+        if chunk_size < 1:
+            raise ValueError(f"'chunk_size' must be a positive integer, got {chunk_size}.")
+        if image_size is not None and np.ndim(image_size) == 2:
+            image_size = image_size if isinstance(image_size, np.ndarray) else np.asarray(image_size)
+            if len(image_size) != len(values):
+                raise ValueError(f"Expected {len(values)} image sizes, got {len(image_size)}.")
+        elif image_size is not None:
+            image_size = tuple(image_size)
+        self.values = values
+        self.name = bbox_type
+        self.image_size = image_size
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def open(
+        cls,
+        path: str,
+        bbox_type: str = "voc",
+        image_size: Optional[ImageSizeType] = None,
+        dtype: Optional[np.dtype] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "ChunkedBoxArray":
+        """
+        Opens the boxes of a .npy file or of a raw binary file of `dtype` (float64 by default) read-only, see
+        :py:func:`open_array`.
+        """
+        return cls(open_array(path, dtype), bbox_type, image_size, chunk_size)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self):
+        return f"<ChunkedBoxArray {self.name} ({len(self)} boxes, chunks of {self.chunk_size})>"
+
+    @property
+    def per_box_sizes(self) -> bool:
+        return isinstance(self.image_size, np.ndarray)
+
+    def iter_chunks(self) -> Iterator[Tuple[np.ndarray, Optional[ImageSizeType]]]:
+        """
+        Yields (values, image_size) of each chunk, the image size being the per box sizes of the chunk if given.
+        """
+        for start in range(0, len(self), self.chunk_size):
+            stop = start + self.chunk_size
+            image_size = np.asarray(self.image_size[start:stop]) if self.per_box_sizes else self.image_size
+            yield np.asarray(self.values[start:stop]), image_size
+
+    def _iter_voc_chunks(self) -> Iterator[Tuple[np.ndarray, Optional[ImageSizeType]]]:
+        for values, image_size in self.iter_chunks():
+            yield ops.to_voc_array(values, self.name, image_size, round_values=False), image_size
+
+    def _output_dtype(self, bbox_type: str, dtype: Optional[np.dtype]) -> np.dtype:
+        return precision.storage_dtype(bbox_type, np.empty(0, self.values.dtype), dtype, keep_integer=True)
+
+    def _check_output_paths(self, *paths: str) -> None:
+        """raises if an output path is one of the memory mapped files the boxes are read from"""
+        sources = [getattr(array, "filename", None) for array in (self.values, self.image_size)]
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            if any(source is not None and os.path.samefile(path, source) for source in sources):
+                raise ValueError(f"Cannot write to '{path}', the boxes are read from this file.")
+
+    def save(self, path: str, dtype: Optional[np.dtype] = None) -> "ChunkedBoxArray":
+        """
+        Writes the boxes to `path` (.npy or raw binary) chunk by chunk, cast to `dtype` if given.
+        """
+        self._check_output_paths(path)
+        with ChunkWriter(path, self._output_dtype(self.name, dtype)) as writer:
+            for values, _ in self.iter_chunks():
+                writer.write(values)
+        return ChunkedBoxArray.open(path, self.name, self.image_size, writer.dtype, self.chunk_size)
+
+    def convert(self, to_type: str, path: str, dtype: Optional[np.dtype] = None) -> "ChunkedBoxArray":
+        """
+        Converts the boxes to `to_type` as `BoxArray.convert` and writes them to `path` chunk by chunk.
+        """
+        ops._check_bbox_type(to_type)
+        if to_type in NORMALIZED_BOXES and self.image_size is None:
+            raise ValueError(f"'image_size' is required for conversion to {to_type}.")
+        self._check_output_paths(path)
+        with ChunkWriter(path, self._output_dtype(to_type, dtype)) as writer:
+            for voc_values, image_size in self._iter_voc_chunks():
+                writer.write(ops.from_voc_array(voc_values, to_type, image_size, round_values=False))
+        return ChunkedBoxArray.open(path, to_type, self.image_size, writer.dtype, self.chunk_size)
+
+    def _oob_mask(self, voc_values: np.ndarray, image_size: ImageSizeType) -> np.ndarray:
+        image_width, image_height = ops._image_sides(image_size, voc_values.dtype)
+        x_tl, y_tl, x_br, y_br = voc_values.T
+        return (x_tl < 0) | (y_tl < 0) | (x_br > image_width) | (y_br > image_height)
+
+    def count_oob(self) -> int:
+        """
+        Number of OOB (Out-of-bounds) boxes, as `is_oob` of `BoxArray`.
+        """
+        if self.image_size is None:
+            raise ValueError("'image_size' is required to find out of bounds boxes.")
+        return sum(int(self._oob_mask(*chunk).sum()) for chunk in self._iter_voc_chunks())
+
+    def drop_oob(self, path: str, image_sizes_path: Optional[str] = None) -> "ChunkedBoxArray":
+        """
+        Writes the boxes which are not OOB (Out-of-bounds) to `path` chunk by chunk, keeping their order. With per
+        box image sizes, the sizes of the kept boxes are written to `image_sizes_path` alongside.
+        """
+        if self.image_size is None:
+            raise ValueError("'image_size' is required to find out of bounds boxes.")
+        if self.per_box_sizes and image_sizes_path is None:
+            raise ValueError("'image_sizes_path' is required to filter boxes with per box image sizes.")
+        self._check_output_paths(path, *([image_sizes_path] if self.per_box_sizes else []))
+        if self.per_box_sizes and os.path.abspath(path) == os.path.abspath(image_sizes_path):
+            raise ValueError(f"'path' and 'image_sizes_path' must differ, got '{path}' for both.")
+        sizes_writer = ChunkWriter(image_sizes_path, self.image_size.dtype, width=2) if self.per_box_sizes else None
+        with ChunkWriter(path, self.values.dtype) as writer, sizes_writer or contextlib.nullcontext():
+            for values, image_size in self.iter_chunks():
+                voc_values = ops.to_voc_array(values, self.name, image_size, round_values=False)
+                keep = ~self._oob_mask(voc_values, image_size)
+                writer.write(values[keep])
+                if sizes_writer is not None:
+                    sizes_writer.write(image_size[keep])
+        image_size = self.image_size
+        if self.per_box_sizes:
+            image_size = open_array(image_sizes_path, self.image_size.dtype, width=2)
+        return ChunkedBoxArray.open(path, self.name, image_size, writer.dtype, self.chunk_size)
+
+    def area_stats(self) -> AreaStats:
+        """
+        Count, mean, standard deviation, min and max of the box areas in pixels, in one pass over the chunks. Chunk
+        moments are merged pairwise (Chan et al.), so the result does not lose precision with the number of boxes.
+        """
+        count, mean, m2, minimum, maximum = 0, 0.0, 0.0, np.inf, -np.inf
+        for voc_values, _ in self._iter_voc_chunks():
+            areas = ops.box_area(voc_values).astype(np.float64)
+            if not len(areas):
+                continue
+            chunk_mean = areas.mean()
+            delta = chunk_mean - mean
+            total = count + len(areas)
+            mean += delta * len(areas) / total
+            m2 += ((areas - chunk_mean) ** 2).sum() + delta**2 * count * len(areas) / total
+            count = total
+            minimum, maximum = min(minimum, areas.min()), max(maximum, areas.max())
+        if count == 0:
+            return AreaStats(0, np.nan, np.nan, np.nan, np.nan)
+        return AreaStats(count, float(mean), float(np.sqrt(m2 / count)), float(minimum), float(maximum))
@@ -1,5 +1,6 @@
 from typing import Tuple, Union
 
+from pybboxes import cache
 from pybboxes.boxes.base import BaseBoundingBox
 from pybboxes.boxes.bbox import BoundingBox
 
@@ -30,6 +31,7 @@ class FiftyoneBoundingBox(BaseBoundingBox):
         else:
             self._is_oob = False
 
+    @cache.cached_conversion("voc")
     def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
         if self.is_image_size_null():
             raise ValueError("'image_size' is required for conversion.")
@@ -0,0 +1,79 @@
+from typing import Tuple, Union
+
+import numpy as np
+
+from pybboxes import ops
+from pybboxes.boxes.base import BaseBoundingBox
+from pybboxes.boxes.bbox import BoundingBox
+
+
+class RotatedBoundingBox:
+    """
+    Oriented box as (x-c, y-c, w, h, angle) in pixels, `angle` in radians. See
+    :py:func:`pybboxes.ops.rotated_to_polygons` for the rotation convention. Values are not rounded.
+
+    The `to_*` methods return the axis-aligned box enclosing the rotated one in the respective format.
+    """
+
+    name = "rotated"
+
+    def __init__(self, x_c: float, y_c: float, w: float, h: float, angle: float, image_size: Tuple[int, int] = None):
+        if w < 0 or h < 0:
+            raise ValueError("Given width and height must be non-negative.")
+        self._values = (x_c, y_c, w, h, angle)
+        self.image_size = image_size
+
+    def __repr__(self):
+        str_vals = " ".join(f"{v:.4f}" for v in self.values)
+        image_width, image_height = self.image_size or (None, None)
+        return f"<[{str_vals}] | Image: ({image_width or '?'}x{image_height or '?'})>"
+
+    @property
+    def values(self) -> Tuple[float, float, float, float, float]:
+        return self._values
+
+    @property
+    def area(self) -> float:
+        return self._values[2] * self._values[3]
+
+    def to_polygon(self) -> np.ndarray:
+        """
+        Corners of the box of shape (4, 2).
+        """
+        return ops.rotated_to_polygons(np.array(self._values, dtype=float))
+
+    @classmethod
+    def from_polygon(cls, polygon, image_size: Tuple[int, int] = None) -> "RotatedBoundingBox":
+        """
+        Creates the box from its 4 corners of shape (4, 2), see :py:func:`pybboxes.ops.polygons_to_rotated`.
+        """
+        return cls(*ops.polygons_to_rotated(np.reshape(polygon, (4, 2))).tolist(), image_size=image_size)
+
+    def intersection(self, other: "RotatedBoundingBox") -> float:
+        return float(ops.convex_intersection_area(self.to_polygon(), other.to_polygon()))
+
+    def union(self, other: "RotatedBoundingBox") -> float:
+        return self.area + other.area - self.intersection(other)
+
+    def iou(self, other: "RotatedBoundingBox") -> float:
+        return self.intersection(other) / self.union(other)
+
+    def _to_bbox_type(self, name: str, return_values: bool) -> Union[Tuple, BaseBoundingBox]:
+        polygon = self.to_polygon()
+        enclosing = BoundingBox(*polygon.min(axis=0), *polygon.max(axis=0), image_size=self.image_size)
+        return getattr(enclosing, f"to_{name}")(return_values)
+
+    def to_albumentations(self, return_values: bool = False) -> Union[Tuple, BaseBoundingBox]:
+        return self._to_bbox_type("albumentations", return_values)
+
+    def to_coco(self, return_values: bool = False) -> Union[Tuple, BaseBoundingBox]:
+        return self._to_bbox_type("coco", return_values)
+
+    def to_fiftyone(self, return_values: bool = False) -> Union[Tuple, BaseBoundingBox]:
+        return self._to_bbox_type("fiftyone", return_values)
+
+    def to_voc(self, return_values: bool = False) -> Union[Tuple, BaseBoundingBox]:
+        return self._to_bbox_type("voc", return_values)
+
+    def to_yolo(self, return_values: bool = False) -> Union[Tuple, BaseBoundingBox]:
+        return self._to_bbox_type("yolo", return_values)
@@ -0,0 +1,85 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from pybboxes import ops, precision
+from pybboxes.boxes.box_array import BoxArray
+from pybboxes.interop import ArrayInterop, from_dlpack
+
+
+class RotatedBoxArray(ArrayInterop):
+    """
+    Array of N oriented boxes (x-c, y-c, w, h, angle) on the same image, the batch counterpart of
+    :py:class:`pybboxes.RotatedBoundingBox`. Values are held in a single (N, 5) float array, shared with NumPy
+    and DLPack consumers without a copy.
+
+    Args:
+        values: (array-like) Boxes of shape (N, 5), angles in radians.
+        image_size: (tuple(int,int)) Image size as (w, h), required for conversions to the normalized formats.
+    """
+
+    def __init__(self, values, image_size: Optional[Tuple[int, int]] = None):
+        values = np.asarray(values)
+        values = values.astype(precision.compute_dtype(values), copy=False)
+        if values.shape[-1:] != (5,):
+            raise ValueError(
+                f"Given input array must have rotated box values at dim -1 as 5, got shape {values.shape}."
+            )
+        self.values = values.reshape(-1, 5)
+        self.image_size = tuple(image_size) if image_size is not None else None
+
+    @classmethod
+    def from_polygons(cls, polygons, image_size: Optional[Tuple[int, int]] = None) -> "RotatedBoxArray":
+        """
+        Creates the boxes from their corners of shape (N, 4, 2) or (N, 8), see
+        :py:func:`pybboxes.ops.polygons_to_rotated`.
+        """
+        return cls(ops.polygons_to_rotated(np.reshape(polygons, (-1, 4, 2))), image_size)
+
+    @classmethod
+    def from_dlpack(cls, x, image_size: Optional[Tuple[int, int]] = None) -> "RotatedBoxArray":
+        """
+        Creates the boxes sharing memory with `x`, a CPU array or tensor of float32 or float64 values implementing
+        `__dlpack__`.
+        """
+        return cls(from_dlpack(x), image_size)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> "RotatedBoxArray":
+        return RotatedBoxArray(self.values[index], self.image_size)
+
+    def __repr__(self):
+        image_width, image_height = self.image_size or (None, None)
+        return f"<RotatedBoxArray ({len(self)} boxes) | Image: ({image_width or '?'}x{image_height or '?'})>"
+
+    @property
+    def area(self) -> np.ndarray:
+        return self.values[:, 2] * self.values[:, 3]
+
+    def to_polygons(self) -> np.ndarray:
+        """
+        Corners of the boxes of shape (N, 4, 2).
+        """
+        return ops.rotated_to_polygons(self.values)
+
+    def to_box_array(self, bbox_type: str = "voc") -> BoxArray:
+        """
+        Axis-aligned boxes enclosing the rotated ones, in `bbox_type`.
+        """
+        polygons = self.to_polygons()
+        enclosing = np.concatenate([polygons.min(axis=1), polygons.max(axis=1)], axis=-1)
+        return BoxArray.from_voc(enclosing, bbox_type, self.image_size)
+
+    def iou(self, other: "RotatedBoxArray", workers: Optional[int] = None) -> np.ndarray:
+        """
+        Elementwise rotated IoU with the boxes of `other`, computed on `workers` processes if given.
+        """
+        return ops.rotated_iou(self.values, other.values, workers=workers)
+
+    def iou_matrix(self, other: "RotatedBoxArray", workers: Optional[int] = None) -> np.ndarray:
+        """
+        Rotated IoU of all pairs of boxes, of shape (N, M), computed on `workers` processes if given.
+        """
+        return ops.pairwise_rotated_iou(self.values, other.values, workers=workers)
@@ -1,5 +1,6 @@
 from typing import Tuple, Union
 
+from pybboxes import cache
 from pybboxes.boxes.base import BaseBoundingBox
 from pybboxes.boxes.bbox import BoundingBox
 
@@ -44,6 +45,7 @@ class VocBoundingBox(BaseBoundingBox):
         elif not self.is_image_size_null():
             self._is_oob = False
 
+    @cache.cached_conversion("voc")
     def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
         x_tl, y_tl, x_br, y_br = self.values
         if return_values:
@@ -0,0 +1,217 @@
+"""
+Opt-in, size-bounded LRU cache for box conversions. Disabled by default:
+
+    from pybboxes import cache
+
+    with cache.conversion_cache(maxsize=4096) as conversions:
+        pbx.convert_bbox((98, 345, 322, 117), from_type="coco", to_type="yolo", image_size=(640, 480))
+        pbx.convert_bbox((98, 345, 322, 117), from_type="coco", to_type="yolo", image_size=(640, 480))  # hit
+    conversions.info()  # CacheInfo(hits=1, misses=1, evictions=0, maxsize=4096, currsize=1)
+
+When enabled, `convert_bbox` and the `to_*` methods of the box classes look conversions up by
+(source format, target format, source values, image size, strictness). Only successful conversions are
+cached, so a strict conversion raising for an out-of-bounds box raises on every call. Hits never hand
+out a shared object, a requested box object is rebuilt from the cached values. Only the conversion
+requested by the caller is counted and stored: box construction and the intermediate conversions made
+while computing a miss (e.g. through voc) bypass the cache.
+"""
+import functools
+import threading
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+# Key layout: (from_type, to_type, image_size, strict, source, values), `lookup` appends return_values.
+CacheKey = Tuple[str, str, Any, Any, Hashable, Tuple]
+
+_cache: Optional["ConversionCache"] = None
+# Set while a miss is computed, so that the conversions it makes internally bypass the cache.
+_local = threading.local()
+
+
+class ConversionCache:
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("'maxsize' must be a positive integer.")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[Tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return entry
+
+    def put(self, key: CacheKey, entry: Tuple) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def invalidate(
+        self, from_type: Optional[str] = None, to_type: Optional[str] = None, image_size: Optional[Tuple] = None
+    ) -> int:
+        """
+        Removes the entries matching all of the given criteria, e.g. every conversion made for an image
+        size that is no longer in use.
+
+        Returns:
+            Number of removed entries.
+        """
+        image_size = tuple(image_size) if image_size is not None else None
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if (from_type is None or key[0] == from_type)
+                and (to_type is None or key[1] == to_type)
+                and (image_size is None or key[2] == image_size)
+            ]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+
+def enable(maxsize: int = 4096) -> ConversionCache:
+    """
+    Enables the conversion cache globally, replacing the active one if any.
+    """
+    global _cache
+    _cache = ConversionCache(maxsize=maxsize)
+    return _cache
+
+
+def disable() -> None:
+    global _cache
+    _cache = None
+
+
+def get_cache() -> Optional[ConversionCache]:
+    return _cache
+
+
+def enabled() -> bool:
+    return _cache is not None
+
+
+@contextmanager
+def conversion_cache(maxsize: int = 4096) -> Iterator[ConversionCache]:
+    """
+    Enables a new conversion cache for the duration of the context, the previous one is restored on exit.
+    """
+    global _cache
+    previous = _cache
+    _cache = ConversionCache(maxsize=maxsize)
+    try:
+        yield _cache
+    finally:
+        _cache = previous
+
+
+def _normalize_image_size(image_size) -> Optional[Tuple]:
+    return tuple(image_size) if image_size is not None else None
+
+
+def lookup(key: CacheKey, convert: Callable[[bool], Any], return_values: bool):
+    """
+    Returns the conversion result for `key` from the active cache, calling `convert(return_values)` on a
+    miss. Values and box objects are cached under separate entries, as computing the values alone does not
+    require constructing the target box. The active cache must not be None.
+    """
+    if getattr(_local, "converting", False):
+        return convert(return_values)
+    cache = _cache
+    key = key + (return_values,)
+    entry = cache.get(key)
+    if entry is None:
+        _local.converting = True
+        try:
+            result = convert(return_values)
+        finally:
+            _local.converting = False
+        if return_values:
+            entry = tuple(result)
+        else:
+            entry = (type(result), result.raw_values, result._image_size, result.strict)
+        cache.put(key, entry)
+        return result
+    if return_values:
+        return entry
+    klass, raw_values, image_size, strict = entry
+    return klass(*raw_values, image_size=image_size, strict=strict)
+
+
+def uncached(method: Callable) -> Callable:
+    """
+    The undecorated function of a method wrapped with :py:func:`cached_conversion`.
+    """
+    return getattr(method, "__wrapped__", method)
+
+
+def values_key(values, from_type: str, to_type: str, image_size, kwargs: dict) -> Optional[CacheKey]:
+    """
+    Key for converting raw values, None if the values are not hashable (e.g. not a single box).
+    """
+    try:
+        values = tuple(values)
+        extra = tuple(sorted((k, v) for k, v in kwargs.items() if k != "strict"))
+        image_size = _normalize_image_size(image_size)
+        key = (from_type, to_type, image_size, kwargs.get("strict"), ("values",) + extra, values)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def cached_conversion(to_type: str) -> Callable:
+    """
+    Decorator for the `to_*` methods of the box classes. A no-op pass-through when the cache is disabled.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, return_values: bool = False, **kwargs):
+            if _cache is None or kwargs or getattr(_local, "converting", False):
+                return method(self, return_values, **kwargs)
+            try:
+                key = (
+                    self.name or "voc",
+                    to_type,
+                    _normalize_image_size(self._image_size),
+                    self.strict,
+                    type(self).__name__,
+                    tuple(self.raw_values),
+                )
+                hash(key)
+            except TypeError:
+                return method(self, return_values)
+            return lookup(key, lambda values_only: method(self, values_only), return_values)
+
+        return wrapper
+
+    return decorator
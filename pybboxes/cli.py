@@ -0,0 +1,220 @@
+"""
+Command line interface for pybboxes.
+
+    pybboxes convert --from yolo --to coco --labels-dir ./labels --images-dir ./images --output ./annotations.json
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pybboxes._typing import AnnotationRecordType
+from pybboxes.annotations import Annotations
+from pybboxes.annotations.streaming import (
+    convert_records,
+    list_voc_files,
+    list_yolo_files,
+    read_voc_file,
+    read_yolo_file,
+    write_coco,
+    write_voc,
+    write_yolo,
+)
+
+ANNOTATION_FORMATS = ("yolo", "voc", "coco")
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _convert_chunk(
+    task: Tuple[str, List],
+    from_type: str,
+    to_type: str,
+    images_dir: Optional[str] = None,
+    class_names: Optional[List[str]] = None,
+) -> List[AnnotationRecordType]:
+    """
+    Reads (if the task holds file paths) and converts a chunk of images. This is the unit of work sent to
+    the worker processes, hence it is a module level function.
+    """
+    kind, items = task
+    if kind == "files" and from_type == "yolo":
+        records = [read_yolo_file(path, images_dir, class_names) for path in items]
+    elif kind == "files":
+        records = [read_voc_file(path) for path in items]
+    else:
+        records = items
+    return list(convert_records(records, from_type, to_type))
+
+
+def _ordered_map(fn, tasks: Iterable, workers: int) -> Iterator:
+    """
+    Maps `fn` over tasks preserving order. At most `2 * workers` tasks are in flight at once so that
+    memory stays bounded regardless of the number of tasks.
+    """
+    if workers <= 1:
+        yield from map(fn, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(fn, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Peak resident set size in bytes of this process and its (terminated) children, None if it cannot
+    be determined on the platform.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    # ru_maxrss is in kilobytes on Linux, in bytes on macOS.
+    unit = 1 if sys.platform == "darwin" else 1024
+    usage = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    return usage * unit
+
+
+class ConversionStats:
+    def __init__(self):
+        self.images = 0
+        self.boxes = 0
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    def count(self, records: Iterable[AnnotationRecordType]) -> Iterator[AnnotationRecordType]:
+        for record in records:
+            self.images += 1
+            self.boxes += len(record[2])
+            yield record
+        self.end_time = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        end_time = self.end_time if self.end_time is not None else time.perf_counter()
+        return end_time - self.start_time
+
+    def summary(self) -> str:
+        elapsed = max(self.elapsed, 1e-9)
+        rss = peak_rss()
+        rss = f"{rss / 2 ** 20:.1f} MiB" if rss is not None else "n/a"
+        return (
+            f"Converted {self.images} images ({self.boxes} boxes) in {self.elapsed:.2f}s | "
+            f"{self.images / elapsed:.1f} images/s | {self.boxes / elapsed:.1f} boxes/s | peak RSS: {rss}"
+        )
+
+
+def _tasks(args: argparse.Namespace) -> Tuple[Iterator[Tuple[str, List]], Optional[List[str]]]:
+    """
+    Returns the chunked tasks for the source format and the class vocabulary when it is known upfront.
+    """
+    if args.from_type == "coco":
+        anns = Annotations(annotation_type="coco")
+        records = anns.iter_from_coco(args.json_path)
+        return ((("records", chunk) for chunk in _chunked(records, args.chunk_size)), list(anns.names_mapping))
+
+    if not os.path.isdir(args.labels_dir):
+        raise NotADirectoryError(f"{args.labels_dir} is not a valid directory")
+    if args.from_type == "yolo":
+        with open(args.classes_file, "r") as f:
+            class_names = [line.strip() for line in f.readlines()]
+        files = list_yolo_files(args.labels_dir)
+    else:
+        class_names = None
+        files = list_voc_files(args.labels_dir)
+    return (("files", chunk) for chunk in _chunked(files, args.chunk_size)), class_names
+
+
+def convert(args: argparse.Namespace) -> ConversionStats:
+    """
+    Runs a streaming conversion between annotation formats. Images are read and converted in chunks
+    of `args.chunk_size` on `args.workers` processes and written in order by the main process.
+    """
+    tasks, class_names = _tasks(args)
+    worker_fn = partial(
+        _convert_chunk,
+        from_type=args.from_type,
+        to_type=args.to_type,
+        images_dir=args.images_dir,
+        class_names=class_names,
+    )
+    stats = ConversionStats()
+    records = stats.count(record for chunk in _ordered_map(worker_fn, tasks, args.workers) for record in chunk)
+
+    if args.to_type == "yolo":
+        write_yolo(records, args.output, bbox_type="yolo", class_names=class_names)
+    elif args.to_type == "voc":
+        write_voc(records, args.output, bbox_type="voc")
+    else:
+        write_coco(records, args.output, bbox_type="coco", class_names=class_names)
+    return stats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pybboxes", description="Light Weight Toolkit for Bounding Boxes")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = subparsers.add_parser("convert", help="Convert annotation files between formats.")
+    convert_parser.add_argument("--from", dest="from_type", choices=ANNOTATION_FORMATS, required=True)
+    convert_parser.add_argument("--to", dest="to_type", choices=ANNOTATION_FORMATS, required=True)
+    convert_parser.add_argument("--labels-dir", help="Directory of label files (yolo and voc sources).")
+    convert_parser.add_argument("--images-dir", help="Directory of images (yolo source).")
+    convert_parser.add_argument(
+        "--classes-file", help="Path to classes.txt (yolo source), defaults to <labels-dir>/classes.txt."
+    )
+    convert_parser.add_argument("--json-path", help="Path to the annotation file (coco source).")
+    convert_parser.add_argument(
+        "--output", required=True, help="Output directory (yolo and voc targets) or json file (coco target)."
+    )
+    convert_parser.add_argument("--workers", type=int, default=1, help="Number of worker processes.")
+    convert_parser.add_argument("--chunk-size", type=int, default=256, help="Number of images per work unit.")
+    return parser
+
+
+def _validate_convert_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    if args.from_type == "coco" and args.json_path is None:
+        parser.error("--json-path is required when converting from coco.")
+    if args.from_type in ("yolo", "voc") and args.labels_dir is None:
+        parser.error(f"--labels-dir is required when converting from {args.from_type}.")
+    if args.from_type == "yolo":
+        if args.images_dir is None:
+            parser.error("--images-dir is required when converting from yolo.")
+        if args.classes_file is None:
+            args.classes_file = os.path.join(args.labels_dir, "classes.txt")
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer.")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive integer.")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "convert":
+        _validate_convert_args(parser, args)
+        stats = convert(args)
+        print(stats.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Fusion of predictions of several models (or test time augmentations) into a single prediction set.
+
+    from pybboxes.ensemble import fuse_boxes
+
+    boxes, scores, labels = fuse_boxes(boxes_list, scores_list, labels_list, bbox_type="coco", method="wbf")
+
+Boxes are clustered per label in descending score order: a box joins the cluster whose reference box it
+overlaps most with IoU > `iou_threshold`, otherwise it starts a new cluster. Weighted Boxes Fusion (Solovyev et
+al., 2021) matches against the running fused box of each cluster, the simpler strategies against the box that
+started the cluster. The fused box of a cluster is updated from running sums rather than recomputed from its
+members.
+
+The matching of a box depends on the clusters left by the higher scoring boxes of its label, so the clustering of
+a label is sequential in general. Fused boxes stay within the enclosing box of their members though, so boxes of
+a label are first split into groups separated by gaps along x or y, which cannot share clusters. The groups are
+then clustered together, one score rank per step, each step evaluating the IoU of the boxes of all groups against
+all clusters of their groups at once. The results are the same as of box by box clustering.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from pybboxes import ops
+from pybboxes._typing import GenericBboxType
+
+FUSION_METHODS = ("wbf", "average", "max")
+
+
+def _separable_groups(boxes: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """
+    Splits the boxes of each label into groups separated by gaps along x or y, recursively, and returns the group
+    index of each box. The enclosing boxes of the groups are disjoint. Each pass splits all groups along one axis
+    at once: in a group sorted by the minimum coordinate, a box starts a new group where it begins after the
+    maximum extent of the boxes before it.
+    """
+    groups = labels.astype(np.int64)
+    # Fused boxes are averages in floating point, which may cross the enclosing box by a few ulps
+    margin = 1e-6 * np.abs(boxes[np.isfinite(boxes)]).max(initial=1)
+    num_groups, axis, unchanged = int(groups.max(initial=-1)) + 1, 0, 0
+    while len(boxes) and unchanged < 2:
+        lower, upper = boxes[:, axis] - margin, boxes[:, axis + 2] + margin
+        order = np.lexsort((lower, groups))
+        groups, lower, upper = groups[order], lower[order], upper[order]
+        is_first = np.r_[True, groups[1:] != groups[:-1]]
+        # Running maximum within each group, groups are shifted apart so that it does not carry over
+        shift = (np.cumsum(is_first) - 1) * (np.nanmax(upper) - np.nanmin(lower) + 1)
+        extent = np.maximum.accumulate(upper + shift) - shift
+        split = np.cumsum(is_first | (lower >= np.r_[-np.inf, extent[:-1]])) - 1
+        groups = np.empty_like(split)
+        groups[order] = split
+        unchanged = unchanged + 1 if split[-1] + 1 == num_groups else 0
+        num_groups, axis = int(split[-1]) + 1, 1 - axis
+    return groups
+
+
+def _cluster(
+    boxes: np.ndarray, scores: np.ndarray, labels: np.ndarray, iou_threshold: float, match_fused: bool
+) -> Tuple[np.ndarray, ...]:
+    """
+    Greedy clustering of VOC boxes, `labels` are label indices.
+
+    Returns:
+        Per cluster label, number of boxes, sum of scores, score weighted sum of the boxes, the box that
+        started the cluster and its score, clusters in creation order.
+    """
+    num_boxes = len(boxes)
+    # A box only joins a cluster it overlaps, whose reference lies in the enclosing box of its members (a convex
+    # combination of them), so groups of a label with disjoint enclosing boxes are clustered independently
+    separable = iou_threshold >= 0 and np.all(scores >= 0)
+    groups = _separable_groups(boxes, labels) if separable else labels
+    # Position of each box in the box by box order, by label and descending score
+    positions = np.empty(num_boxes, dtype=int)
+    positions[np.lexsort((-scores, labels))] = np.arange(num_boxes)
+    order = np.lexsort((-scores, groups))
+    boxes, scores, labels, positions = boxes[order], scores[order], labels[order], positions[order]
+    is_first = np.r_[True, groups[order][1:] != groups[order][:-1]][:num_boxes]
+    group_of = np.cumsum(is_first) - 1
+    # Groups by descending size, the groups with a box of rank r are the first active_counts[r]
+    by_size = np.argsort(-np.bincount(group_of), kind="stable")
+    group_starts, group_sizes = np.flatnonzero(is_first)[by_size], np.bincount(group_of)[by_size]
+    active_counts = np.searchsorted(-group_sizes, -np.arange(group_sizes.max(initial=0)), side="left")
+
+    # Cluster k of a group is stored in the slot of the k-th box of the group
+    reference = np.zeros((num_boxes, 4))
+    weighted_sum = np.zeros((num_boxes, 4))
+    score_sum = np.zeros(num_boxes)
+    counts = np.zeros(num_boxes, dtype=int)
+    first_box = np.empty(num_boxes, dtype=int)
+    num_clusters = np.zeros(len(group_starts), dtype=int)
+
+    # Step r adds the box of rank r of every group, vectorized over the groups and their clusters
+    rank = 0
+    while rank < len(active_counts) and active_counts[rank] > 1:
+        starts, clusters = group_starts[: active_counts[rank]], num_clusters[: active_counts[rank]]
+        rows = starts + rank
+        width = np.arange(max(clusters.max(), 1))
+        slots = np.minimum(starts[:, None] + width, num_boxes - 1)
+        ious = ops.box_iou(reference[slots], boxes[rows, None])
+        # Boxes match the clusters of their own group only, NaN (e.g. of a cluster of zero scores) never matches
+        ious = np.where((width < clusters[:, None]) & (ious > iou_threshold), ious, -np.inf)
+        nearest = np.argmax(ious, axis=1)
+        new = ~np.isfinite(ious[np.arange(len(rows)), nearest])
+        slots = starts + np.where(new, clusters, nearest)
+        reference[slots[new]] = boxes[rows[new]]
+        first_box[slots[new]] = rows[new]
+        weighted_sum[slots] += scores[rows, None] * boxes[rows]
+        score_sum[slots] += scores[rows]
+        counts[slots] += 1
+        if match_fused:
+            reference[slots] = weighted_sum[slots] / score_sum[slots, None]
+        clusters += new
+        rank += 1
+    # Only the largest group has boxes left, they are added one by one
+    if rank < len(active_counts):
+        start, num = group_starts[0], num_clusters[0]
+        for row in range(start + rank, start + group_sizes[0]):
+            slot = start + num
+            if num:
+                ious = ops.box_iou(reference[start:slot], boxes[row])
+                nearest = int(np.argmax(ious))
+                if np.isnan(ious[nearest]):
+                    nearest = int(np.argmax(np.where(np.isnan(ious), -np.inf, ious)))
+                if ious[nearest] > iou_threshold:
+                    slot = start + nearest
+            if slot == start + num:
+                reference[slot], first_box[slot] = boxes[row], row
+                num += 1
+            weighted_sum[slot] += scores[row] * boxes[row]
+            score_sum[slot] += scores[row]
+            counts[slot] += 1
+            if match_fused:
+                reference[slot] = weighted_sum[slot] / score_sum[slot]
+        num_clusters[0] = num
+
+    # Slots of the clusters, in the order the box by box clustering creates them
+    group_clusters = np.empty_like(num_clusters)
+    group_clusters[by_size] = num_clusters
+    slots = np.flatnonzero(np.arange(num_boxes) - np.flatnonzero(is_first)[group_of] < group_clusters[group_of])
+    slots = slots[np.argsort(positions[first_box[slots]])]
+    first_box = first_box[slots]
+    return (
+        labels[slots],
+        counts[slots],
+        score_sum[slots],
+        weighted_sum[slots],
+        boxes[first_box],
+        scores[first_box],
+    )
+
+
+def fuse_boxes(
+    boxes_list: Sequence[GenericBboxType],
+    scores_list: Sequence[Sequence[float]],
+    labels_list: Sequence[Sequence],
+    bbox_type: str = "coco",
+    method: str = "wbf",
+    weights: Optional[Sequence[float]] = None,
+    iou_threshold: float = 0.55,
+    skip_box_threshold: float = 0.0,
+    conf_type: str = "avg",
+    image_size: Optional[Tuple[int, int]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fuses the predictions of several models on an image.
+
+    Args:
+        boxes_list: Boxes of each model, arrays of shape (n_i, 4) in `bbox_type`.
+        scores_list: Scores of each model, arrays of shape (n_i,).
+        labels_list: Labels of each model, arrays of shape (n_i,) of any comparable type.
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+        method: 'wbf' for Weighted Boxes Fusion; 'average' for the score weighted average of clusters
+            matched against the highest scoring box; 'max' to keep the highest scoring box of each cluster.
+        weights: Weights of the models, scores are multiplied by them. Equal weights by default.
+        iou_threshold: A box joins a cluster if their IoU is strictly greater.
+        skip_box_threshold: Boxes with (unweighted) scores below are dropped.
+        conf_type: Score of the fused boxes for 'wbf' and 'average'. 'avg' is the mean score of the cluster,
+            scaled down if fewer boxes than models were fused; 'max' is the maximum score over the maximum
+            weight.
+        image_size: Image size as (w, h), required for the normalized formats.
+
+    Returns:
+        Fused boxes of shape (k, 4) in `bbox_type` (not rounded), scores and labels, by descending score.
+    """
+    if method not in FUSION_METHODS:
+        raise ValueError(f"Unsupported fusion method '{method}', expected one of {FUSION_METHODS}.")
+    if conf_type not in ("avg", "max"):
+        raise ValueError(f"Unsupported conf_type '{conf_type}', expected one of ('avg', 'max').")
+    if not len(boxes_list) == len(scores_list) == len(labels_list):
+        raise ValueError("'boxes_list', 'scores_list' and 'labels_list' must have the same length.")
+    weights = np.ones(len(boxes_list)) if weights is None else np.asarray(weights, dtype=float)
+    if len(weights) != len(boxes_list):
+        raise ValueError("'weights' must have a weight for each model.")
+
+    boxes = ops.to_voc_array(
+        np.concatenate([np.reshape(b, (-1, 4)) for b in boxes_list] + [np.empty((0, 4))]),
+        bbox_type,
+        image_size,
+        round_values=False,
+    )
+    scores = np.concatenate([np.reshape(s, -1) for s in scores_list] + [np.empty(0)]).astype(float)
+    labels = np.concatenate([np.reshape(np.asarray(lbl), -1) for lbl in labels_list] or [np.empty(0)])
+    model_weights = np.repeat(weights, [len(np.reshape(s, -1)) for s in scores_list])
+    keep = scores >= skip_box_threshold
+    boxes, scores, labels = boxes[keep], scores[keep] * model_weights[keep], labels[keep]
+    label_values, label_ids = np.unique(labels, return_inverse=True)
+
+    cluster_labels, counts, score_sum, weighted_sum, first_boxes, first_scores = _cluster(
+        boxes, scores, label_ids.reshape(-1), iou_threshold, match_fused=method == "wbf"
+    )
+    if method == "max":
+        fused_boxes, fused_scores = first_boxes, first_scores
+    else:
+        fused_boxes = weighted_sum / score_sum[:, None]
+        if conf_type == "avg":
+            fused_scores = score_sum / counts * np.minimum(len(weights), counts) / weights.sum()
+        else:
+            # Clusters are built in descending score order, the first box has the maximum score
+            fused_scores = first_scores / weights.max()
+
+    order = np.argsort(-fused_scores, kind="stable")
+    fused_boxes = ops.from_voc_array(fused_boxes[order], bbox_type, image_size, round_values=False)
+    return fused_boxes, fused_scores[order], label_values[cluster_labels[order]]
@@ -0,0 +1,283 @@
+"""
+COCO-style detection evaluation (AP/AR) without pycocotools.
+
+    from pybboxes.evaluation import DetectionEvaluator
+
+    evaluator = DetectionEvaluator(ground_truth)  # an `Annotations` object
+    for image_name, boxes, scores, labels in predictions:
+        evaluator.update(image_name, boxes, scores, labels, bbox_type="coco")
+    evaluator.compute()  # {'AP': ..., 'AP50': ..., ..., 'AR_large': ...}
+
+The protocol follows COCOeval for bounding boxes: detections are greedily matched in descending score order
+per image and category, ground truths outside an area range are ignored along with the detections matched to
+them, and precision is interpolated at 101 recall thresholds. Matching is vectorized over IoU thresholds, area
+ranges and ground truths, and accumulation uses sorted cumulative sums. Ground truth areas are the box areas and
+no ground truth is treated as crowd, as `Annotations` carries neither segmentation areas nor crowd flags.
+Unlike COCOeval, matching does not depend on annotation ids (COCOeval drops matches to the annotation with id 0).
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pybboxes import ops
+from pybboxes.annotations import Annotations
+
+DEFAULT_IOU_THRESHOLDS = np.linspace(0.5, 0.95, 10)
+DEFAULT_RECALL_THRESHOLDS = np.linspace(0.0, 1.00, 101)
+DEFAULT_MAX_DETECTIONS = (1, 10, 100)
+DEFAULT_AREA_RANGES = {
+    "all": (0, 1e5**2),
+    "small": (0, 32**2),
+    "medium": (32**2, 96**2),
+    "large": (96**2, 1e5**2),
+}
+
+
+@dataclass
+class _ImageResult:
+    # Matching results of an image. Detections are grouped by label in descending score order, `ranks` are
+    # their positions within the label, and rows of `matched` and `ignored` index (area range, IoU threshold)
+    # pairs. `num_gt` holds the number of non-ignored ground truths per (area range, label).
+    scores: np.ndarray
+    labels: np.ndarray
+    ranks: np.ndarray
+    matched: np.ndarray
+    ignored: np.ndarray
+    num_gt: np.ndarray
+
+
+def _outside(areas: np.ndarray, area_ranges: np.ndarray) -> np.ndarray:
+    """(A, n) mask of areas outside each of the area ranges."""
+    return (areas[None] < area_ranges[:, :1]) | (areas[None] > area_ranges[:, 1:])
+
+
+def _match(ious: np.ndarray, gt_ignore: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    Greedily matches detections (rows of `ious`, sorted by score) to ground truths for every (area range,
+    IoU threshold) pair at once. As in COCOeval, a detection is matched to the unmatched ground truth with the
+    highest IoU above the threshold, preferring non-ignored ground truths, the last one on ties.
+
+    Returns:
+        (A * T, D) array of matched ground truth indices, -1 for unmatched detections.
+    """
+    num_dt, num_gt = ious.shape
+    num_areas, num_thresholds = len(gt_ignore), len(thresholds)
+    num_rows = num_areas * num_thresholds
+    dt_match = np.full((num_rows, num_dt), -1)
+    if num_gt == 0:
+        return dt_match
+    thresholds = np.tile(np.minimum(thresholds, 1 - 1e-10), num_areas)[:, None]
+    gt_ignore = np.repeat(gt_ignore, num_thresholds, axis=0)
+    gt_matched = np.zeros((num_rows, num_gt), dtype=bool)
+    rows = np.arange(num_rows)
+    # Detections below the lowest threshold for every ground truth can never match
+    for d in np.flatnonzero(ious.max(axis=1) >= thresholds.min()).tolist():
+        candidates = (ious[d] >= thresholds) & ~gt_matched
+        if not candidates.any():
+            continue
+        preferred = candidates & ~gt_ignore
+        candidates = np.where(preferred.any(axis=1, keepdims=True), preferred, candidates)
+        masked = np.where(candidates, ious[d], -np.inf)
+        best = num_gt - 1 - np.argmax(masked[:, ::-1], axis=1)
+        has_match = candidates.any(axis=1)
+        gt_matched[rows[has_match], best[has_match]] = True
+        dt_match[has_match, d] = best[has_match]
+    return dt_match
+
+
+class DetectionEvaluator:
+    def __init__(
+        self,
+        ground_truth: Annotations,
+        iou_thresholds: Sequence[float] = DEFAULT_IOU_THRESHOLDS,
+        max_detections: Sequence[int] = DEFAULT_MAX_DETECTIONS,
+        area_ranges: Dict[str, Tuple[float, float]] = None,
+    ):
+        """
+        Evaluates detections against the ground truth in `ground_truth`.
+
+        Args:
+            ground_truth: (Annotations) Ground truth annotations, labels of the predictions are resolved
+                against its class names.
+            iou_thresholds: (sequence) IoU thresholds, 0.50:0.05:0.95 by default.
+            max_detections: (sequence) Increasing limits on the number of detections per image.
+            area_ranges: (dict) Named (min, max) area ranges, COCO's all/small/medium/large by default.
+        """
+        self.class_names = list(ground_truth.names_mapping)
+        self.iou_thresholds = np.asarray(iou_thresholds, dtype=float)
+        self.recall_thresholds = DEFAULT_RECALL_THRESHOLDS
+        self.max_detections = sorted(max_detections)
+        self.area_ranges = dict(DEFAULT_AREA_RANGES if area_ranges is None else area_ranges)
+        self._area_bounds = np.array(list(self.area_ranges.values()), dtype=float)
+
+        self._gt: Dict[str, Tuple[np.ndarray, np.ndarray, Tuple[int, int]]] = {}
+        for image_name, image_size, boxes, labels in ground_truth._iter_records():
+            label_ids = np.array([ground_truth.label2id(label) for label in labels], dtype=int)
+            self._gt[image_name] = (boxes, label_ids, image_size)
+        self._predictions: Dict[str, List[Tuple[np.ndarray, np.ndarray, np.ndarray]]] = {}
+        self._results: Dict[str, _ImageResult] = {}
+        self.precision = None
+        self.recall = None
+
+    def reset(self) -> None:
+        """
+        Removes all predictions, the ground truth is kept.
+        """
+        self._predictions.clear()
+        self._results.clear()
+        self.precision = self.recall = None
+
+    def update(
+        self,
+        image_name: str,
+        boxes,
+        scores,
+        labels,
+        bbox_type: str = "coco",
+        image_size: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """
+        Adds predictions of an image. May be called repeatedly, also for the same image.
+
+        Args:
+            image_name: (str) Name of the image, images not in the ground truth have no objects.
+            boxes: (array-like) Predicted boxes of shape (n, 4) in `bbox_type`, kept at subpixel precision.
+            scores: (array-like) Confidence scores of shape (n,).
+            labels: (array-like) Label names or label ids of the ground truth. Unknown label names are ignored.
+            bbox_type: (str) Format of `boxes`.
+            image_size: (tuple(int,int)) Image size for normalized formats, taken from the ground truth if
+                not given.
+        """
+        scores = np.asarray(scores, dtype=float).reshape(-1)
+        labels = np.asarray(labels).reshape(-1)
+        if len(scores) == 0:
+            self._results.pop(image_name, None)
+            self._predictions.setdefault(image_name, [])
+            return
+        if image_size is None and image_name in self._gt:
+            image_size = self._gt[image_name][2]
+        boxes = ops.to_voc_array(np.reshape(boxes, (-1, 4)), bbox_type, image_size, round_values=False)
+        if not len(boxes) == len(scores) == len(labels):
+            raise ValueError("'boxes', 'scores' and 'labels' must have the same length.")
+        if labels.dtype.kind in ("U", "S", "O"):
+            mapping = {name: label_id for label_id, name in enumerate(self.class_names)}
+            labels = np.array([mapping.get(label, -1) for label in labels.tolist()], dtype=int)
+        known = (labels >= 0) & (labels < len(self.class_names))
+        self._predictions.setdefault(image_name, []).append((boxes[known], scores[known], labels[known]))
+        self._results.pop(image_name, None)
+
+    def _predictions_of(self, image_name: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        predictions = self._predictions.get(image_name, [])
+        if not predictions:
+            return np.empty((0, 4)), np.empty(0), np.empty(0, dtype=int)
+        return tuple(np.concatenate(arrays) for arrays in zip(*predictions))
+
+    def _evaluate_image(self, image_name: str) -> _ImageResult:
+        if image_name in self._gt:
+            gt_boxes, gt_labels, _ = self._gt[image_name]
+        else:
+            gt_boxes, gt_labels = np.empty((0, 4)), np.empty(0, dtype=int)
+        dt_boxes, dt_scores, dt_labels = self._predictions_of(image_name)
+
+        # Detections grouped by category in descending score order, at most max_detections[-1] per category
+        order = np.lexsort((-dt_scores, dt_labels))
+        starts = np.searchsorted(dt_labels[order], dt_labels[order], side="left")
+        ranks = np.arange(len(order)) - starts
+        order, ranks = order[ranks < self.max_detections[-1]], ranks[ranks < self.max_detections[-1]]
+        dt_boxes, dt_scores, dt_labels = dt_boxes[order], dt_scores[order], dt_labels[order]
+
+        # Categories never match each other, so all categories of the image are matched in a single pass
+        ious = ops.pairwise(ops.box_iou, dt_boxes, gt_boxes)
+        ious[dt_labels[:, None] != gt_labels[None]] = -1
+        gt_ignore = _outside(ops.box_area(gt_boxes), self._area_bounds)
+        dt_match = _match(ious, gt_ignore, self.iou_thresholds)
+
+        num_thresholds = len(self.iou_thresholds)
+        matched = dt_match >= 0
+        ignored = np.zeros_like(matched)
+        if len(gt_boxes):
+            # Detections matched to ignored ground truths are ignored as well
+            row_ignore = np.repeat(gt_ignore, num_thresholds, axis=0)
+            ignored = np.take_along_axis(row_ignore, np.maximum(dt_match, 0), axis=1) & matched
+        ignored |= ~matched & np.repeat(_outside(ops.box_area(dt_boxes), self._area_bounds), num_thresholds, axis=0)
+        num_gt = np.stack(
+            [np.bincount(gt_labels[~area_ignore], minlength=len(self.class_names)) for area_ignore in gt_ignore]
+        )
+        return _ImageResult(
+            scores=dt_scores, labels=dt_labels, ranks=ranks, matched=matched, ignored=ignored, num_gt=num_gt
+        )
+
+    def _accumulate(self) -> None:
+        num_thresholds, num_classes = len(self.iou_thresholds), len(self.class_names)
+        shape = (num_thresholds, num_classes, len(self.area_ranges), len(self.max_detections))
+        precision = -np.ones(shape[:1] + (len(self.recall_thresholds),) + shape[1:])
+        recall = -np.ones(shape)
+
+        results = []
+        for image_name in list(self._gt) + [name for name in self._predictions if name not in self._gt]:
+            if image_name not in self._results:
+                self._results[image_name] = self._evaluate_image(image_name)
+            results.append(self._results[image_name])
+        num_gt = np.sum([result.num_gt for result in results], axis=0)
+        scores = np.concatenate([result.scores for result in results])
+        labels = np.concatenate([result.labels for result in results])
+        ranks = np.concatenate([result.ranks for result in results])
+        matched = np.concatenate([result.matched for result in results], axis=1)
+        ignored = np.concatenate([result.ignored for result in results], axis=1)
+        # Stable, so ties keep the image order as in COCOeval
+        order = np.lexsort((-scores, labels))
+
+        for m, max_det in enumerate(self.max_detections):
+            selected = order[ranks[order] < max_det]
+            bounds = np.searchsorted(labels[selected], np.arange(num_classes + 1))
+            tps = np.cumsum(matched[:, selected] & ~ignored[:, selected], axis=1, dtype=float)
+            fps = np.cumsum(~matched[:, selected] & ~ignored[:, selected], axis=1, dtype=float)
+            for a, k in zip(*np.nonzero(num_gt)):
+                rows, start, end = slice(a * num_thresholds, (a + 1) * num_thresholds), bounds[k], bounds[k + 1]
+                # Cumulative sums restricted to the segment of category k
+                tp = tps[rows, start:end] - (tps[rows, start - 1 : start] if start else 0)
+                fp = fps[rows, start:end] - (fps[rows, start - 1 : start] if start else 0)
+                rc = tp / num_gt[a, k]
+                pr = tp / (fp + tp + np.spacing(1))
+                # Interpolated precision, the maximum precision at any higher recall
+                pr = np.flip(np.maximum.accumulate(np.flip(pr, axis=1), axis=1), axis=1)
+                recall[:, k, a, m] = rc[:, -1] if end > start else 0
+                for t in range(num_thresholds):
+                    indices = np.searchsorted(rc[t], self.recall_thresholds, side="left")
+                    valid = indices < end - start
+                    precision[t, :, k, a, m] = 0
+                    precision[t, valid, k, a, m] = pr[t, indices[valid]]
+        self.precision, self.recall = precision, recall
+
+    def _summarize(self, ap: bool, iou_threshold: float = None, area: str = "all", max_det: int = None) -> float:
+        a = list(self.area_ranges).index(area)
+        m = self.max_detections.index(max_det if max_det is not None else self.max_detections[-1])
+        values = self.precision[..., a, m] if ap else self.recall[..., a, m]
+        if iou_threshold is not None:
+            values = values[np.isclose(self.iou_thresholds, iou_threshold)]
+        values = values[values > -1]
+        return float(np.mean(values)) if values.size else -1.0
+
+    def compute(self) -> Dict[str, float]:
+        """
+        Evaluates the predictions added so far. Only images updated since the last call are re-matched.
+
+        Returns:
+            Summary metrics in the order of COCOeval's `stats`: 'AP' (averaged over IoU thresholds), 'AP50',
+            'AP75', 'AP_<area>' for the named area ranges, 'AR<max_det>' for the detection limits and
+            'AR_<area>'. Metrics without ground truth are -1. The full precision (T, R, K, A, M) and recall
+            (T, K, A, M) arrays are available as `precision` and `recall` attributes.
+        """
+        self._accumulate()
+        summary = {"AP": self._summarize(ap=True)}
+        for iou_threshold in (0.5, 0.75):
+            if np.isclose(self.iou_thresholds, iou_threshold).any():
+                summary[f"AP{round(iou_threshold * 100)}"] = self._summarize(ap=True, iou_threshold=iou_threshold)
+        for area in list(self.area_ranges)[1:]:
+            summary[f"AP_{area}"] = self._summarize(ap=True, area=area)
+        for max_det in self.max_detections:
+            summary[f"AR{max_det}"] = self._summarize(ap=False, max_det=max_det)
+        for area in list(self.area_ranges)[1:]:
+            summary[f"AR_{area}"] = self._summarize(ap=False, area=area)
+        return summary
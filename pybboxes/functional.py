@@ -1,10 +1,28 @@
-from typing import Tuple, Union
+import itertools
+from typing import Sequence, Tuple, Union
 
+import numpy as np
+
+from pybboxes import cache, instrumentation, ops
 from pybboxes._typing import BboxType, GenericBboxType
 from pybboxes.boxes.base import BaseBoundingBox
 from pybboxes.boxes.bbox import load_bbox
 
 
+def _load_and_convert(
+    values: GenericBboxType,
+    from_type: str,
+    to_type: str,
+    image_size: Tuple[int, int] = None,
+    return_values: bool = False,
+    **kwargs,
+) -> Union[BboxType, BaseBoundingBox]:
+    bbox = load_bbox(name=from_type, values=values, image_size=image_size, **kwargs)
+    target_bbox = getattr(bbox, f"to_{to_type}")()
+    return target_bbox.values if return_values else target_bbox
+
+
+@instrumentation.timed("convert_bbox")
 def convert_bbox(
     bbox: GenericBboxType,
     from_type: str = None,
@@ -32,7 +50,16 @@ def convert_bbox(
     if not isinstance(bbox, BaseBoundingBox):
         if not from_type:
             raise ValueError("if `bbox` is not a BoundingBox object, `from_type` is required.")
+        key = cache.values_key(bbox, from_type, to_type, image_size, kwargs) if cache.enabled() else None
+        if key is not None:
+            instrumentation.record_conversion(from_type, to_type)
+            return cache.lookup(
+                key,
+                lambda values_only: _load_and_convert(bbox, from_type, to_type, image_size, values_only, **kwargs),
+                return_values,
+            )
         bbox = load_bbox(name=from_type, values=bbox, image_size=image_size, **kwargs)
+    instrumentation.record_conversion(from_type or bbox.name, to_type)
     source_to_target = getattr(bbox, f"to_{to_type}")
     target_bbox = source_to_target()
     if return_values:
@@ -40,58 +67,212 @@ def convert_bbox(
     return target_bbox
 
 
+def _is_single_box(*bboxes: GenericBboxType) -> bool:
+    return all(np.ndim(bbox) == 1 for bbox in bboxes)
+
+
+def _load_voc_arrays(*bboxes: GenericBboxType, bbox_type: str, image_size=None, strict: bool = False):
+    return [ops.load_voc_array(bbox, bbox_type, image_size=image_size, strict=strict) for bbox in bboxes]
+
+
 def compute_intersection(bbox1: GenericBboxType, bbox2: GenericBboxType, bbox_type: str = "coco", **kwargs):
     """
-    Computes intersection area between given bounding boxes.
+    Computes intersection area between given bounding boxes. Arrays of boxes of shape (N, 4), or any shapes
+    broadcastable against each other, are computed elementwise in a single pass.
 
     Args:
-        bbox1: Bounding box 1.
-        bbox2: Bounding box 2.
+        bbox1: Bounding box 1, or an array of boxes.
+        bbox2: Bounding box 2, or an array of boxes.
         bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+        **kwargs: `image_size` and `strict`. For arrays, `image_size` can also be given per box with
+            shape (..., 2).
 
     Returns:
-        Intersection area if bounding boxes intersect, 0 otherwise.
+        Intersection area if bounding boxes intersect, 0 otherwise. An integer array of the broadcast
+        shape for arrays of boxes.
     """
-    bbox1 = load_bbox(name=bbox_type, values=bbox1, **kwargs)
-    bbox2 = load_bbox(name=bbox_type, values=bbox2, **kwargs)
-    return bbox1 * bbox2
+    if _is_single_box(bbox1, bbox2):
+        bbox1 = load_bbox(name=bbox_type, values=bbox1, **kwargs)
+        bbox2 = load_bbox(name=bbox_type, values=bbox2, **kwargs)
+        return bbox1 * bbox2
+    boxes1, boxes2 = _load_voc_arrays(bbox1, bbox2, bbox_type=bbox_type, **kwargs)
+    return ops.box_intersection(boxes1, boxes2).astype(int)
 
 
 def compute_area(bbox: GenericBboxType, bbox_type: str = "coco", **kwargs):
     """
-    Computes the area of given bounding box.
+    Computes the area of given bounding box, or the areas of an array of boxes of shape (N, 4).
     """
-    return compute_intersection(bbox, bbox, bbox_type, **kwargs)
+    if _is_single_box(bbox):
+        return load_bbox(name=bbox_type, values=bbox, **kwargs).area
+    (boxes,) = _load_voc_arrays(bbox, bbox_type=bbox_type, **kwargs)
+    return ops.box_area(boxes).astype(int)
 
 
 def compute_union(bbox1: GenericBboxType, bbox2: GenericBboxType, bbox_type: str = "coco", **kwargs):
     """
-    Computes union area of given boxes.
+    Computes union area of given boxes. Arrays of boxes are computed elementwise, see
+    :py:func:`compute_intersection`.
 
     Args:
-        bbox1: Bounding box 1.
-        bbox2: Bounding box 2.
+        bbox1: Bounding box 1, or an array of boxes.
+        bbox2: Bounding box 2, or an array of boxes.
         bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
 
     Returns:
         Union area.
     """
-    intersection = compute_intersection(bbox1, bbox2, bbox_type=bbox_type, **kwargs)
-    area1 = compute_area(bbox1, bbox_type=bbox_type, **kwargs)
-    area2 = compute_area(bbox2, bbox_type=bbox_type, **kwargs)
-    return area1 + area2 - intersection
+    if _is_single_box(bbox1, bbox2):
+        bbox1 = load_bbox(name=bbox_type, values=bbox1, **kwargs)
+        bbox2 = load_bbox(name=bbox_type, values=bbox2, **kwargs)
+        return bbox1 + bbox2
+    boxes1, boxes2 = _load_voc_arrays(bbox1, bbox2, bbox_type=bbox_type, **kwargs)
+    return ops.box_union(boxes1, boxes2).astype(int)
+
+
+def _compute_iou_metric(
+    metric: str, bbox1: GenericBboxType, bbox2: GenericBboxType, bbox_type: str = "coco", **kwargs
+) -> Union[float, np.ndarray]:
+    if _is_single_box(bbox1, bbox2):
+        bbox1 = load_bbox(name=bbox_type, values=bbox1, **kwargs)
+        bbox2 = load_bbox(name=bbox_type, values=bbox2, **kwargs)
+        return getattr(bbox1, metric)(bbox2)
+    boxes1, boxes2 = _load_voc_arrays(bbox1, bbox2, bbox_type=bbox_type, **kwargs)
+    return ops.IOU_METRICS[metric](boxes1, boxes2)
 
 
 def compute_iou(bbox1: GenericBboxType, bbox2: GenericBboxType, bbox_type: str = "coco", **kwargs):
     """
-    Computes Intersection over Union (IoU) (special form of Jaccard Index) metric.
+    Computes Intersection over Union (IoU) (special form of Jaccard Index) metric. Arrays of boxes are
+    computed elementwise, see :py:func:`compute_intersection`.
 
     Args:
-        bbox1: Bounding box 1.
-        bbox2: Bounding box 2.
+        bbox1: Bounding box 1, or an array of boxes.
+        bbox2: Bounding box 2, or an array of boxes.
         bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
 
     Returns:
-        Intersection over Union ratio.
+        Intersection over Union ratio. For arrays, a float array where pairs with zero union area are NaN.
+    """
+    return _compute_iou_metric("iou", bbox1, bbox2, bbox_type, **kwargs)
+
+
+def compute_giou(bbox1: GenericBboxType, bbox2: GenericBboxType, bbox_type: str = "coco", **kwargs):
+    """
+    Computes Generalized IoU (GIoU), IoU minus the fraction of the smallest enclosing box not covered by
+    the union. Arrays of boxes are computed elementwise, see :py:func:`compute_intersection`.
+
+    Args:
+        bbox1: Bounding box 1, or an array of boxes.
+        bbox2: Bounding box 2, or an array of boxes.
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+
+    Returns:
+        GIoU in [-1, 1].
+    """
+    return _compute_iou_metric("giou", bbox1, bbox2, bbox_type, **kwargs)
+
+
+def compute_diou(bbox1: GenericBboxType, bbox2: GenericBboxType, bbox_type: str = "coco", **kwargs):
+    """
+    Computes Distance IoU (DIoU), IoU minus the squared distance of the box centers normalized by the
+    squared diagonal of the smallest enclosing box. Arrays of boxes are computed elementwise, see
+    :py:func:`compute_intersection`.
+
+    Args:
+        bbox1: Bounding box 1, or an array of boxes.
+        bbox2: Bounding box 2, or an array of boxes.
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+
+    Returns:
+        DIoU in [-1, 1].
+    """
+    return _compute_iou_metric("diou", bbox1, bbox2, bbox_type, **kwargs)
+
+
+def compute_ciou(bbox1: GenericBboxType, bbox2: GenericBboxType, bbox_type: str = "coco", **kwargs):
+    """
+    Computes Complete IoU (CIoU), DIoU additionally penalized by the aspect ratio consistency of the
+    boxes. Arrays of boxes are computed elementwise, see :py:func:`compute_intersection`.
+
+    Args:
+        bbox1: Bounding box 1, or an array of boxes.
+        bbox2: Bounding box 2, or an array of boxes.
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+
+    Returns:
+        CIoU ratio.
+    """
+    return _compute_iou_metric("ciou", bbox1, bbox2, bbox_type, **kwargs)
+
+
+def compute_iou_matrix(
+    boxes1: GenericBboxType,
+    boxes2: GenericBboxType,
+    bbox_type: str = "coco",
+    metric: str = "iou",
+    workers: int = None,
+    threads: int = None,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Computes an IoU metric for all pairs of boxes.
+
+    Args:
+        boxes1: Array of N boxes of shape (N, 4).
+        boxes2: Array of M boxes of shape (M, 4).
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+        metric: One of 'iou', 'giou', 'diou' or 'ciou'.
+        workers: Number of processes to compute the rows on, see :py:mod:`pybboxes.parallel`. Worth it for
+            matrices of tens of millions of pairs and more.
+        threads: Number of threads to compute the rows on, the default of :py:mod:`pybboxes.parallel` if None.
+            Unlike `workers`, safe within multi-threaded applications.
+        **kwargs: `image_size` and `strict`, see :py:func:`compute_intersection`. A per box `image_size`
+            is not supported here as the boxes are paired.
+
+    Returns:
+        Array of shape (N, M).
+    """
+    if metric not in ops.IOU_METRICS:
+        raise ValueError(f"Unsupported metric '{metric}', expected one of {tuple(ops.IOU_METRICS)}.")
+    boxes1, boxes2 = _load_voc_arrays(
+        np.reshape(boxes1, (-1, 4)), np.reshape(boxes2, (-1, 4)), bbox_type=bbox_type, **kwargs
+    )
+    return ops.pairwise(ops.IOU_METRICS[metric], boxes1, boxes2, workers=workers, threads=threads)
+
+
+def pack_polygons(polygons: Sequence[Sequence[Sequence[float]]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packs polygons given as in COCO segmentations into the (coords, offsets) layout. Each item is a list of
+    flat polygons [x1, y1, x2, y2, ...], the parts of an object, whose points are packed together.
+
+    Args:
+        polygons: Polygon parts of each object.
+
+    Returns:
+        Points of shape (P, 2) and point offsets of shape (K + 1,).
+    """
+    lengths = [sum(len(part) for part in parts) // 2 for parts in polygons]
+    coords = np.fromiter(
+        itertools.chain.from_iterable(itertools.chain.from_iterable(polygons)), dtype=float, count=2 * sum(lengths)
+    )
+    return coords.reshape(-1, 2), np.concatenate([[0], np.cumsum(lengths, dtype=int)])
+
+
+def polygons_to_bbox(
+    coords: np.ndarray, offsets: np.ndarray, bbox_type: str = "coco", image_size: Tuple[int, int] = None
+) -> np.ndarray:
+    """
+    Computes the tight bounding boxes of packed polygons, e.g. of segmentation masks.
+
+    Args:
+        coords: Points of all polygons of shape (P, 2), see :py:func:`pack_polygons`.
+        offsets: Point offsets of shape (K + 1,), polygon `i` is `coords[offsets[i]:offsets[i + 1]]`.
+        bbox_type: Format of the resulting bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+        image_size: (tuple(int,int)) Image size as (w, h), or per polygon image sizes of shape (K, 2).
+            Required for the normalized formats.
+
+    Returns:
+        Array of shape (K, 4) in `bbox_type` (not rounded), NaN for polygons without points.
     """
-    return compute_intersection(bbox1, bbox2, bbox_type, **kwargs) / compute_union(bbox1, bbox2, bbox_type, **kwargs)
+    return ops.from_voc_array(ops.polygon_bounds(coords, offsets), bbox_type, image_size, round_values=False)
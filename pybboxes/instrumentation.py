@@ -0,0 +1,136 @@
+"""
+Opt-in instrumentation for pybboxes. Nothing is recorded unless a collector is active:
+
+    from pybboxes import instrumentation
+
+    with instrumentation.collect() as stats:
+        anns.load_from_coco("annotations.json")
+    print(stats.to_json(indent=2))
+
+Recorded are object constructions per class, conversions per format pair, annotation files and bytes read
+and written, and wall time per stage. When no collector is active each hook costs a single global lookup.
+Counters are process local, work done in worker processes (e.g. `pybboxes convert --workers N`) is not
+reflected in the parent's collector.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+_collector: Optional["Collector"] = None
+
+
+class Collector:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.constructions = Counter()
+        self.conversions = Counter()
+        self.io = Counter()
+        self.stage_calls = Counter()
+        self.stage_seconds = defaultdict(float)
+
+    def add_construction(self, class_name: str) -> None:
+        with self._lock:
+            self.constructions[class_name] += 1
+
+    def add_conversion(self, from_type: str, to_type: str, count: int = 1) -> None:
+        with self._lock:
+            self.conversions[f"{from_type}->{to_type}"] += count
+
+    def add_io(self, mode: str, num_bytes: int) -> None:
+        with self._lock:
+            self.io[f"files_{mode}"] += 1
+            self.io[f"bytes_{mode}"] += num_bytes
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_calls[stage] += 1
+            self.stage_seconds[stage] += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a JSON serializable copy of the collected counters.
+        """
+        with self._lock:
+            return {
+                "constructions": dict(self.constructions),
+                "conversions": dict(self.conversions),
+                "io": {key: self.io[key] for key in ("files_read", "bytes_read", "files_written", "bytes_written")},
+                "stages": {
+                    stage: {"calls": self.stage_calls[stage], "seconds": self.stage_seconds[stage]}
+                    for stage in self.stage_calls
+                },
+            }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+
+@contextmanager
+def collect() -> Iterator[Collector]:
+    """
+    Activates a new collector for the duration of the context. Collectors do not nest, the innermost
+    active collector receives the records and the previous one is restored on exit.
+    """
+    global _collector
+    previous = _collector
+    collector = Collector()
+    _collector = collector
+    try:
+        yield collector
+    finally:
+        _collector = previous
+
+
+def enabled() -> bool:
+    return _collector is not None
+
+
+def record_construction(obj: Any) -> None:
+    if _collector is not None:
+        _collector.add_construction(type(obj).__name__)
+
+
+def record_conversion(from_type: str, to_type: str, count: int = 1) -> None:
+    if _collector is not None:
+        _collector.add_conversion(from_type, to_type, count)
+
+
+def record_file_read(fp: str, num_bytes: Optional[int] = None) -> None:
+    """
+    Records a file read. If `num_bytes` is not given, the whole file is assumed to be read.
+    """
+    if _collector is not None:
+        _collector.add_io("read", os.path.getsize(fp) if num_bytes is None else num_bytes)
+
+
+def record_file_written(fp: str) -> None:
+    if _collector is not None:
+        _collector.add_io("written", os.path.getsize(fp))
+
+
+def timed(stage: str) -> Callable:
+    """
+    Decorator accumulating the wall time of the decorated function under `stage`. Times of nested
+    stages are inclusive.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            collector = _collector
+            if collector is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                collector.add_time(stage, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
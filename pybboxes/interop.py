@@ -0,0 +1,63 @@
+"""
+Zero-copy interop of the array backed containers (`BoxArray`, `BoxArray3D`, `RotatedBoxArray`, `AnnotationTable`
+and `Annotations`) with NumPy and DLPack consumers:
+
+    np.asarray(boxes)  # the values array itself
+    torch.from_dlpack(boxes)  # a tensor sharing memory with the values
+    memoryview(boxes)  # buffer protocol (PEP 688), Python 3.12+
+    BoxArray.from_dlpack(tensor, bbox_type="coco", image_size=(640, 480))
+
+Memory is shared, so in-place changes of box arrays on either side are visible on the other. The values of
+`AnnotationTable` and `Annotations` are exported read-only instead, as the tables cache columns derived from them
+(voc boxes, indexes): NumPy consumers get a non-writable array and DLPack consumers a tensor flagged read-only
+(consumers of DLPack < 1.0 cannot be told and get a `BufferError`). Build new annotations from a copy to change
+boxes. Construction from DLPack does not copy for CPU producers of a dtype the container stores as is (see
+:py:mod:`pybboxes.precision`), otherwise the values are cast once.
+"""
+from typing import Any, Tuple
+
+import numpy as np
+
+
+class ArrayInterop:
+    """
+    Mixin exposing the array held at `values` through `__array__`, `__buffer__` and `__dlpack__`.
+    """
+
+    values: np.ndarray
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.values
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            if copy is False:
+                raise ValueError(f"Converting {values.dtype} values to {np.dtype(dtype)} requires a copy.")
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self.values)
+
+    def __dlpack__(self, **kwargs) -> Any:
+        return self.values.__dlpack__(**kwargs)
+
+    def __dlpack_device__(self) -> Tuple[int, int]:
+        return self.values.__dlpack_device__()
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    """
+    Non-writable view of `array`, the flags of `array` itself are left as they are.
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def from_dlpack(x) -> np.ndarray:
+    """
+    NumPy array sharing memory with `x`, a CPU array or tensor implementing `__dlpack__`. Plain arrays and
+    sequences are passed through `np.asarray`.
+    """
+    if hasattr(x, "__dlpack__"):
+        return np.from_dlpack(x)
+    return np.asarray(x)
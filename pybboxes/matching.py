@@ -0,0 +1,225 @@
+"""
+Assignment of boxes between two sets at an IoU threshold, e.g. predictions to ground truths or tracks to
+detections.
+
+    from pybboxes.matching import match_boxes
+
+    result = match_boxes(predictions, ground_truths, bbox_type="coco", iou_threshold=0.5, scores=scores)
+    result.pairs  # (K, 2) indices into predictions and ground_truths
+
+Only overlapping pairs are ever evaluated (see :py:func:`pybboxes.ops.sparse_pairwise_iou`), so large and mostly
+non-overlapping sets do not allocate a dense IoU matrix. Optimal assignment is solved independently for each
+connected component of the overlap graph.
+"""
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pybboxes import ops
+from pybboxes._typing import GenericBboxType
+
+
+class MatchResult(NamedTuple):
+    pairs: np.ndarray
+    ious: np.ndarray
+    unmatched1: np.ndarray
+    unmatched2: np.ndarray
+
+
+def linear_sum_assignment(cost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solves the rectangular linear sum assignment problem (minimum cost), with the shortest augmenting path
+    algorithm (Jonker-Volgenant, as described by Crouse, 2016). Each augmentation is vectorized over columns.
+
+    Args:
+        cost: (np.ndarray) Cost matrix of shape (N, M), entries must be finite.
+
+    Returns:
+        Row and column indices of the optimal assignment, sorted by rows. min(N, M) pairs are assigned.
+    """
+    cost = np.asarray(cost, dtype=float)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    num_rows, num_cols = cost.shape
+    u, v = np.zeros(num_rows), np.zeros(num_cols)
+    col4row, row4col = np.full(num_rows, -1), np.full(num_cols, -1)
+
+    for current_row in range(num_rows):
+        shortest = np.full(num_cols, np.inf)
+        path = np.full(num_cols, -1)
+        visited_rows, visited_cols = np.zeros(num_rows, dtype=bool), np.zeros(num_cols, dtype=bool)
+        min_value, i, sink = 0.0, current_row, -1
+        while sink == -1:
+            visited_rows[i] = True
+            reduced = min_value + cost[i] - u[i] - v
+            improved = ~visited_cols & (reduced < shortest)
+            path[improved] = i
+            shortest[improved] = reduced[improved]
+            remaining = np.where(visited_cols, np.inf, shortest)
+            min_value = remaining.min()
+            ties = np.flatnonzero(remaining == min_value)
+            # Prefer an unassigned column on ties, which ends the search
+            free = ties[row4col[ties] == -1]
+            j = free[0] if len(free) else ties[0]
+            visited_cols[j] = True
+            if row4col[j] == -1:
+                sink = j
+            else:
+                i = row4col[j]
+
+        u[current_row] += min_value
+        others = visited_rows.copy()
+        others[current_row] = False
+        u[others] += min_value - shortest[col4row[others]]
+        v[visited_cols] -= min_value - shortest[visited_cols]
+
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == current_row:
+                break
+
+    rows, cols = np.arange(num_rows), col4row
+    if transposed:
+        order = np.argsort(cols)
+        rows, cols = cols[order], rows[order]
+    return rows, cols
+
+
+def _connected_components(rows: np.ndarray, cols: np.ndarray, num_rows: int, num_cols: int) -> np.ndarray:
+    """
+    Component labels of the edges of a bipartite graph, by min-label propagation over the edges.
+    """
+    labels = np.arange(num_rows + num_cols)
+    cols = cols + num_rows
+    while True:
+        edge_labels = np.minimum(labels[rows], labels[cols])
+        updated = labels.copy()
+        np.minimum.at(updated, rows, edge_labels)
+        np.minimum.at(updated, cols, edge_labels)
+        # Pointer jumping to shortcut long chains
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels[rows]
+        labels = updated
+
+
+def _greedy(rows: np.ndarray, cols: np.ndarray, ious: np.ndarray, priority: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Scans the candidate pairs in order and keeps pairs whose boxes are both unmatched. With `priority`, rows
+    are processed in priority order, each taking its highest IoU unmatched column, otherwise pairs are taken
+    in descending IoU.
+    """
+    if priority is None:
+        order = np.argsort(-ious, kind="stable")
+    else:
+        order = np.lexsort((-ious, priority[rows]))
+    matched_rows, matched_cols, keep = set(), set(), []
+    for index, row, col in zip(order.tolist(), rows[order].tolist(), cols[order].tolist()):
+        if row in matched_rows or col in matched_cols:
+            continue
+        matched_rows.add(row)
+        matched_cols.add(col)
+        keep.append(index)
+    return np.array(keep, dtype=int)
+
+
+def _hungarian(rows: np.ndarray, cols: np.ndarray, ious: np.ndarray, num_rows: int, num_cols: int) -> np.ndarray:
+    """
+    Maximizes the total IoU of the matched pairs, independently for each connected component.
+    """
+    components = _connected_components(rows, cols, num_rows, num_cols)
+    component_ids, counts = np.unique(components, return_counts=True)
+    # Components of a single pair are trivially matched
+    keep = [np.flatnonzero(np.isin(components, component_ids[counts == 1]))]
+    by_component = np.argsort(components, kind="stable")
+    bounds = np.searchsorted(components[by_component], component_ids[counts > 1])
+    for start, count in zip(bounds.tolist(), counts[counts > 1].tolist()):
+        edges = by_component[start : start + count]
+        sub_rows, row_index = np.unique(rows[edges], return_inverse=True)
+        sub_cols, col_index = np.unique(cols[edges], return_inverse=True)
+        # Non-edges have zero gain, assignments to them are dropped afterwards
+        gain = np.zeros((len(sub_rows), len(sub_cols)))
+        gain[row_index, col_index] = ious[edges]
+        edge_ids = np.full(gain.shape, -1)
+        edge_ids[row_index, col_index] = edges
+        assigned = edge_ids[linear_sum_assignment(-gain)]
+        keep.append(assigned[assigned >= 0])
+    return np.sort(np.concatenate(keep))
+
+
+def sparse_iou(
+    boxes1: GenericBboxType,
+    boxes2: GenericBboxType,
+    bbox_type: str = "coco",
+    min_iou: float = 0.0,
+    image_size: Optional[Tuple[int, int]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    IoU of the overlapping pairs of two box sets in COO form.
+
+    Args:
+        boxes1: Array of N boxes of shape (N, 4).
+        boxes2: Array of M boxes of shape (M, 4).
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+        min_iou: Pairs with IoU below are dropped.
+        image_size: Image size as (w, h), required for the normalized formats.
+
+    Returns:
+        (rows, cols, ious) of the pairs with IoU > 0 and IoU >= `min_iou`.
+    """
+    boxes1 = ops.to_voc_array(np.reshape(boxes1, (-1, 4)), bbox_type, image_size, round_values=False)
+    boxes2 = ops.to_voc_array(np.reshape(boxes2, (-1, 4)), bbox_type, image_size, round_values=False)
+    return ops.sparse_pairwise_iou(boxes1, boxes2, min_iou=min_iou)
+
+
+def match_boxes(
+    boxes1: GenericBboxType,
+    boxes2: GenericBboxType,
+    bbox_type: str = "coco",
+    iou_threshold: float = 0.5,
+    method: str = "greedy",
+    scores: Optional[Sequence[float]] = None,
+    image_size: Optional[Tuple[int, int]] = None,
+) -> MatchResult:
+    """
+    Assigns boxes of `boxes1` to boxes of `boxes2` one-to-one, pairs must have IoU >= `iou_threshold`.
+
+    Args:
+        boxes1: Array of N boxes of shape (N, 4), e.g. predictions.
+        boxes2: Array of M boxes of shape (M, 4), e.g. ground truths.
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+        iou_threshold: Minimum IoU of a matched pair.
+        method: 'greedy' or 'hungarian'. Greedy matching processes `boxes1` in descending `scores`, each
+            taking its highest IoU unmatched box, or the pairs in descending IoU if no scores are given.
+            Hungarian matching maximizes the total IoU of the matched pairs.
+        scores: Scores of `boxes1` for greedy matching.
+        image_size: Image size as (w, h), required for the normalized formats.
+
+    Returns:
+        MatchResult of the (K, 2) matched index pairs sorted by the index into `boxes1`, their IoUs and the
+        indices of the unmatched boxes of both sets.
+    """
+    if method not in ("greedy", "hungarian"):
+        raise ValueError(f"Unsupported matching method '{method}', expected one of ('greedy', 'hungarian').")
+    num_boxes1, num_boxes2 = len(np.reshape(boxes1, (-1, 4))), len(np.reshape(boxes2, (-1, 4)))
+    rows, cols, ious = sparse_iou(boxes1, boxes2, bbox_type, min_iou=iou_threshold, image_size=image_size)
+
+    if method == "hungarian":
+        keep = _hungarian(rows, cols, ious, num_boxes1, num_boxes2)
+    else:
+        priority = None
+        if scores is not None:
+            priority = np.argsort(np.argsort(-np.asarray(scores, dtype=float), kind="stable"))
+        keep = _greedy(rows, cols, ious, priority)
+    keep = keep[np.argsort(rows[keep], kind="stable")]
+    rows, cols, ious = rows[keep], cols[keep], ious[keep]
+    return MatchResult(
+        pairs=np.stack([rows, cols], axis=-1),
+        ious=ious,
+        unmatched1=np.setdiff1d(np.arange(num_boxes1), rows),
+        unmatched2=np.setdiff1d(np.arange(num_boxes2), cols),
+    )
@@ -0,0 +1,608 @@
+"""
+Vectorized kernels operating on arrays of boxes of shape (..., 4). Boxes are brought to VOC format with the
+same rounding as the box classes, so the results agree with the scalar API row by row. Kernels of 3D boxes
+operate on arrays of shape (..., 6) in corners format.
+
+float32 and float64 boxes are computed in their own precision, other inputs in float64. See
+:py:mod:`pybboxes.precision` for the storage dtypes and rounding of the conversions.
+"""
+from functools import partial
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from pybboxes import parallel, precision
+from pybboxes.boxes.base import NORMALIZED_BOXES
+
+BOX_TYPES = ("albumentations", "coco", "fiftyone", "voc", "yolo")
+
+
+def _check_bbox_type(bbox_type: str) -> None:
+    if bbox_type not in BOX_TYPES:
+        raise ValueError(f"Unsupported bbox type '{bbox_type}', expected one of {BOX_TYPES}.")
+
+
+def _image_sides(
+    image_size: Union[Tuple[int, int], np.ndarray], dtype: np.dtype = np.float64
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Splits a single (w, h) image size or an array of image sizes of shape (..., 2) broadcastable to the boxes,
+    in the compute `dtype` of the boxes so that float32 boxes are not upcast.
+    """
+    image_size = np.asarray(image_size, dtype=dtype)
+    if image_size.shape[-1:] != (2,):
+        raise ValueError(f"'image_size' must be given as (w, h) at dim -1, got shape {image_size.shape}.")
+    return image_size[..., 0], image_size[..., 1]
+
+
+def _thread_rows(kernel, boxes: np.ndarray, image_size, dtype: np.dtype, threads: Optional[int]) -> np.ndarray:
+    """
+    Runs `kernel(boxes, image_size)` over row chunks of boxes of shape (..., 4) on the thread pool of
+    :py:mod:`pybboxes.parallel`, per box image sizes are chunked along.
+    """
+    shape = boxes.shape
+    chunked = [boxes.reshape(-1, 4)]
+    shared = (image_size,)
+    if image_size is not None and np.ndim(image_size) > 1:
+        chunked.append(np.broadcast_to(image_size, (*shape[:-1], 2)).reshape(-1, 2))
+        shared = ()
+    return parallel.thread_map_rows(kernel, chunked, shared, (4,), dtype, threads).reshape(shape)
+
+
+def as_box_array(boxes) -> np.ndarray:
+    boxes = np.asarray(boxes)
+    boxes = boxes.astype(precision.compute_dtype(boxes), copy=False)
+    if boxes.shape[-1:] != (4,):
+        raise ValueError(f"Given input array must have bounding box values at dim -1 as 4, got shape {boxes.shape}.")
+    return boxes
+
+
+def to_voc_array(
+    boxes,
+    bbox_type: str,
+    image_size: Optional[Union[Tuple[int, int], np.ndarray]] = None,
+    round_values: bool = True,
+    dtype: Optional[np.dtype] = None,
+    threads: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Converts boxes of shape (..., 4) in `bbox_type` to VOC format.
+
+    Args:
+        boxes: (array-like) Boxes with values at dim -1.
+        bbox_type: (str) Format of the given boxes.
+        image_size: (tuple(int,int) or array) Image size as (w, h), or per box image sizes of shape (..., 2).
+            Required for the normalized formats.
+        round_values: (bool) Whether to round the values to integers as in `to_voc` of the box classes. If
+            False, subpixel coordinates (e.g. of predictions) are kept as is.
+        dtype: (dtype) Dtype of the result, the compute dtype of the boxes by default. Values are rounded for
+            integer dtypes regardless of `round_values`, see :py:func:`pybboxes.precision.cast`.
+        threads: (int) Number of threads to convert row chunks on, the default of :py:mod:`pybboxes.parallel`
+            if None.
+
+    Returns:
+        Array of VOC boxes.
+    """
+    _check_bbox_type(bbox_type)
+    boxes = as_box_array(boxes)
+    if parallel.resolve_threads(threads) > 1:
+        return _thread_rows(
+            lambda chunk, sizes: to_voc_array(chunk, bbox_type, sizes, round_values, dtype, threads=1),
+            boxes,
+            image_size,
+            boxes.dtype if dtype is None else np.dtype(dtype),
+            threads,
+        )
+    v1, v2, v3, v4 = np.moveaxis(boxes, -1, 0)
+    if bbox_type in NORMALIZED_BOXES:
+        if image_size is None:
+            raise ValueError("'image_size' is required for conversion.")
+        image_width, image_height = _image_sides(image_size, boxes.dtype)
+        if bbox_type == "albumentations":
+            x_tl, y_tl, x_br, y_br = v1 * image_width, v2 * image_height, v3 * image_width, v4 * image_height
+        else:
+            if bbox_type == "yolo":
+                v1, v2 = v1 - v3 / 2, v2 - v4 / 2
+            x_tl, y_tl = v1 * image_width, v2 * image_height
+            x_br, y_br = x_tl + v3 * image_width, y_tl + v4 * image_height
+    elif bbox_type == "coco":
+        if round_values:
+            v1, v2, v3, v4 = np.rint(v1), np.rint(v2), np.rint(v3), np.rint(v4)
+        x_tl, y_tl, x_br, y_br = v1, v2, v1 + v3, v2 + v4
+    else:
+        x_tl, y_tl, x_br, y_br = v1, v2, v3, v4
+    voc_boxes = np.stack([x_tl, y_tl, x_br, y_br], axis=-1)
+    # np.rint rounds half to even as the builtin round() used by the box classes.
+    voc_boxes = np.rint(voc_boxes) if round_values else voc_boxes
+    return voc_boxes if dtype is None else precision.cast(voc_boxes, precision.storage_dtype("voc", voc_boxes, dtype))
+
+
+def from_voc_array(
+    boxes,
+    bbox_type: str,
+    image_size: Optional[Union[Tuple[int, int], np.ndarray]] = None,
+    round_values: bool = True,
+    dtype: Optional[np.dtype] = None,
+    threads: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Converts VOC boxes of shape (..., 4) to `bbox_type`, the inverse of :py:func:`to_voc_array`.
+
+    Args:
+        boxes: (array-like) VOC boxes with values at dim -1.
+        bbox_type: (str) Target format.
+        image_size: (tuple(int,int) or array) Image size as (w, h), or per box image sizes of shape (..., 2).
+            Required for the normalized formats.
+        round_values: (bool) Whether to round the values of the pixel formats (coco, voc) to integers as
+            the box classes do.
+        dtype: (dtype) Dtype of the result, the compute dtype of the boxes by default. Integer dtypes are only
+            valid for the pixel formats and always round, see :py:func:`pybboxes.precision.cast`.
+        threads: (int) Number of threads to convert row chunks on, the default of :py:mod:`pybboxes.parallel`
+            if None.
+
+    Returns:
+        Array of boxes in `bbox_type`.
+    """
+    _check_bbox_type(bbox_type)
+    boxes = as_box_array(boxes)
+    if parallel.resolve_threads(threads) > 1:
+        return _thread_rows(
+            lambda chunk, sizes: from_voc_array(chunk, bbox_type, sizes, round_values, dtype, threads=1),
+            boxes,
+            image_size,
+            boxes.dtype if dtype is None else precision.storage_dtype(bbox_type, boxes, dtype),
+            threads,
+        )
+    x_tl, y_tl, x_br, y_br = np.moveaxis(boxes, -1, 0)
+    if bbox_type in NORMALIZED_BOXES:
+        if image_size is None:
+            raise ValueError(f"'image_size' is required for conversion to {bbox_type}.")
+        image_width, image_height = _image_sides(image_size, boxes.dtype)
+        x_tl, y_tl, x_br, y_br = x_tl / image_width, y_tl / image_height, x_br / image_width, y_br / image_height
+    if bbox_type in ("albumentations", "voc"):
+        values = (x_tl, y_tl, x_br, y_br)
+    elif bbox_type == "yolo":
+        w, h = x_br - x_tl, y_br - y_tl
+        values = (x_tl + w / 2, y_tl + h / 2, w, h)
+    else:
+        values = (x_tl, y_tl, x_br - x_tl, y_br - y_tl)
+    boxes = np.stack(values, axis=-1)
+    boxes = np.rint(boxes) if round_values and bbox_type in ("coco", "voc") else boxes
+    return boxes if dtype is None else precision.cast(boxes, precision.storage_dtype(bbox_type, boxes, dtype))
+
+
+def validate_voc_array(
+    boxes: np.ndarray, image_size: Optional[Union[Tuple[int, int], np.ndarray]] = None, strict: bool = False
+) -> None:
+    """
+    Raises ValueError for malformed VOC boxes, and for out of bounds boxes if `strict` is True.
+    """
+    x_tl, y_tl, x_br, y_br = np.moveaxis(boxes, -1, 0)
+    if np.any((x_tl > x_br) | (y_tl > y_br)):
+        raise ValueError("Incorrect BoundingBox format. Must be in type [x-tl, y-tl, x-br, y-br].")
+    if not strict:
+        return
+    oob = (x_tl < 0) | (y_tl < 0) | (x_tl >= x_br) | (y_tl >= y_br)
+    if image_size is not None:
+        image_width, image_height = _image_sides(image_size)
+        oob |= (x_br > image_width) | (y_br > image_height)
+    if np.any(oob):
+        raise ValueError(
+            "Given bounding box values is out of bounds. To silently skip out of bounds cases pass 'strict=False'."
+        )
+
+
+def load_voc_array(
+    boxes,
+    bbox_type: str,
+    image_size: Optional[Union[Tuple[int, int], np.ndarray]] = None,
+    strict: bool = False,
+) -> np.ndarray:
+    """
+    :py:func:`to_voc_array` followed by :py:func:`validate_voc_array`.
+    """
+    voc_boxes = to_voc_array(boxes, bbox_type, image_size)
+    validate_voc_array(voc_boxes, image_size, strict)
+    return voc_boxes
+
+
+def box_area(boxes: np.ndarray) -> np.ndarray:
+    """
+    Areas of VOC boxes of shape (..., 4).
+    """
+    return (boxes[..., 2] - boxes[..., 0]) * (boxes[..., 3] - boxes[..., 1])
+
+
+def polygon_bounds(coords: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Tight VOC boxes of packed polygons by segment reductions, polygon `i` is the points
+    `coords[offsets[i]:offsets[i + 1]]`.
+
+    Args:
+        coords: (np.ndarray) Points of all polygons of shape (P, 2), or flat as [x1, y1, x2, y2, ...].
+        offsets: (np.ndarray) Non-decreasing point offsets of shape (K + 1,).
+
+    Returns:
+        Float array of shape (K, 4), NaN for polygons without points.
+    """
+    offsets = np.asarray(offsets, dtype=int)
+    coords = np.asarray(coords, dtype=float).reshape(-1, 2)[: offsets[-1]]
+    starts = offsets[:-1]
+    non_empty = offsets[1:] > starts
+    bounds = np.full((len(starts), 4), np.nan)
+    if non_empty.any():
+        # Segments run to the next given start, dropping the empty ones keeps them contiguous
+        starts = starts[non_empty]
+        bounds[non_empty, :2] = np.minimum.reduceat(coords, starts, axis=0)
+        bounds[non_empty, 2:] = np.maximum.reduceat(coords, starts, axis=0)
+    return bounds
+
+
+def box_shift(boxes: np.ndarray, amount) -> np.ndarray:
+    """
+    Shifts VOC boxes of shape (..., 4) by `amount` (dx, dy) in pixels, or per box amounts of shape (..., 2), as
+    `shift` of the box classes.
+    """
+    amount = np.asarray(amount, dtype=precision.compute_dtype(boxes))
+    return boxes + np.concatenate([amount, amount], axis=-1)
+
+
+def box_clamp(
+    boxes: np.ndarray, image_size: Union[Tuple[int, int], np.ndarray], threads: Optional[int] = None
+) -> np.ndarray:
+    """
+    Clamps VOC boxes of shape (..., 4) to the image borders as `clamp` of the box classes, `image_size` is a
+    single (w, h) or per box image sizes of shape (..., 2). Row chunks are clamped on `threads` threads.
+    """
+    if parallel.resolve_threads(threads) > 1:
+        boxes = np.asarray(boxes)
+        dtype = np.result_type(boxes.dtype, precision.compute_dtype(boxes))
+        return _thread_rows(lambda chunk, sizes: box_clamp(chunk, sizes, threads=1), boxes, image_size, dtype, threads)
+    image_width, image_height = _image_sides(image_size, precision.compute_dtype(boxes))
+    x_tl, y_tl, x_br, y_br = np.moveaxis(boxes, -1, 0)
+    return np.stack(
+        [np.maximum(x_tl, 0), np.maximum(y_tl, 0), np.minimum(x_br, image_width), np.minimum(y_br, image_height)],
+        axis=-1,
+    )
+
+
+def box_intersection(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Elementwise intersection areas of VOC boxes, `boxes1` and `boxes2` are broadcast against each other.
+    """
+    # Coordinate-wise, broadcasting over a trailing axis of 2 is much slower in numpy
+    width = np.minimum(boxes1[..., 2], boxes2[..., 2]) - np.maximum(boxes1[..., 0], boxes2[..., 0])
+    height = np.minimum(boxes1[..., 3], boxes2[..., 3]) - np.maximum(boxes1[..., 1], boxes2[..., 1])
+    return np.maximum(width, 0) * np.maximum(height, 0)
+
+
+def box_union(boxes1: np.ndarray, boxes2: np.ndarray, intersection: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Elementwise union areas of VOC boxes, `intersection` can be passed if already computed.
+    """
+    if intersection is None:
+        intersection = box_intersection(boxes1, boxes2)
+    return box_area(boxes1) + box_area(boxes2) - intersection
+
+
+def box_iou(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Elementwise IoU of VOC boxes. Pairs with zero union area yield NaN.
+    """
+    intersection = box_intersection(boxes1, boxes2)
+    union = box_union(boxes1, boxes2, intersection)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return intersection / union
+
+
+def _enclosing_box(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    return np.concatenate(
+        [np.minimum(boxes1[..., :2], boxes2[..., :2]), np.maximum(boxes1[..., 2:], boxes2[..., 2:])], axis=-1
+    )
+
+
+def box_giou(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Elementwise Generalized IoU of VOC boxes, in [-1, 1].
+    """
+    intersection = box_intersection(boxes1, boxes2)
+    union = box_union(boxes1, boxes2, intersection)
+    enclosing_area = box_area(_enclosing_box(boxes1, boxes2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return intersection / union - (enclosing_area - union) / enclosing_area
+
+
+def _center_distance_ratio(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Squared distance of the box centers over the squared diagonal of the enclosing box.
+    """
+    enclosing_box = _enclosing_box(boxes1, boxes2)
+    centers1 = (boxes1[..., :2] + boxes1[..., 2:]) / 2
+    centers2 = (boxes2[..., :2] + boxes2[..., 2:]) / 2
+    center_distance = np.sum((centers1 - centers2) ** 2, axis=-1)
+    diagonal = np.sum((enclosing_box[..., 2:] - enclosing_box[..., :2]) ** 2, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return center_distance / diagonal
+
+
+def box_diou(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Elementwise Distance IoU of VOC boxes, in [-1, 1].
+    """
+    return box_iou(boxes1, boxes2) - _center_distance_ratio(boxes1, boxes2)
+
+
+def box_ciou(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Elementwise Complete IoU of VOC boxes. The aspect ratio term is taken as 0 for boxes of equal aspect
+    ratios.
+    """
+    iou = box_iou(boxes1, boxes2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        aspect1 = np.arctan((boxes1[..., 2] - boxes1[..., 0]) / (boxes1[..., 3] - boxes1[..., 1]))
+        aspect2 = np.arctan((boxes2[..., 2] - boxes2[..., 0]) / (boxes2[..., 3] - boxes2[..., 1]))
+        v = 4 / np.pi**2 * (aspect2 - aspect1) ** 2
+        alpha = np.where(v > 0, v / (1 - iou + v), 0.0)
+    return iou - _center_distance_ratio(boxes1, boxes2) - alpha * v
+
+
+IOU_METRICS = {"iou": box_iou, "giou": box_giou, "diou": box_diou, "ciou": box_ciou}
+
+
+def pairwise(
+    metric, boxes1: np.ndarray, boxes2: np.ndarray, workers: Optional[int] = None, threads: Optional[int] = None
+) -> np.ndarray:
+    """
+    Evaluates an elementwise metric for all pairs of VOC boxes of shapes (N, 4) and (M, 4), returns (N, M).
+    With `workers` > 1 the rows are computed on a shared-memory process pool, see :py:mod:`pybboxes.parallel`,
+    `metric` must be picklable then. Otherwise, row chunks run on `threads` threads.
+    """
+    if workers is not None:
+        if threads is not None:
+            raise ValueError("Only one of 'workers' and 'threads' can be given.")
+        return parallel.map_rows(partial(pairwise, metric), [boxes1], [boxes2], (len(boxes2),), workers=workers)
+    if parallel.resolve_threads(threads) > 1:
+        dtype = np.result_type(precision.compute_dtype(boxes1), precision.compute_dtype(boxes2))
+        return parallel.thread_map_rows(
+            partial(pairwise, metric, threads=1), [boxes1], [boxes2], (len(boxes2),), dtype, threads
+        )
+    return metric(boxes1[:, None], boxes2[None])
+
+
+def sparse_pairwise_iou(
+    boxes1: np.ndarray, boxes2: np.ndarray, min_iou: float = 0.0, block_size: int = 256, metric=None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    IoU of the overlapping pairs of VOC boxes of shapes (N, 4) and (M, 4), without the dense (N, M) matrix.
+    `boxes1` is cut into strips along x and each strip into blocks of at most `block_size` boxes along y, so
+    blocks are compact in both directions. Only the boxes of `boxes2` whose x and y extents can overlap a block
+    are evaluated densely against it. 3D boxes of shape (N, 6) and (M, 6) in corners format are supported as
+    well.
+
+    Returns:
+        (rows, cols, ious) of the pairs with IoU > 0 and IoU >= `min_iou`, sorted by rows then cols.
+    """
+    # The first coordinate of the maximum corner follows the minimum corner
+    x_max, y_max = boxes1.shape[-1] // 2, boxes1.shape[-1] // 2 + 1
+    metric = metric or (box_iou if x_max == 2 else box3d_iou)
+    rows, cols, ious = [], [], []
+    if len(boxes1) and len(boxes2):
+        order2 = np.argsort(boxes2[:, 0], kind="stable")
+        sorted2 = boxes2[order2]
+        max_width2 = np.max(sorted2[:, x_max] - sorted2[:, 0])
+        num_strips = max(int(np.sqrt(len(boxes1) / block_size)), 1)
+        strips = np.array_split(np.argsort(boxes1[:, 0], kind="stable"), num_strips)
+        for strip in strips:
+            strip = strip[np.argsort(boxes1[strip, 1], kind="stable")]
+            for start in range(0, len(strip), block_size):
+                indices1 = strip[start : start + block_size]
+                block1 = boxes1[indices1]
+                # Boxes overlapping a box of the block in x have x-tl in (min x-tl - max width, max x-br)
+                lo = np.searchsorted(sorted2[:, 0], block1[:, 0].min() - max_width2, side="right")
+                hi = np.searchsorted(sorted2[:, 0], block1[:, x_max].max(), side="left")
+                candidates = np.arange(lo, hi)
+                candidates = candidates[
+                    (sorted2[lo:hi, 1] < block1[:, y_max].max()) & (sorted2[lo:hi, y_max] > block1[:, 1].min())
+                ]
+                for col_start in range(0, len(candidates), block_size):
+                    indices2 = candidates[col_start : col_start + block_size]
+                    block_ious = pairwise(metric, block1, sorted2[indices2])
+                    i, j = np.nonzero((block_ious > 0) & (block_ious >= min_iou))
+                    rows.append(indices1[i])
+                    cols.append(order2[indices2[j]])
+                    ious.append(block_ious[i, j])
+    if not rows:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty(0)
+    rows, cols, ious = np.concatenate(rows), np.concatenate(cols), np.concatenate(ious)
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order], ious[order]
+
+
+def box3d_volume(boxes: np.ndarray) -> np.ndarray:
+    """
+    Volumes of 3D boxes of shape (..., 6).
+    """
+    return (boxes[..., 3] - boxes[..., 0]) * (boxes[..., 4] - boxes[..., 1]) * (boxes[..., 5] - boxes[..., 2])
+
+
+def box3d_intersection(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Elementwise intersection volumes of 3D boxes, `boxes1` and `boxes2` are broadcast against each other.
+    """
+    volume = 1
+    for axis in range(3):
+        side = np.minimum(boxes1[..., axis + 3], boxes2[..., axis + 3]) - np.maximum(
+            boxes1[..., axis], boxes2[..., axis]
+        )
+        volume = volume * np.maximum(side, 0)
+    return volume
+
+
+def box3d_iou(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Elementwise IoU of 3D boxes. Pairs with zero union volume yield NaN.
+    """
+    intersection = box3d_intersection(boxes1, boxes2)
+    union = box3d_volume(boxes1) + box3d_volume(boxes2) - intersection
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return intersection / union
+
+
+def to_corners_array(boxes, bbox_type: str) -> np.ndarray:
+    """
+    Converts 3D boxes of shape (..., 6) in `bbox_type` ('corners' or 'center') to corners format.
+    """
+    boxes = np.asarray(boxes, dtype=float)
+    if bbox_type == "corners":
+        return boxes
+    if bbox_type != "center":
+        raise ValueError(f"Unsupported 3D bbox type '{bbox_type}', expected one of ('corners', 'center').")
+    center, half_size = boxes[..., :3], boxes[..., 3:] / 2
+    return np.concatenate([center - half_size, center + half_size], axis=-1)
+
+
+def from_corners_array(boxes, bbox_type: str) -> np.ndarray:
+    """
+    Converts 3D boxes of shape (..., 6) in corners format to `bbox_type`, the inverse of
+    :py:func:`to_corners_array`.
+    """
+    boxes = np.asarray(boxes, dtype=float)
+    if bbox_type == "corners":
+        return boxes
+    if bbox_type != "center":
+        raise ValueError(f"Unsupported 3D bbox type '{bbox_type}', expected one of ('corners', 'center').")
+    return np.concatenate([(boxes[..., :3] + boxes[..., 3:]) / 2, boxes[..., 3:] - boxes[..., :3]], axis=-1)
+
+
+def rotated_to_polygons(boxes: np.ndarray) -> np.ndarray:
+    """
+    Corners of rotated boxes (x-c, y-c, w, h, angle) of shape (..., 5), as polygons of shape (..., 4, 2).
+    `angle` is in radians, the box is rotated by the matrix [[cos, -sin], [sin, cos]] in pixel coordinates,
+    i.e. clockwise on an image with the y axis pointing down. The corners start from the rotated top-left
+    corner and are ordered as top-left, top-right, bottom-right, bottom-left of the unrotated box.
+    """
+    boxes = np.asarray(boxes, dtype=float)
+    center, half_w, half_h, angle = (
+        boxes[..., None, :2],
+        boxes[..., 2, None] / 2,
+        boxes[..., 3, None] / 2,
+        boxes[..., 4],
+    )
+    local_x = np.array([-1, 1, 1, -1]) * half_w
+    local_y = np.array([-1, -1, 1, 1]) * half_h
+    cos, sin = np.cos(angle)[..., None], np.sin(angle)[..., None]
+    return center + np.stack([cos * local_x - sin * local_y, sin * local_x + cos * local_y], axis=-1)
+
+
+def polygons_to_rotated(polygons: np.ndarray) -> np.ndarray:
+    """
+    Rotated boxes of 4-corner polygons of shape (..., 4, 2) ordered as in :py:func:`rotated_to_polygons`,
+    the inverse of it for rectangles. Other quadrilaterals are fitted with the mean of their opposite sides
+    and the angle of the first side.
+    """
+    polygons = np.asarray(polygons, dtype=float)
+    sides = np.roll(polygons, -1, axis=-2) - polygons
+    lengths = np.linalg.norm(sides, axis=-1)
+    width, height = (lengths[..., 0] + lengths[..., 2]) / 2, (lengths[..., 1] + lengths[..., 3]) / 2
+    angle = np.arctan2(sides[..., 0, 1], sides[..., 0, 0])
+    center = polygons.mean(axis=-2)
+    return np.concatenate([center, np.stack([width, height, angle], axis=-1)], axis=-1)
+
+
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def _polygon_area(polygons: np.ndarray) -> np.ndarray:
+    """
+    Signed shoelace areas of polygons of shape (..., K, 2).
+    """
+    return _cross(polygons, np.roll(polygons, -1, axis=-2)).sum(axis=-1) / 2
+
+
+# Distance, relative to the magnitude of the coordinates, within which a vertex counts as on a clipping edge.
+CLIP_TOLERANCE = 1e-9
+
+
+def convex_intersection_area(polygons1: np.ndarray, polygons2: np.ndarray) -> np.ndarray:
+    """
+    Elementwise intersection areas of convex polygons of shapes (..., K1, 2) and (..., K2, 2), broadcast
+    against each other.
+
+    `polygons1` is clipped by the K2 edges of `polygons2` in turn (Sutherland-Hodgman), for all pairs at once:
+    the clipped polygons are kept in fixed size arrays of K1 + K2 vertices with a vertex count, which bounds
+    the vertices of the intersection of two convex polygons. A vertex is kept when it lies within
+    `CLIP_TOLERANCE` (relative to the coordinates) of the inner side of an edge, so that coincident and
+    collinear edges, e.g. of a box and the same box rotated by pi, do not lose corners to rounding noise.
+    """
+    polygons1, polygons2 = np.asarray(polygons1, dtype=float), np.asarray(polygons2, dtype=float)
+    batch_shape = np.broadcast_shapes(polygons1.shape[:-2], polygons2.shape[:-2])
+    clipped = np.broadcast_to(polygons1, batch_shape + polygons1.shape[-2:])
+    polygons2 = np.broadcast_to(polygons2, batch_shape + polygons2.shape[-2:])
+    num_vertices1, num_vertices2 = polygons1.shape[-2], polygons2.shape[-2]
+    max_vertices = num_vertices1 + num_vertices2
+    # Edges are oriented so that the inside of `polygons2` is on their positive side
+    orientation = np.sign(_polygon_area(polygons2))[..., None]
+    scale = np.maximum(np.abs(clipped).max(axis=(-2, -1)), np.abs(polygons2).max(axis=(-2, -1)))
+    count = np.full(batch_shape, num_vertices1)
+    for k in range(num_vertices2):
+        start = polygons2[..., k, :]
+        edge = polygons2[..., (k + 1) % num_vertices2, :] - start
+        tolerance = (CLIP_TOLERANCE * np.maximum(scale, 1) * np.linalg.norm(edge, axis=-1))[..., None]
+        sides = orientation * _cross(edge[..., None, :], clipped - start[..., None, :])
+        positions = np.arange(clipped.shape[-2])
+        valid = positions < count[..., None]
+        following = np.where(positions + 1 < count[..., None], positions + 1, 0)
+        next_vertices = np.take_along_axis(clipped, following[..., None], axis=-2)
+        next_sides = np.take_along_axis(sides, following, axis=-1)
+        inside, next_inside = sides >= -tolerance, next_sides >= -tolerance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip(np.nan_to_num(sides / (sides - next_sides)), 0, 1)
+        crossings = clipped + t[..., None] * (next_vertices - clipped)
+        # Each vertex emits itself if inside, then the crossing of its outgoing edge if it crosses the edge
+        num_candidates = 2 * clipped.shape[-2]
+        candidates = np.stack([clipped, crossings], axis=-2).reshape(batch_shape + (num_candidates, 2))
+        keep = np.stack([valid & inside, valid & (inside != next_inside)], axis=-1)
+        keep = keep.reshape(batch_shape + (num_candidates,))
+        order = np.argsort(~keep, axis=-1, kind="stable")[..., :max_vertices]
+        clipped = np.take_along_axis(candidates, order[..., None], axis=-2)
+        count = np.minimum(keep.sum(axis=-1), max_vertices)
+    # Padding with the first vertex closes the polygon without adding area
+    padded = np.where((np.arange(clipped.shape[-2]) < count[..., None])[..., None], clipped, clipped[..., :1, :])
+    return np.where((count >= 3) & (orientation[..., 0] != 0), np.abs(_polygon_area(padded)), 0.0)
+
+
+def rotated_iou(boxes1: np.ndarray, boxes2: np.ndarray, workers: Optional[int] = None) -> np.ndarray:
+    """
+    Elementwise IoU of rotated boxes (x-c, y-c, w, h, angle) of shape (..., 5), `boxes1` and `boxes2` are
+    broadcast against each other. Pairs with zero union area yield NaN. With `workers` > 1, the broadcast
+    pairs are computed in row chunks on a shared-memory process pool.
+    """
+    boxes1, boxes2 = np.asarray(boxes1, dtype=float), np.asarray(boxes2, dtype=float)
+    if workers is not None:
+        boxes1, boxes2 = np.broadcast_arrays(boxes1, boxes2)
+        shape = boxes1.shape[:-1]
+        pairs = [boxes1.reshape(-1, 5), boxes2.reshape(-1, 5)]
+        return parallel.map_rows(rotated_iou, pairs, workers=workers).reshape(shape)
+    intersection = convex_intersection_area(rotated_to_polygons(boxes1), rotated_to_polygons(boxes2))
+    union = boxes1[..., 2] * boxes1[..., 3] + boxes2[..., 2] * boxes2[..., 3] - intersection
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return intersection / union
+
+
+def pairwise_rotated_iou(boxes1: np.ndarray, boxes2: np.ndarray, workers: Optional[int] = None) -> np.ndarray:
+    """
+    Rotated IoU of all pairs of boxes of shapes (N, 5) and (M, 5), returns (N, M). Only the pairs whose
+    enclosing axis-aligned boxes overlap are clipped, see :py:func:`sparse_pairwise_iou`. With `workers` > 1,
+    row chunks of `boxes1` are computed on a shared-memory process pool.
+    """
+    boxes1, boxes2 = np.reshape(boxes1, (-1, 5)).astype(float), np.reshape(boxes2, (-1, 5)).astype(float)
+    if workers is not None:
+        return parallel.map_rows(pairwise_rotated_iou, [boxes1], [boxes2], (len(boxes2),), workers=workers)
+    polygons1, polygons2 = rotated_to_polygons(boxes1), rotated_to_polygons(boxes2)
+    enclosing1 = np.concatenate([polygons1.min(axis=-2), polygons1.max(axis=-2)], axis=-1)
+    enclosing2 = np.concatenate([polygons2.min(axis=-2), polygons2.max(axis=-2)], axis=-1)
+    rows, cols, _ = sparse_pairwise_iou(enclosing1, enclosing2)
+    ious = np.zeros((len(boxes1), len(boxes2)))
+    ious[rows, cols] = rotated_iou(boxes1[rows], boxes2[cols])
+    return ious
@@ -0,0 +1,274 @@
+"""
+Shared-memory process pool execution for large box batches. Input arrays are copied once into
+`multiprocessing.shared_memory` blocks, workers attach to them by name and write their chunk of the result
+into a preallocated shared output, so no array is pickled between processes:
+
+    iou = compute_iou_matrix(boxes1, boxes2, workers=8)
+
+is run as
+
+    parallel.map_rows(partial(ops.pairwise, ops.box_iou), [voc1], shared=[voc2], out_shape=(len(voc2),), workers=8)
+
+The work is split along the rows (dim 0) of the chunked inputs. `fn` must be picklable (a module level function)
+and return the rows of the output for the given rows of the inputs.
+
+Threads are the alternative where processes cannot be forked (e.g. in a multi-threaded server) or the inputs are
+too small for the copies into shared memory to pay off. NumPy releases the GIL in its kernels, so the conversions
+(`to_voc_array`, `from_voc_array`), `box_clamp` and the IoU matrices of :py:mod:`pybboxes.ops` split their
+inputs into cache sized row chunks run on a shared thread pool, each writing its rows into a preallocated output,
+given `threads=N` or a global default:
+
+    parallel.set_threads(8)
+    boxes.convert("yolo")  # now runs on 8 threads
+    compute_iou_matrix(boxes1, boxes2, threads=4)  # per call
+"""
+import math
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+# (block name, shape, dtype) of a shared array, what is sent to the workers instead of the data.
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+# Output values computed per task of `thread_map_rows`, chunks of this size stay in the L2 cache along with the
+# temporaries of the kernels.
+CHUNK_ELEMENTS = 1 << 16
+
+_threads = 1
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_lock = threading.Lock()
+# Set in the threads of the pool and in worker processes, so that kernels called from a task run inline instead of
+# waiting on the pool.
+_local = threading.local()
+
+
+class SharedArray:
+    """
+    NumPy array backed by a shared memory block. The creating process owns the block and unlinks it on
+    `close`, workers attach to it with :py:meth:`attach`.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype, name: Optional[str] = None):
+        dtype = np.dtype(dtype)
+        self._owner = name is None
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner, size=size if self._owner else 0)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "SharedArray":
+        shared = cls(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    @classmethod
+    def attach(cls, spec: ArraySpec) -> "SharedArray":
+        name, shape, dtype = spec
+        return cls(shape, dtype, name=name)
+
+    @property
+    def spec(self) -> ArraySpec:
+        return self._shm.name, self.array.shape, self.array.dtype.str
+
+    def close(self) -> None:
+        del self.array
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _run_chunk(
+    fn: Callable,
+    chunked: Sequence[ArraySpec],
+    shared: Sequence[ArraySpec],
+    out: ArraySpec,
+    start: int,
+    stop: int,
+    kwargs: dict,
+) -> None:
+    """
+    Unit of work of the worker processes: attaches the shared blocks and writes the output rows [start, stop).
+    """
+    # Worker processes are parallel already, kernels run single threaded in them
+    _local.active = True
+    arrays = [SharedArray.attach(spec) for spec in (*chunked, *shared, out)]
+    try:
+        inputs = [a.array[start:stop] for a in arrays[: len(chunked)]] + [a.array for a in arrays[len(chunked) : -1]]
+        arrays[-1].array[start:stop] = fn(*inputs, **kwargs)
+        # Views of the blocks must be released before they can be closed
+        del inputs
+    finally:
+        for a in arrays:
+            a.close()
+
+
+def _check_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        return 1
+    if workers < 1:
+        raise ValueError(f"'workers' must be a positive integer, got {workers}.")
+    return int(workers)
+
+
+def map_rows(
+    fn: Callable,
+    chunked: Sequence[np.ndarray],
+    shared: Sequence[np.ndarray] = (),
+    out_shape: Tuple[int, ...] = (),
+    dtype: Any = float,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Evaluates `fn(*chunks, *shared, **kwargs)` over row chunks of the `chunked` arrays on a pool of `workers`
+    processes and gathers the chunks into a single output.
+
+    Args:
+        fn: (callable) Picklable function returning an array of shape (rows, *out_shape) for the given rows.
+        chunked: (sequence of arrays) Inputs split along dim 0, all of the same length N.
+        shared: (sequence of arrays) Inputs passed whole to every call.
+        out_shape: (tuple) Shape of an output row.
+        dtype: (dtype) Dtype of the output.
+        workers: (int) Number of worker processes. With None or 1, `fn` is called once in this process.
+        chunk_size: (int) Rows per task, by default the rows are split into 4 tasks per worker.
+
+    Returns:
+        Array of shape (N, *out_shape).
+    """
+    workers = _check_workers(workers)
+    chunked = [np.ascontiguousarray(a) for a in chunked]
+    num_rows = len(chunked[0])
+    if workers == 1 or num_rows <= 1:
+        return np.asarray(fn(*chunked, *shared, **kwargs), dtype=dtype).reshape((num_rows, *out_shape))
+    chunk_size = chunk_size or math.ceil(num_rows / (4 * workers))
+    blocks = [SharedArray.from_array(np.asarray(a)) for a in (*chunked, *shared)]
+    out = SharedArray((num_rows, *out_shape), dtype)
+    try:
+        specs = [block.spec for block in blocks]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_chunk,
+                    fn,
+                    specs[: len(chunked)],
+                    specs[len(chunked) :],
+                    out.spec,
+                    start,
+                    min(start + chunk_size, num_rows),
+                    kwargs,
+                )
+                for start in range(0, num_rows, chunk_size)
+            ]
+            for future in futures:
+                future.result()
+        return out.array.copy()
+    finally:
+        for block in (*blocks, out):
+            block.close()
+
+
+def _reset_thread_pool() -> None:
+    global _thread_pool, _thread_pool_lock
+    # The threads of the pool do not exist in a forked child
+    _thread_pool, _thread_pool_lock = None, threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_thread_pool)
+
+
+def set_threads(threads: Optional[int]) -> int:
+    """
+    Sets the default number of threads of the batch kernels globally, None or 1 disables threading.
+    """
+    global _threads
+    _threads = _check_workers(threads)
+    return _threads
+
+
+def get_threads() -> int:
+    return _threads
+
+
+def _get_thread_pool(threads: int) -> ThreadPoolExecutor:
+    global _thread_pool
+    with _thread_pool_lock:
+        if _thread_pool is None or _thread_pool._max_workers < threads:
+            if _thread_pool is not None:
+                # running tasks of the previous pool finish on their own
+                _thread_pool.shutdown(wait=False)
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=threads,
+                thread_name_prefix="pybboxes",
+                initializer=setattr,
+                initargs=(_local, "active", True),
+            )
+        return _thread_pool
+
+
+def resolve_threads(threads: Optional[int] = None) -> int:
+    """
+    Number of threads to run a kernel on: `threads` if given, the global default otherwise, and 1 within the
+    threads of the pool.
+    """
+    if getattr(_local, "active", False):
+        return 1
+    return _check_workers(threads) if threads is not None else _threads
+
+
+def thread_map_rows(
+    fn: Callable,
+    chunked: Sequence[np.ndarray],
+    shared: Sequence[Any] = (),
+    out_shape: Tuple[int, ...] = (),
+    dtype: Any = float,
+    threads: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Evaluates `fn(*chunks, *shared, **kwargs)` over row chunks of the `chunked` arrays on the thread pool, each
+    chunk being written into a preallocated output. Arguments as of :py:func:`map_rows`, `fn` needs not be
+    picklable. The default `chunk_size` keeps about `CHUNK_ELEMENTS` output values per chunk.
+
+    Returns:
+        Array of shape (N, *out_shape).
+    """
+    threads = resolve_threads(threads)
+    num_rows = len(chunked[0])
+    chunk_size = chunk_size or max(CHUNK_ELEMENTS // max(math.prod(out_shape), 1), 1)
+    if threads == 1 or num_rows <= chunk_size:
+        return np.asarray(fn(*chunked, *shared, **kwargs), dtype=dtype).reshape((num_rows, *out_shape))
+    out = np.empty((num_rows, *out_shape), dtype=dtype)
+    starts, lock = iter(range(0, num_rows, chunk_size)), threading.Lock()
+
+    def run_chunks() -> None:
+        # Chunks are taken from a common iterator, so at most `threads` of them run at once even on a larger pool
+        while True:
+            with lock:
+                start = next(starts, None)
+            if start is None:
+                return
+            out[start : start + chunk_size] = fn(*(a[start : start + chunk_size] for a in chunked), *shared, **kwargs)
+
+    num_tasks = min(threads, math.ceil(num_rows / chunk_size))
+    futures = [_get_thread_pool(threads - 1).submit(run_chunks) for _ in range(num_tasks - 1)]
+    # The calling thread works on the chunks as well
+    try:
+        run_chunks()
+    finally:
+        wait(futures)
+    for future in futures:
+        future.result()
+    return out
@@ -0,0 +1,127 @@
+"""
+Dtype policy for box storage in the batch APIs (`BoxArray` and the records of the annotation readers).
+Without a policy, floating inputs keep their precision, e.g. float32 model outputs stay float32 through
+conversions, and anything else is stored as float64. A `dtype` argument or a policy fixes the storage dtype per
+format family:
+
+    from pybboxes import precision
+
+    with precision.dtype_policy(normalized="float32", pixel="int32"):
+        boxes = BoxArray(predictions, "yolo", image_size=(640, 480))  # float32
+        boxes.convert("coco").values  # int32
+
+Rounding, for every conversion:
+    - To a floating dtype, values are never rounded (only the precision of the dtype applies).
+    - To an integer dtype, values are rounded half to even with `np.rint`, as the builtin `round()` of the
+      box classes, and a ValueError is raised if any value does not fit the dtype, e.g. negative coordinates
+      of out of bounds boxes in uint16. NaN values raise as well.
+    - Normalized formats (albumentations, fiftyone, yolo) only accept floating dtypes.
+Computations (e.g. areas or IoU) run in the floating dtype of the stored values, or in float64 for integer
+storage, so integer storage never overflows intermediate products. Operations keeping the format (e.g. `shift`
+and `clamp` of `BoxArray`) keep the dtype of the array, and round for integer ones.
+"""
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from pybboxes.boxes.base import NORMALIZED_BOXES
+
+DtypeLike = Optional[np.dtype]
+
+
+class DtypePolicy(NamedTuple):
+    normalized: DtypeLike = None
+    pixel: DtypeLike = None
+
+
+_policy = DtypePolicy()
+
+
+def _check_dtype(dtype, normalized: bool) -> DtypeLike:
+    if dtype is None:
+        return None
+    dtype = np.dtype(dtype)
+    if dtype.kind not in ("f", "i", "u"):
+        raise ValueError(f"Box dtype must be a floating or an integer dtype, got {dtype}.")
+    if normalized and dtype.kind != "f":
+        raise ValueError(f"Normalized formats require a floating dtype, got {dtype}.")
+    return dtype
+
+
+def set_policy(normalized: DtypeLike = None, pixel: DtypeLike = None) -> DtypePolicy:
+    """
+    Sets the storage dtypes of the normalized (albumentations, fiftyone, yolo) and the pixel (coco, voc)
+    formats globally, None keeps the dtype of the input.
+    """
+    global _policy
+    _policy = DtypePolicy(_check_dtype(normalized, normalized=True), _check_dtype(pixel, normalized=False))
+    return _policy
+
+
+def reset() -> None:
+    global _policy
+    _policy = DtypePolicy()
+
+
+def get_policy() -> DtypePolicy:
+    return _policy
+
+
+@contextmanager
+def dtype_policy(normalized: DtypeLike = None, pixel: DtypeLike = None) -> Iterator[DtypePolicy]:
+    """
+    Sets the policy for the duration of the context, the previous one is restored on exit.
+    """
+    global _policy
+    previous = _policy
+    try:
+        yield set_policy(normalized, pixel)
+    finally:
+        _policy = previous
+
+
+def compute_dtype(values: np.ndarray) -> np.dtype:
+    """
+    Floating dtype computations on `values` run in: their own for float32 and float64, float64 otherwise.
+    """
+    dtype = np.asarray(values).dtype
+    return dtype if dtype in (np.float32, np.float64) else np.dtype(np.float64)
+
+
+def storage_dtype(bbox_type: str, values: np.ndarray, dtype: DtypeLike = None, keep_integer: bool = False) -> np.dtype:
+    """
+    Dtype to store `values` of `bbox_type` in: `dtype` if given, otherwise the one of the active policy for
+    the format, otherwise the dtype of the values if floating, otherwise float64. Integer values keep their
+    dtype for the pixel formats only if `keep_integer` is True (e.g. converting an integer box array), so
+    integer storage is never picked implicitly for raw inputs, as it would round subpixel results.
+    """
+    normalized = bbox_type in NORMALIZED_BOXES
+    dtype = _check_dtype(dtype, normalized)
+    if dtype is None:
+        dtype = _policy.normalized if normalized else _policy.pixel
+    if dtype is None:
+        dtype = np.asarray(values).dtype
+        if not (dtype.kind == "f" or (keep_integer and dtype.kind in ("i", "u") and not normalized)):
+            dtype = np.dtype(np.float64)
+    return dtype
+
+
+def cast(values: np.ndarray, dtype) -> np.ndarray:
+    """
+    Casts box values to `dtype` with the rounding described in the module documentation, without a copy if
+    the values are already of `dtype`.
+    """
+    values = np.asarray(values)
+    dtype = np.dtype(dtype)
+    if values.dtype == dtype or dtype.kind == "f":
+        return values.astype(dtype, copy=False)
+    if values.dtype.kind == "f":
+        values = np.rint(values)
+        if np.isnan(values).any():
+            raise ValueError(f"NaN box values cannot be stored as {dtype}.")
+    if values.size:
+        info = np.iinfo(dtype)
+        if values.min() < info.min or values.max() > info.max:
+            raise ValueError(f"Box values out of the range of {dtype} [{info.min}, {info.max}].")
+    return values.astype(dtype)
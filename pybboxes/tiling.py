@@ -0,0 +1,152 @@
+"""
+Slicing of large images into overlapping tiles, e.g. for sliced inference and training on aerial imagery.
+
+    from pybboxes.tiling import tile_boxes, tile_windows, untile_boxes
+
+    windows = tile_windows(image_size=(8192, 8192), tile_size=1024, overlap=0.2)
+    tiled = tile_boxes(boxes, windows, bbox_type="coco", min_visibility=0.3)
+    per_tile_boxes, per_tile_indices = tiled.split(), tiled.split(tiled.indices)
+    boxes, tile_indices = untile_boxes(predictions_per_tile, windows, bbox_type="coco")
+
+Windows are VOC boxes in image coordinates. Boxes are moved into a tile as `shift` by the negated window origin
+followed by `clamp` to the tile size, all (tile, box) pairs in a single pass. Only the pairs that overlap are
+evaluated (see :py:func:`pybboxes.ops.sparse_pairwise_iou`). Normalized formats are relative to the tile size
+inside a tile.
+"""
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from pybboxes import ops
+from pybboxes._typing import GenericBboxType
+
+
+class TiledBoxes(NamedTuple):
+    """
+    Boxes of all tiles packed tile after tile, the boxes of tile `i` are at `offsets[i]:offsets[i + 1]`.
+    """
+
+    boxes: np.ndarray
+    indices: np.ndarray
+    visibility: np.ndarray
+    offsets: np.ndarray
+
+    def split(self, values: Optional[np.ndarray] = None) -> List[np.ndarray]:
+        """
+        Splits `values` aligned with the packed boxes (the boxes themselves by default) into a list per tile.
+        """
+        values = self.boxes if values is None else values
+        return np.split(values, self.offsets[1:-1])
+
+
+def _tile_starts(length: int, tile: int, stride: int) -> np.ndarray:
+    if length <= tile:
+        return np.zeros(1, dtype=int)
+    # The last tile is aligned to the image border rather than running over it
+    return np.append(np.arange(0, length - tile, stride), length - tile)
+
+
+def tile_windows(
+    image_size: Tuple[int, int], tile_size: Union[int, Tuple[int, int]], overlap: float = 0.0
+) -> np.ndarray:
+    """
+    Generates the tile windows covering an image, row by row.
+
+    Args:
+        image_size: Image size as (w, h).
+        tile_size: Tile size as (w, h), or a single side for square tiles. Tiles are cropped to the image if it
+            is smaller.
+        overlap: Overlap of adjacent tiles as a ratio of the tile size, in [0, 1).
+
+    Returns:
+        Integer array of VOC windows of shape (T, 4).
+    """
+    if not 0 <= overlap < 1:
+        raise ValueError("'overlap' must be in [0, 1).")
+    image_width, image_height = image_size
+    tile_width, tile_height = (tile_size, tile_size) if np.isscalar(tile_size) else tile_size
+    if min(image_width, image_height, tile_width, tile_height) <= 0:
+        raise ValueError("'image_size' and 'tile_size' must be positive.")
+    xs = _tile_starts(image_width, tile_width, max(tile_width - round(overlap * tile_width), 1))
+    ys = _tile_starts(image_height, tile_height, max(tile_height - round(overlap * tile_height), 1))
+    x_tl, y_tl = np.meshgrid(xs, ys)
+    x_tl, y_tl = x_tl.ravel(), y_tl.ravel()
+    return np.stack([x_tl, y_tl, x_tl + min(tile_width, image_width), y_tl + min(tile_height, image_height)], axis=-1)
+
+
+def tile_boxes(
+    boxes: GenericBboxType,
+    windows: np.ndarray,
+    bbox_type: str = "coco",
+    image_size: Optional[Tuple[int, int]] = None,
+    min_visibility: float = 0.0,
+) -> TiledBoxes:
+    """
+    Remaps the boxes of an image into every tile they overlap.
+
+    Args:
+        boxes: Array of N boxes of shape (N, 4).
+        windows: VOC tile windows of shape (T, 4), see :py:func:`tile_windows`.
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+        image_size: Image size as (w, h), required for the normalized formats.
+        min_visibility: Boxes keeping less than this ratio of their area inside a tile are dropped from it.
+
+    Returns:
+        TiledBoxes of the clamped boxes in tile coordinates in `bbox_type` (not rounded), the indices of the
+        boxes in `boxes`, the ratio of their area inside the tile and the offsets of each tile.
+    """
+    windows = np.reshape(windows, (-1, 4))
+    voc_boxes = ops.to_voc_array(np.reshape(boxes, (-1, 4)), bbox_type, image_size, round_values=False)
+    # Pairs with positive IoU are the ones with a non-empty intersection
+    indices, tiles, _ = ops.sparse_pairwise_iou(voc_boxes, windows.astype(float))
+    order = np.lexsort((indices, tiles))
+    tiles, indices = tiles[order], indices[order]
+    tile_sizes = windows[tiles, 2:] - windows[tiles, :2]
+    shifted = ops.box_shift(voc_boxes[indices], -windows[tiles, :2])
+    clamped = ops.box_clamp(shifted, tile_sizes)
+    visibility = ops.box_area(clamped) / ops.box_area(voc_boxes[indices])
+    keep = visibility >= min_visibility
+    tiles, indices, clamped, visibility, tile_sizes = (
+        tiles[keep],
+        indices[keep],
+        clamped[keep],
+        visibility[keep],
+        tile_sizes[keep],
+    )
+    return TiledBoxes(
+        boxes=ops.from_voc_array(clamped, bbox_type, tile_sizes, round_values=False),
+        indices=indices,
+        visibility=visibility,
+        offsets=np.searchsorted(tiles, np.arange(len(windows) + 1)),
+    )
+
+
+def untile_boxes(
+    boxes_list: Sequence[GenericBboxType],
+    windows: np.ndarray,
+    bbox_type: str = "coco",
+    image_size: Optional[Tuple[int, int]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Maps boxes given per tile in tile coordinates (e.g. predictions) back to image coordinates.
+
+    Args:
+        boxes_list: Boxes of each tile, arrays of shape (n_i, 4) in `bbox_type`, one per window.
+        windows: VOC tile windows of shape (T, 4), see :py:func:`tile_windows`.
+        bbox_type: Format of the bounding boxes. It's 'coco' [x-tl, y-tl, w, h] by default.
+        image_size: Image size as (w, h), required for the normalized formats.
+
+    Returns:
+        Boxes in image coordinates in `bbox_type` (not rounded) of shape (N, 4), and the tile of each box.
+    """
+    windows = np.reshape(windows, (-1, 4))
+    if len(boxes_list) != len(windows):
+        raise ValueError("'boxes_list' must have the boxes of each tile in 'windows'.")
+    boxes_list = [np.reshape(boxes, (-1, 4)) for boxes in boxes_list]
+    tiles = np.repeat(np.arange(len(windows)), [len(boxes) for boxes in boxes_list])
+    tile_sizes = windows[tiles, 2:] - windows[tiles, :2]
+    voc_boxes = ops.to_voc_array(
+        np.concatenate(boxes_list + [np.empty((0, 4))]), bbox_type, tile_sizes, round_values=False
+    )
+    voc_boxes = ops.box_shift(voc_boxes, windows[tiles, :2])
+    return ops.from_voc_array(voc_boxes, bbox_type, image_size, round_values=False), tiles
@@ -0,0 +1,214 @@
+"""
+Geometric image transforms applied to box arrays, e.g. for data augmentation and model pre/post-processing.
+
+    from pybboxes import BoxArray
+    from pybboxes.transforms import Compose, HorizontalFlip, Letterbox, Rot90
+
+    pipeline = Compose([Letterbox((640, 640)), HorizontalFlip(), Rot90()])
+    boxes = BoxArray(coco_boxes, bbox_type="coco", image_size=(1920, 1080))
+    transformed, keep = pipeline(boxes, clip=True, min_visibility=0.3)  # transformed.image_size == (640, 640)
+
+    # Map predictions on the transformed image back to the original one
+    inverse = pipeline.get_transform((1920, 1080)).inverse()
+    restored, _ = inverse(predictions, clip=False)
+
+Every transform maps pixel coordinates affinely and keeps boxes axis aligned, so a pipeline is fused into a single
+3x3 matrix for a given input image size and boxes are transformed in one pass over the array, without the per box
+VOC round trips of chained `scale`/`shift` calls.
+"""
+from abc import ABC, abstractmethod
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from pybboxes import ops
+from pybboxes.boxes.box_array import BoxArray
+
+
+class AffineTransform:
+    """
+    Affine map of pixel coordinates from an image of `input_size` to an image of `output_size`.
+
+    Args:
+        matrix: (np.ndarray) 3x3 matrix acting on (x, y, 1), must keep boxes axis aligned (scalings, flips,
+            translations and 90 degree rotations).
+        input_size: (tuple(int,int)) Input image size as (w, h).
+        output_size: (tuple(int,int)) Output image size as (w, h).
+    """
+
+    def __init__(self, matrix: np.ndarray, input_size: Tuple[int, int], output_size: Tuple[int, int]):
+        self.matrix = np.asarray(matrix, dtype=float)
+        if self.matrix[0, 0] * self.matrix[0, 1] != 0 or self.matrix[1, 0] * self.matrix[1, 1] != 0:
+            raise ValueError("Given affine map does not keep boxes axis aligned.")
+        self.input_size = tuple(input_size)
+        self.output_size = tuple(output_size)
+
+    def __repr__(self):
+        return f"AffineTransform({self.input_size} -> {self.output_size})"
+
+    def then(self, other: "AffineTransform") -> "AffineTransform":
+        """
+        Composes with `other`, applied after this transform.
+        """
+        return AffineTransform(other.matrix @ self.matrix, self.input_size, other.output_size)
+
+    def inverse(self) -> "AffineTransform":
+        return AffineTransform(np.linalg.inv(self.matrix), self.output_size, self.input_size)
+
+    def apply_voc(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Transforms VOC boxes of shape (..., 4).
+        """
+        linear, translation = self.matrix[:2, :2], self.matrix[:2, 2]
+        top_left = boxes[..., :2] @ linear.T + translation
+        bottom_right = boxes[..., 2:] @ linear.T + translation
+        # Flips and rotations swap the corners
+        return np.concatenate([np.minimum(top_left, bottom_right), np.maximum(top_left, bottom_right)], axis=-1)
+
+    def __call__(self, boxes: BoxArray, clip: bool = True, min_visibility: float = 0.0) -> Tuple[BoxArray, np.ndarray]:
+        """
+        Transforms a box array, the result has the output image size.
+
+        Args:
+            boxes: (BoxArray) Boxes on an image of the input size.
+            clip: (bool) Whether to clamp the boxes to the output image, dropping the boxes left without area.
+            min_visibility: (float) When clipping, boxes keeping less than this ratio of their area are dropped.
+
+        Returns:
+            Transformed boxes in the format of `boxes`, and the indices of the kept boxes.
+        """
+        if boxes.image_size is not None and boxes.image_size != self.input_size:
+            raise ValueError(f"Given boxes are on an image of size {boxes.image_size}, expected {self.input_size}.")
+        voc_boxes = self.apply_voc(ops.to_voc_array(boxes.values, boxes.name, self.input_size, round_values=False))
+        keep = np.arange(len(voc_boxes))
+        if clip:
+            clamped = ops.box_clamp(voc_boxes, self.output_size)
+            width, height = clamped[:, 2] - clamped[:, 0], clamped[:, 3] - clamped[:, 1]
+            visible = (width > 0) & (height > 0)
+            visible[visible] = width[visible] * height[visible] >= min_visibility * ops.box_area(voc_boxes[visible])
+            keep, voc_boxes = keep[visible], clamped[visible]
+        return BoxArray.from_voc(voc_boxes, boxes.name, self.output_size), keep
+
+
+class Transform(ABC):
+    """
+    Base class of the transforms, which are given by their affine map for an input image size.
+    """
+
+    @abstractmethod
+    def get_transform(self, image_size: Tuple[int, int]) -> AffineTransform:
+        pass
+
+    def __call__(self, boxes: BoxArray, clip: bool = True, min_visibility: float = 0.0) -> Tuple[BoxArray, np.ndarray]:
+        """
+        Applies the transform to a box array, see :py:meth:`AffineTransform.__call__`.
+        """
+        if boxes.image_size is None:
+            raise ValueError("Given boxes must have an image size to be transformed.")
+        return self.get_transform(boxes.image_size)(boxes, clip=clip, min_visibility=min_visibility)
+
+
+def _affine(
+    input_size: Tuple[int, int],
+    output_size: Tuple[int, int],
+    scale: Tuple[float, float] = (1, 1),
+    translation: Tuple[float, float] = (0, 0),
+    swap_axes: bool = False,
+) -> AffineTransform:
+    matrix = np.array([[scale[0], 0, translation[0]], [0, scale[1], translation[1]], [0, 0, 1]], dtype=float)
+    if swap_axes:
+        matrix[:2, :2] = matrix[:2, :2][:, ::-1]
+    return AffineTransform(matrix, input_size, output_size)
+
+
+class Resize(Transform):
+    """
+    Resizes the image to `size` as (w, h).
+    """
+
+    def __init__(self, size: Tuple[int, int]):
+        self.size = tuple(size)
+
+    def get_transform(self, image_size: Tuple[int, int]) -> AffineTransform:
+        (width, height), (new_width, new_height) = image_size, self.size
+        return _affine(image_size, self.size, scale=(new_width / width, new_height / height))
+
+
+class Letterbox(Transform):
+    """
+    Resizes the image to fit in `size` as (w, h) keeping its aspect ratio, and pads it evenly on both sides to
+    `size`. The resized image is rounded to whole pixels and the odd pixel of padding goes right (bottom).
+    """
+
+    def __init__(self, size: Tuple[int, int]):
+        self.size = tuple(size)
+
+    def get_transform(self, image_size: Tuple[int, int]) -> AffineTransform:
+        (width, height), (new_width, new_height) = image_size, self.size
+        ratio = min(new_width / width, new_height / height)
+        resized_width, resized_height = round(width * ratio), round(height * ratio)
+        return _affine(
+            image_size,
+            self.size,
+            scale=(resized_width / width, resized_height / height),
+            translation=((new_width - resized_width) // 2, (new_height - resized_height) // 2),
+        )
+
+
+class HorizontalFlip(Transform):
+    def get_transform(self, image_size: Tuple[int, int]) -> AffineTransform:
+        return _affine(image_size, image_size, scale=(-1, 1), translation=(image_size[0], 0))
+
+
+class VerticalFlip(Transform):
+    def get_transform(self, image_size: Tuple[int, int]) -> AffineTransform:
+        return _affine(image_size, image_size, scale=(1, -1), translation=(0, image_size[1]))
+
+
+class Rot90(Transform):
+    """
+    Rotates the image by `k` times 90 degrees counterclockwise, as `np.rot90(image, k)` on an image array of
+    shape (h, w, ...).
+    """
+
+    def __init__(self, k: int = 1):
+        self.k = k % 4
+
+    def get_transform(self, image_size: Tuple[int, int]) -> AffineTransform:
+        transform = AffineTransform(np.eye(3), image_size, image_size)
+        for _ in range(self.k):
+            # (x, y) -> (y, w - x) on an image of size (w, h), which becomes (h, w)
+            width, height = transform.output_size
+            step = _affine((width, height), (height, width), scale=(1, -1), translation=(0, width), swap_axes=True)
+            transform = transform.then(step)
+        return transform
+
+
+class Crop(Transform):
+    """
+    Crops the image to the VOC window `(x_tl, y_tl, x_br, y_br)`.
+    """
+
+    def __init__(self, x_tl: int, y_tl: int, x_br: int, y_br: int):
+        if x_tl >= x_br or y_tl >= y_br:
+            raise ValueError("Incorrect crop window. Must be in type [x-tl, y-tl, x-br, y-br].")
+        self.window = (x_tl, y_tl, x_br, y_br)
+
+    def get_transform(self, image_size: Tuple[int, int]) -> AffineTransform:
+        x_tl, y_tl, x_br, y_br = self.window
+        return _affine(image_size, (x_br - x_tl, y_br - y_tl), translation=(-x_tl, -y_tl))
+
+
+class Compose(Transform):
+    """
+    Sequence of transforms, fused into a single affine map.
+    """
+
+    def __init__(self, transforms: Sequence[Transform]):
+        self.transforms = list(transforms)
+
+    def get_transform(self, image_size: Tuple[int, int]) -> AffineTransform:
+        transform = AffineTransform(np.eye(3), image_size, image_size)
+        for step in self.transforms:
+            transform = transform.then(step.get_transform(transform.output_size))
+        return transform
@@ -1,3 +1,4 @@
+import math
 from typing import Sequence, Union
 
 import numpy as np
@@ -51,3 +52,40 @@ class Box:
 
     def iou(self, other: "Box") -> float:
         return self.intersection(other) / self.union(other)
+
+    def _enclosing_box(self, other: "Box") -> "Box":
+        return Box(
+            min(self.x_tl, other.x_tl),
+            min(self.y_tl, other.y_tl),
+            max(self.x_br, other.x_br),
+            max(self.y_br, other.y_br),
+        )
+
+    def giou(self, other: "Box") -> float:
+        """
+        Generalized IoU, IoU penalized by the area of the smallest enclosing box not covered by the union.
+        """
+        union = self.union(other)
+        enclosing_area = self._enclosing_box(other).area
+        return self.intersection(other) / union - (enclosing_area - union) / enclosing_area
+
+    def diou(self, other: "Box") -> float:
+        """
+        Distance IoU, IoU penalized by the squared distance of the box centers normalized by the squared
+        diagonal of the smallest enclosing box.
+        """
+        enclosing_box = self._enclosing_box(other)
+        center_distance = ((self.x_tl + self.x_br) - (other.x_tl + other.x_br)) ** 2 / 4 + (
+            (self.y_tl + self.y_br) - (other.y_tl + other.y_br)
+        ) ** 2 / 4
+        diagonal = enclosing_box.width**2 + enclosing_box.height**2
+        return self.iou(other) - center_distance / diagonal
+
+    def ciou(self, other: "Box") -> float:
+        """
+        Complete IoU, DIoU additionally penalized by the aspect ratio consistency of the boxes.
+        """
+        iou = self.iou(other)
+        v = 4 / math.pi**2 * (math.atan(other.width / other.height) - math.atan(self.width / self.height)) ** 2
+        alpha = v / (1 - iou + v) if v > 0 else 0.0
+        return self.diou(other) - alpha * v
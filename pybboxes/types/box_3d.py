@@ -0,0 +1,61 @@
+from typing import Tuple
+
+
+class Box3D:
+    """
+    Axis-aligned 3D box given by its minimum and maximum corners, e.g. in LiDAR point cloud coordinates.
+    Unlike image boxes, coordinates are metric and kept as floats.
+    """
+
+    def __init__(self, x_min: float, y_min: float, z_min: float, x_max: float, y_max: float, z_max: float):
+        self.x_min = x_min
+        self.y_min = y_min
+        self.z_min = z_min
+        self.x_max = x_max
+        self.y_max = y_max
+        self.z_max = z_max
+
+    def __add__(self, other: "Box3D") -> float:
+        return self.union(other)
+
+    def __sub__(self, other: "Box3D") -> float:
+        return self.volume - self.intersection(other)
+
+    def __mul__(self, other: "Box3D") -> float:
+        return self.intersection(other)
+
+    def __truediv__(self, other: "Box3D") -> float:
+        return self.volume / other.volume
+
+    @property
+    def corners(self) -> Tuple[float, float, float, float, float, float]:
+        return self.x_min, self.y_min, self.z_min, self.x_max, self.y_max, self.z_max
+
+    @property
+    def size(self) -> Tuple[float, float, float]:
+        """
+        Extents along x, y and z.
+        """
+        return self.x_max - self.x_min, self.y_max - self.y_min, self.z_max - self.z_min
+
+    @property
+    def volume(self) -> float:
+        size_x, size_y, size_z = self.size
+        return size_x * size_y * size_z
+
+    def intersection(self, other: "Box3D") -> float:
+        volume = 1.0
+        for low, high, other_low, other_high in zip(
+            self.corners[:3], self.corners[3:], other.corners[:3], other.corners[3:]
+        ):
+            side = min(high, other_high) - max(low, other_low)
+            if side <= 0:
+                return 0.0
+            volume *= side
+        return volume
+
+    def union(self, other: "Box3D") -> float:
+        return self.volume + other.volume - self.intersection(other)
+
+    def iou(self, other: "Box3D") -> float:
+        return self.intersection(other) / self.union(other)
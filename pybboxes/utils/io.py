@@ -1,7 +1,8 @@
 import json
 import os
 import struct
-from typing import Dict, List, Optional, Union
+import zlib
+from typing import Dict, List, Optional, Tuple, Union
 
 import yaml
 
@@ -16,7 +17,7 @@ def get_image_size(file_path: str):
         if len(head) != 24:
             return None
         if head.startswith(b"\x89PNG\r\n\x1a\n"):
-            check = struct.unpack(">i", head[16:20])[0]
+            check = struct.unpack(">i", head[4:8])[0]
             if check != 0x0D0A1A0A:
                 return None
             width, height = struct.unpack(">ii", head[16:24])
@@ -42,6 +43,35 @@ def get_image_size(file_path: str):
         return width, height
 
 
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def write_png_header(file_path: str, image_size: Tuple[int, int]) -> None:
+    """
+    Writes a minimal PNG file (signature, IHDR and IEND chunks without pixel data) declaring the
+    given (width, height), enough for `get_image_size` and other header readers.
+    """
+    width, height = image_size
+    # 8-bit RGB, default compression, filter and interlace methods.
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    with open(file_path, "wb") as fhandle:
+        fhandle.write(b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", ihdr) + _png_chunk(b"IEND", b""))
+
+
+def write_jpeg_header(file_path: str, image_size: Tuple[int, int]) -> None:
+    """
+    Writes a minimal JPEG file (SOI, JFIF APP0, SOF0 and EOI markers without scan data) declaring the
+    given (width, height), enough for `get_image_size` and other header readers.
+    """
+    width, height = image_size
+    app0 = b"\xff\xe0" + struct.pack(">H5sBBBHHBB", 16, b"JFIF\x00", 1, 1, 0, 1, 1, 0, 0)
+    # Baseline DCT, 8-bit precision, single grayscale component.
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHBBBB", 11, 8, height, width, 1, 1, 0x11, 0)
+    with open(file_path, "wb") as fhandle:
+        fhandle.write(b"\xff\xd8" + app0 + sof0 + b"\xff\xd9")
+
+
 class IndentfulDumper(yaml.Dumper):
     def increase_indent(self, flow=False, indentless=False):
         return super(IndentfulDumper, self).increase_indent(flow, False)
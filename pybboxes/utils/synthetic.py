@@ -0,0 +1,121 @@
+"""
+Deterministic synthetic datasets for scale testing and benchmarking of the annotation loaders and writers.
+
+Datasets are generated as a stream of (image_name, image_size, boxes, labels) records and written with the
+streaming writers, so millions of boxes can be generated in bounded memory. Images are written as minimal
+PNG/JPEG headers which are enough for `get_image_size` but carry no pixel data.
+"""
+import os
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pybboxes._typing import AnnotationRecordType
+from pybboxes.annotations.streaming import write_coco, write_voc, write_yolo
+from pybboxes.utils.io import write_jpeg_header, write_png_header
+
+DEFAULT_IMAGE_SIZES = ((640, 480), (1280, 720), (1920, 1080))
+IMAGE_HEADER_WRITERS = {"jpg": write_jpeg_header, "png": write_png_header}
+
+
+def make_class_names(num_classes: int) -> list:
+    return [f"class_{i}" for i in range(num_classes)]
+
+
+def iter_synthetic_records(
+    num_images: int,
+    image_sizes: Sequence[Tuple[int, int]] = DEFAULT_IMAGE_SIZES,
+    image_size_weights: Optional[Sequence[float]] = None,
+    boxes_per_image: Tuple[int, int] = (1, 20),
+    box_scale: Tuple[float, float] = (0.02, 0.5),
+    num_classes: int = 80,
+    image_extension: str = "jpg",
+    seed: int = 42,
+) -> Iterator[AnnotationRecordType]:
+    """
+    Yields synthetic records with boxes in VOC format. The output only depends on the arguments.
+
+    Args:
+        num_images: (int) Number of images.
+        image_sizes: (sequence) Candidate (w, h) image sizes.
+        image_size_weights: (optional sequence) Sampling probabilities of `image_sizes`, uniform by default.
+        boxes_per_image: (tuple(int,int)) Inclusive range the number of boxes per image is sampled from
+            uniformly.
+        box_scale: (tuple(float,float)) Range of box sides relative to the image sides, sampled
+            log-uniformly so that small boxes are as frequent as in real datasets.
+        num_classes: (int) Number of classes, labels are named `class_{i}`.
+        image_extension: (str) Extension of the image names.
+        seed: (int) Random seed.
+    """
+    rng = np.random.default_rng(seed)
+    image_sizes = np.asarray(image_sizes, dtype=int)
+    if image_size_weights is not None:
+        image_size_weights = np.asarray(image_size_weights, dtype=float)
+        image_size_weights = image_size_weights / image_size_weights.sum()
+    names = make_class_names(num_classes)
+    log_scale = np.log(box_scale)
+
+    for image_index in range(num_images):
+        width, height = image_sizes[rng.choice(len(image_sizes), p=image_size_weights)]
+        num_boxes = rng.integers(boxes_per_image[0], boxes_per_image[1] + 1)
+
+        scales = np.exp(rng.uniform(*log_scale, size=(num_boxes, 2)))
+        w = np.clip(np.round(scales[:, 0] * width), 1, width)
+        h = np.clip(np.round(scales[:, 1] * height), 1, height)
+        x_tl = np.floor(rng.uniform(size=num_boxes) * (width - w + 1))
+        y_tl = np.floor(rng.uniform(size=num_boxes) * (height - h + 1))
+        boxes = np.stack([x_tl, y_tl, x_tl + w, y_tl + h], axis=-1)
+
+        labels = [names[label_id] for label_id in rng.integers(0, num_classes, size=num_boxes)]
+        yield f"image_{image_index:08d}.{image_extension}", (int(width), int(height)), boxes, labels
+
+
+def generate_dataset(
+    output_dir: str,
+    annotation_type: str = "coco",
+    num_images: int = 1000,
+    image_format: str = "jpg",
+    write_images: bool = True,
+    **kwargs,
+) -> Dict[str, str]:
+    """
+    Writes a synthetic dataset under `output_dir`. The layout is `images/` for the image headers and
+    `labels/` for yolo and voc label files, or `annotations.json` for coco.
+
+    Args:
+        output_dir: (str) Root directory of the dataset.
+        annotation_type: (str) One of 'yolo', 'voc' or 'coco'.
+        num_images: (int) Number of images.
+        image_format: (str) Image header format, 'jpg' or 'png'.
+        write_images: (bool) Whether to write image headers. Required for loading yolo datasets.
+        **kwargs: Additional keyword arguments for :py:func:`iter_synthetic_records`.
+
+    Returns:
+        Keyword arguments for the matching `Annotations.load_from_*` method.
+    """
+    if annotation_type not in ("yolo", "voc", "coco"):
+        raise ValueError(f"Annotation type should be one of: ('yolo', 'voc', 'coco'), got {annotation_type}")
+    if image_format not in IMAGE_HEADER_WRITERS:
+        raise ValueError(f"Image format should be one of: {tuple(IMAGE_HEADER_WRITERS)}, got {image_format}")
+
+    images_dir = os.path.join(output_dir, "images")
+    labels_dir = os.path.join(output_dir, "labels")
+    os.makedirs(images_dir, exist_ok=True)
+    write_image_header = IMAGE_HEADER_WRITERS[image_format]
+
+    def records():
+        for record in iter_synthetic_records(num_images, image_extension=image_format, **kwargs):
+            if write_images:
+                write_image_header(os.path.join(images_dir, record[0]), record[1])
+            yield record
+
+    vocabulary = make_class_names(kwargs.get("num_classes", 80))
+    if annotation_type == "coco":
+        json_path = os.path.join(output_dir, "annotations.json")
+        write_coco(records(), json_path, bbox_type="voc", class_names=vocabulary)
+        return dict(json_path=json_path)
+    elif annotation_type == "voc":
+        write_voc(records(), labels_dir, bbox_type="voc")
+        return dict(labels_dir=labels_dir)
+    write_yolo(records(), labels_dir, bbox_type="voc", class_names=vocabulary)
+    return dict(labels_dir=labels_dir, images_dir=images_dir, classes_file=os.path.join(labels_dir, "classes.txt"))
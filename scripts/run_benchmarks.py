@@ -0,0 +1,9 @@
+import sys
+
+from scripts.utils import shell, validate_and_exit
+
+if __name__ == "__main__":
+    # Any extra arguments are passed to pytest, e.g. `--bench-sizes=1000` or `--benchmark-compare`.
+    extra_args = " ".join(sys.argv[1:])
+    sts_benchmarks = shell(f"pytest benchmarks --benchmark-only --benchmark-autosave {extra_args}")
+    validate_and_exit(benchmarks=sts_benchmarks)
@@ -34,11 +34,15 @@ _DEV_REQUIREMENTS = [
     "pytest-cov>=3.0.0",
     "pytest-timeout>=2.1.0",
     "pytest-depends>=1.0.1",
+    "pytest-benchmark>=4.0.0",
     "huggingface-hub>=0.25.0",
 ]
 
+_PANDAS_REQUIREMENTS = ["pandas>=1.3.0"]
+
 extras = {
-    "dev": _DEV_REQUIREMENTS,
+    "dev": _DEV_REQUIREMENTS + _PANDAS_REQUIREMENTS,
+    "pandas": _PANDAS_REQUIREMENTS,
 }
 
 
@@ -55,6 +59,7 @@ setuptools.setup(
     python_requires=">=3.8",
     install_requires=get_requirements(),
     extras_require=extras,
+    entry_points={"console_scripts": ["pybboxes=pybboxes.cli:main"]},
     include_package_data=True,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,18 @@
+import pytest
+
+from pybboxes.annotations import Annotations
+from pybboxes.annotations.streaming import write_coco
+
+
+@pytest.fixture
+def coco_annotations(tmp_path):
+    """factory loading `Annotations` from (image_name, image_size, coco boxes, labels) records via a coco file"""
+
+    def load(records, class_names=None, name="annotations") -> Annotations:
+        json_path = str(tmp_path / f"{name}.json")
+        write_coco(iter(records), json_path, bbox_type="coco", class_names=class_names)
+        anns = Annotations("coco")
+        anns.load_from_coco(json_path)
+        return anns
+
+    return load
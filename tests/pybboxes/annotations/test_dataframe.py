@@ -0,0 +1,95 @@
+import sys
+
+import numpy as np
+import pytest
+
+from pybboxes import convert_bbox
+from pybboxes.annotations import Annotations
+
+
+@pytest.fixture
+def annotations(coco_annotations):
+    records = [
+        ("image_0.jpg", (640, 480), np.array([[98, 345, 322, 117], [10, 20, 30, 40]]), ["cat", "dog"]),
+        ("image_1.jpg", (320, 240), np.array([[0, 0, 160, 120]]), ["dog"]),
+    ]
+    return coco_annotations(records, class_names=["cat", "dog", "bird"])
+
+
+def test_to_dataframe(annotations):
+    pd = pytest.importorskip("pandas")
+    df = annotations.to_dataframe()
+    assert list(df.columns) == [
+        "image_name",
+        "image_width",
+        "image_height",
+        "label",
+        "label_id",
+        "annotation_id",
+        "x_tl",
+        "y_tl",
+        "w",
+        "h",
+    ]
+    assert isinstance(df["image_name"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["label"].dtype, pd.CategoricalDtype)
+    assert list(df["label"].cat.categories) == ["cat", "dog", "bird"]
+    assert df["label"].tolist() == ["cat", "dog", "dog"]
+    assert df["image_width"].tolist() == [640, 640, 320]
+    np.testing.assert_array_equal(df[["x_tl", "y_tl", "w", "h"]], annotations.table.values)
+
+    yolo = annotations.to_dataframe(bbox_type="yolo")
+    expected = convert_bbox((98, 345, 322, 117), from_type="coco", to_type="yolo", image_size=(640, 480))
+    np.testing.assert_allclose(yolo[["x_c", "y_c", "w", "h"]].to_numpy()[0], expected)
+
+
+def test_dataframe_round_trip(annotations):
+    pytest.importorskip("pandas")
+    df = annotations.to_dataframe(bbox_type="voc")
+    restored = Annotations.from_dataframe(df, annotation_type="coco", bbox_type="voc")
+    np.testing.assert_array_equal(restored.table.values, annotations.table.values)
+    np.testing.assert_array_equal(restored.table.annotation_ids, annotations.table.annotation_ids)
+    assert restored.names_mapping == annotations.names_mapping
+    assert restored._objects["image_1.jpg"][0].box.values == (0, 0, 160, 120)
+    assert list(restored._iter_records())[0][:2] == ("image_0.jpg", (640, 480))
+
+
+def test_dataframe_edits_leave_annotations_unchanged(annotations):
+    pytest.importorskip("pandas")
+    values, label_ids = annotations.table.values.copy(), annotations.table.label_ids.copy()
+    df = annotations.to_dataframe()
+    df.loc[0, "x_tl"] = 5
+    df.loc[:, "label_id"] = 2
+    assert df.loc[0, "x_tl"] == 5
+    np.testing.assert_array_equal(annotations.table.values, values)
+    np.testing.assert_array_equal(annotations.table.label_ids, label_ids)
+    assert annotations._objects["image_0.jpg"][0].box.values == (98, 345, 322, 117)
+
+
+def test_from_dataframe_labels_and_images():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {
+            "image_name": ["b.jpg", "a.jpg", "b.jpg"],
+            "image_width": [100, 200, 100],
+            "image_height": [50, 100, 50],
+            "label": ["dog", "cat", "bird"],
+            "x_c": [0.5, 0.5, 0.25],
+            "y_c": [0.5, 0.5, 0.25],
+            "w": [0.2, 0.2, 0.1],
+            "h": [0.2, 0.2, 0.1],
+        }
+    )
+    anns = Annotations.from_dataframe(df, annotation_type="yolo", class_names=["cat"])
+    assert anns.names_mapping == dict(cat=0, dog=1, bird=2)
+    assert anns.table.image_names == ["b.jpg", "a.jpg"]
+    np.testing.assert_array_equal(anns.table.label_ids, [1, 2, 0])
+    np.testing.assert_array_equal(anns.table.image_sizes, [[100, 50], [200, 100]])
+    with pytest.raises(ValueError):
+        Annotations.from_dataframe(df.drop(columns="w"), annotation_type="yolo")
+
+
+def test_missing_pandas(annotations, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    with pytest.raises(ImportError, match="pybboxes\\[pandas\\]"):
+        annotations.to_dataframe()
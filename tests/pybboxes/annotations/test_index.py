@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from pybboxes.annotations import Annotations
+from pybboxes.annotations.index import AnnotationIndex
+from pybboxes.annotations.table import AnnotationTable
+
+
+@pytest.fixture
+def annotations(coco_annotations):
+    records = [
+        (
+            "image_0.jpg",
+            (640, 480),
+            np.array([[98, 345, 322, 117], [10, 20, 30, 40], [0, 0, 5, 5]]),
+            ["cat", "dog", "cat"],
+        ),
+        ("image_1.jpg", (320, 240), np.array([[0, 0, 160, 120]]), ["dog"]),
+    ]
+    return coco_annotations(records, class_names=["cat", "dog", "bird"])
+
+
+def random_table(rng, num_boxes, image_names, num_labels=5):
+    corners = rng.uniform(0, 500, (num_boxes, 2))
+    values = np.rint(np.c_[corners, rng.uniform(1, 60, (num_boxes, 2))])
+    image_ids = np.sort(rng.integers(0, len(image_names), num_boxes))
+    sizes = np.full((len(image_names), 2), 640)
+    return AnnotationTable.from_rows(
+        "coco", values, rng.integers(0, num_labels, num_boxes), image_ids, image_names, sizes
+    )
+
+
+def assert_consistent(table):
+    index, expected = table.index, AnnotationIndex.build(table.label_ids, table.areas)
+    for label_id in range(max(index.num_labels, expected.num_labels)):
+        np.testing.assert_array_equal(index.label_rows(label_id), expected.label_rows(label_id))
+    np.testing.assert_array_equal(index.sorted_areas, expected.sorted_areas)
+    np.testing.assert_array_equal(table.areas[index.area_order], index.sorted_areas)
+
+
+def test_queries(annotations):
+    np.testing.assert_array_equal(annotations.label_indices("cat"), [0, 2])
+    np.testing.assert_array_equal(annotations.label_indices(1), [1, 3])
+    assert annotations.label_indices("bird").size == 0
+    assert annotations.label_counts() == {"cat": 2, "dog": 2, "bird": 0}
+    assert annotations.image_indices("image_0.jpg") == slice(0, 3)
+    assert annotations.image_indices("image_1.jpg") == slice(3, 4)
+    assert annotations.image_indices("missing.jpg") == slice(0, 0)
+    np.testing.assert_array_equal(annotations.area_indices(max_area=1200), [2, 1])
+    np.testing.assert_array_equal(annotations.area_indices(1200, 322 * 117), [1, 3, 0])
+    np.testing.assert_array_equal(annotations.area_indices(min_area=20000), [0])
+
+
+def test_index_read_only(annotations):
+    assert annotations.area_indices(1000, None).tolist() == [1, 3, 0]
+    for write in (
+        lambda: np.asarray(annotations).__setitem__(2, [0, 0, 50, 50]),
+        lambda: annotations.table.label_ids.__setitem__(2, 1),
+        lambda: annotations.label_indices("cat").__setitem__(0, 1),
+        lambda: annotations.area_indices().__setitem__(0, 1),
+    ):
+        with pytest.raises(ValueError, match="read-only"):
+            write()
+    # Queries still agree with the values
+    assert annotations.area_indices(1000, None).tolist() == [1, 3, 0]
+    assert annotations.label_indices("cat").tolist() == [0, 2]
+    assert_consistent(annotations.table)
+
+
+def test_remove(annotations):
+    annotations.label_indices("cat")
+    annotations.remove(annotations.label_indices("cat"))
+    assert annotations.label_counts() == {"cat": 0, "dog": 2, "bird": 0}
+    np.testing.assert_array_equal(annotations.label_indices("dog"), [0, 1])
+    annotations.remove(annotations.image_indices("image_0.jpg"))
+    assert annotations.table.image_names == ["image_1.jpg"]
+    assert annotations.image_indices("image_1.jpg") == slice(0, 1)
+    assert annotations.values.tolist() == [[0, 0, 160, 120]]
+
+
+def test_index_maintained():
+    rng = np.random.default_rng(0)
+    table = random_table(rng, 1000, [f"a{i}" for i in range(50)])
+    table.index
+    table = table.concat(random_table(rng, 300, [f"b{i}" for i in range(20)]))
+    assert table._index is not None
+    assert_consistent(table)
+    table = table.remove(rng.random(len(table)) < 0.3)
+    assert table._index is not None
+    assert_consistent(table)
+    table = table.remove(table.index.label_rows(4))
+    assert_consistent(table)
+    table = table.concat(random_table(rng, 100, ["c0"]), label_remap=np.array([0, 1, 2, 3, 7]))
+    assert_consistent(table)
+    assert table.index.label_counts()[4:7].tolist() == [0, 0, 0]
+    # Rows joining an existing image reorder the rows, the index is rebuilt
+    table = table.concat(random_table(rng, 10, ["a3"]))
+    assert table._index is None
+    assert_consistent(table)
+
+
+def test_index_updated_on_add(annotations):
+    annotations.label_indices("cat")
+    annotations._add_records([("image_2.jpg", (100, 100), np.array([[1, 1, 2, 2]]), ["cat"])])
+    np.testing.assert_array_equal(annotations.label_indices("cat"), [0, 2, 4])
+    np.testing.assert_array_equal(annotations.area_indices(max_area=4), [4])
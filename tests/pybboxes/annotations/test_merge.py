@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from pybboxes.annotations import Annotations, merge
+from pybboxes.annotations.streaming import write_voc
+
+
+@pytest.fixture
+def datasets(coco_annotations):
+    first = coco_annotations(
+        [
+            ("image_0.jpg", (640, 480), np.array([[10, 10, 100, 100], [200, 200, 50, 50]]), ["cat", "dog"]),
+            ("image_1.jpg", (320, 240), np.array([[0, 0, 160, 120]]), ["dog"]),
+        ],
+        ["cat", "dog"],
+        name="first",
+    )
+    second = coco_annotations(
+        [
+            # a near duplicate of the cat, the same box as another class and a new box
+            ("image_0.jpg", (640, 480), np.array([[12, 10, 100, 100], [200, 200, 50, 50]]), ["cat", "bird"]),
+            ("image_0.jpg", (640, 480), np.array([[400, 300, 20, 20]]), ["cat"]),
+            ("image_2.jpg", (100, 100), np.array([[0, 0, 10, 10]]), ["dog"]),
+        ],
+        ["bird", "dog", "cat"],
+        name="second",
+    )
+    return first, second
+
+
+def test_merge(datasets):
+    first, second = datasets
+    merged = first.merge(second)
+    assert merged._class_names == ["cat", "dog", "bird"]
+    assert merged.table.image_names == ["image_0.jpg", "image_1.jpg", "image_2.jpg"]
+    np.testing.assert_array_equal(merged.table.image_sizes, [[640, 480], [320, 240], [100, 100]])
+    np.testing.assert_array_equal(merged.table.label_ids, [0, 1, 0, 2, 0, 1, 1])
+    np.testing.assert_array_equal(merged.values[:5], np.concatenate([first.values[:2], second.values[:3]]))
+    assert merged.label_counts() == {"cat": 3, "dog": 3, "bird": 1}
+    # The sources are not changed
+    assert len(first) == 3 and len(second) == 4
+
+
+def test_merge_dedup(datasets):
+    first, second = datasets
+    merged = first.merge(second, dedup_iou=0.9)
+    assert len(merged) == 6
+    np.testing.assert_array_equal(merged.table.label_ids, [0, 1, 2, 0, 1, 1])
+    assert [12, 10, 100, 100] not in merged.values.tolist()
+    assert len(first.merge(second, dedup_iou=0.99)) == 7
+    # Duplicates within a dataset are kept
+    assert len(first.merge(first, first, dedup_iou=0.5)) == 3
+    assert len(first.merge(dedup_iou=0.5)) == 3
+
+
+def test_merge_annotation_types(datasets, tmp_path):
+    first, _ = datasets
+    write_voc(first._iter_records(), str(tmp_path / "voc"), bbox_type="voc")
+    voc = Annotations("voc")
+    voc.load_from_voc(str(tmp_path / "voc"))
+    merged = first.merge(voc, dedup_iou=0.9)
+    assert merged._annotation_type == "coco"
+    np.testing.assert_array_equal(merged.values, first.values)
+
+
+def test_duplicate_rows_large_groups(monkeypatch):
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 500, (400, 2))
+    boxes = np.c_[corners, corners + rng.uniform(20, 50, (400, 2))]
+    voc_values = np.concatenate([boxes, boxes + rng.integers(-1, 2, (400, 4)), boxes[::-1] + 100])
+    image_ids, label_ids = np.zeros(1200, dtype=int), rng.integers(0, 3, 1200)
+    label_ids[400:800] = label_ids[:400]
+    sources = np.repeat([0, 1, 2], 400)
+    expected = merge.duplicate_rows(voc_values, image_ids, label_ids, sources, 0.8)
+    assert expected[:400].sum() == 0 and expected[400:800].all()
+    monkeypatch.setattr(merge, "PAIRS_PER_CHUNK", 100)
+    np.testing.assert_array_equal(merge.duplicate_rows(voc_values, image_ids, label_ids, sources, 0.8), expected)
+    monkeypatch.setattr(merge, "MAX_DENSE_GROUP", 10)
+    np.testing.assert_array_equal(merge.duplicate_rows(voc_values, image_ids, label_ids, sources, 0.8), expected)
+
+
+@pytest.mark.parametrize("iou_threshold", [0, 0.5])
+def test_duplicate_rows_dense_and_sparse_agree(monkeypatch, iou_threshold):
+    # an overlapping, a touching and a disjoint box of a later source
+    voc_values = np.array([[0, 0, 10, 10], [5, 0, 15, 10], [10, 0, 20, 10], [50, 50, 60, 60]])
+    image_ids, label_ids, sources = np.zeros(4, dtype=int), np.zeros(4, dtype=int), np.array([0, 1, 1, 1])
+    dense = merge.duplicate_rows(voc_values, image_ids, label_ids, sources, iou_threshold)
+    monkeypatch.setattr(merge, "MAX_DENSE_GROUP", 1)
+    sparse = merge.duplicate_rows(voc_values, image_ids, label_ids, sources, iou_threshold)
+    np.testing.assert_array_equal(dense, [False, iou_threshold == 0, False, False])
+    np.testing.assert_array_equal(sparse, dense)
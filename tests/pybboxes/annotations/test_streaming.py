@@ -0,0 +1,141 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from pybboxes.annotations import Annotations, write_coco, write_voc, write_yolo
+from pybboxes.utils.io import write_jpeg_header
+from tests.utils import assert_almost_equal
+
+
+@pytest.fixture
+def coco_records():
+    return [
+        ("image_0.jpg", (640, 480), np.array([[98, 345, 322, 117], [10, 20, 30, 40]], dtype=float), ["cat", "dog"]),
+        ("image_1.jpg", (320, 240), np.array([[0, 0, 160, 120]], dtype=float), ["dog"]),
+        ("image_2.jpg", (320, 240), np.empty((0, 4)), []),
+    ]
+
+
+@pytest.fixture
+def coco_file(tmp_path, coco_records):
+    export_file = str(tmp_path / "annotations.json")
+    write_coco(iter(coco_records), export_file, bbox_type="coco")
+    return export_file
+
+
+def test_write_coco(coco_file):
+    with open(coco_file, "r") as f:
+        data = json.load(f)
+    assert len(data["images"]) == 3
+    assert len(data["annotations"]) == 3
+    assert [c["name"] for c in data["categories"]] == ["cat", "dog"]
+    assert data["annotations"][0]["bbox"] == [98, 345, 322, 117]
+
+
+def test_iter_from_coco(coco_file, coco_records):
+    anns = Annotations(annotation_type="coco")
+    records = list(anns.iter_from_coco(coco_file))
+    assert anns._objects == {}
+    assert [r[0] for r in records] == [r[0] for r in coco_records]
+    for actual, desired in zip(records, coco_records):
+        assert actual[1] == desired[1]
+        assert_almost_equal(actual=actual[2].tolist(), desired=desired[2].tolist())
+        assert actual[3] == desired[3]
+
+
+def test_iter_from_is_eager_on_type_check():
+    anns = Annotations(annotation_type="coco")
+    with pytest.raises(TypeError):
+        anns.iter_from_voc(labels_dir="./labels")
+
+
+def test_stream_coco_to_yolo(tmp_path, coco_file, coco_records):
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    for image_name, image_size, _, _ in coco_records:
+        write_jpeg_header(images_dir / image_name, image_size)
+
+    labels_dir = str(tmp_path / "labels")
+    class_names = write_yolo(Annotations("coco").iter_from_coco(coco_file), labels_dir, bbox_type="coco")
+    assert class_names == ["cat", "dog"]
+
+    anns = Annotations(annotation_type="yolo")
+    records = list(anns.iter_from_yolo(labels_dir, str(images_dir), os.path.join(labels_dir, "classes.txt")))
+    assert len(records) == 3
+    image_name, image_size, boxes, labels = records[0]
+    assert image_size == (640, 480)
+    assert labels == ["cat", "dog"]
+    assert_almost_equal(actual=boxes[0].tolist(), desired=[0.4047, 0.8406, 0.5031, 0.2437])
+
+
+def test_stream_coco_to_voc(tmp_path, coco_file):
+    labels_dir = str(tmp_path / "voc")
+    write_voc(Annotations("coco").iter_from_coco(coco_file), labels_dir, bbox_type="coco")
+
+    anns = Annotations(annotation_type="voc")
+    records = {r[0]: r for r in anns.iter_from_voc(labels_dir)}
+    assert len(records) == 3
+    assert_almost_equal(actual=records["image_0.jpg"][2].tolist(), desired=[[98, 345, 420, 462], [10, 20, 40, 60]])
+    assert records["image_2.jpg"][2].shape == (0, 4)
+    assert anns.names_mapping == dict(cat=0, dog=1)
+
+
+def test_load_from_coco_skips_empty_images(coco_file):
+    anns = Annotations(annotation_type="coco")
+    anns.load_from_coco(coco_file)
+    assert list(anns._objects) == ["image_0.jpg", "image_1.jpg"]
+    assert anns._objects["image_0.jpg"][1].box.values == (10, 20, 30, 40)
+    assert anns._objects["image_1.jpg"][0].label_id == 1
+
+
+def test_load_from_coco_boxes_from_segmentations(tmp_path):
+    # Column major runs, a 2x10 box at (20, 30)
+    rle = {"size": [240, 320], "counts": [20 * 240 + 30, 10, 230, 10, 240 * 320 - 21 * 240 - 40]}
+    data = {
+        "images": [{"id": 1, "file_name": "image.jpg", "width": 320, "height": 240}],
+        "categories": [{"id": 1, "name": "cat"}],
+        "annotations": [
+            {
+                "id": 1,
+                "image_id": 1,
+                "category_id": 1,
+                "bbox": [0, 0, 1, 1],
+                "segmentation": [[10, 20, 50, 25, 30, 60]],
+            },
+            {"id": 2, "image_id": 1, "category_id": 1, "bbox": [5, 5, 10, 10], "segmentation": []},
+            {"id": 3, "image_id": 1, "category_id": 1, "bbox": [0, 0, 1, 1], "segmentation": rle, "iscrowd": 1},
+        ],
+    }
+    json_path = str(tmp_path / "annotations.json")
+    with open(json_path, "w") as f:
+        json.dump(data, f)
+
+    (_, _, boxes, _) = next(Annotations("coco").iter_from_coco(json_path, boxes_from_segmentations=True))
+    assert_almost_equal(actual=boxes.tolist(), desired=[[10, 20, 40, 40], [5, 5, 10, 10], [20, 30, 2, 10]])
+    anns = Annotations(annotation_type="coco")
+    anns.load_from_coco(json_path, boxes_from_segmentations=True)
+    assert [ann.box.values for ann in anns._objects["image.jpg"]] == [(10, 20, 40, 40), (5, 5, 10, 10), (20, 30, 2, 10)]
+
+
+def test_load_from_coco_non_contiguous_category_ids(tmp_path):
+    data = {
+        "images": [{"id": 1, "file_name": "image.jpg", "width": 320, "height": 240}],
+        "categories": [{"id": 10, "name": "bird"}, {"id": 3, "name": "cat"}, {"id": 7, "name": "dog"}],
+        "annotations": [
+            {"id": 1, "image_id": 1, "category_id": 7, "bbox": [0, 0, 10, 10]},
+            {"id": 2, "image_id": 1, "category_id": 10, "bbox": [5, 5, 10, 10]},
+            {"id": 3, "image_id": 1, "category_id": 3, "bbox": [1, 1, 10, 10]},
+        ],
+    }
+    json_path = str(tmp_path / "annotations.json")
+    with open(json_path, "w") as f:
+        json.dump(data, f)
+
+    anns = Annotations(annotation_type="coco")
+    anns.load_from_coco(json_path)
+    assert anns._class_names == ["bird", "cat", "dog"]
+    objects = anns._objects["image.jpg"]
+    assert [ann.label_id for ann in objects] == [2, 0, 1]
+    assert [ann.label_name for ann in objects] == ["dog", "bird", "cat"]
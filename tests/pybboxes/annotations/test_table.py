@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from pybboxes.annotations import Annotations
+from pybboxes.annotations.streaming import write_voc
+from pybboxes.annotations.table import AnnotationTable
+from pybboxes.boxes import BoundingBox
+
+
+@pytest.fixture
+def records():
+    return [
+        ("image_0.jpg", (640, 480), np.array([[98, 345, 322, 117.4], [10, 20, 30, 40]]), ["cat", "dog"]),
+        ("image_1.jpg", (320, 240), np.empty((0, 4)), []),
+        ("image_2.jpg", (320, 240), np.array([[0, 0, 160, 120]]), ["dog"]),
+        ("image_0.jpg", (640, 480), np.array([[1, 2, 3, 4]]), ["bird"]),
+    ]
+
+
+def test_from_records(records):
+    table = AnnotationTable.from_records("coco", records, dict(cat=0, dog=1, bird=2), [[7, 8], [], [9], [10]])
+    assert table.image_names == ["image_0.jpg", "image_2.jpg"]
+    np.testing.assert_array_equal(table.offsets, [0, 3, 4])
+    np.testing.assert_array_equal(table.label_ids, [0, 1, 2, 1])
+    np.testing.assert_array_equal(table.annotation_ids, [7, 8, 10, 9])
+    assert table.values[table.image_rows(1)].tolist() == [[0, 0, 160, 120]]
+    np.testing.assert_array_equal(table.to_voc_array()[0], [98, 345, 420, 462])
+    image_name, image_size, boxes, labels = next(table.iter_records(["cat", "dog", "bird"]))
+    assert (image_name, image_size, labels) == ("image_0.jpg", (640, 480), ["cat", "dog", "bird"])
+    assert np.shares_memory(boxes, table.to_voc_array())
+
+
+def test_concat(records):
+    table = AnnotationTable.from_records("coco", records[:2], dict(cat=0, dog=1))
+    other = AnnotationTable.from_records("coco", records[2:], dict(bird=0, dog=1))
+    merged = table.concat(other, label_remap=np.array([2, 1]))
+    assert merged.image_names == ["image_0.jpg", "image_2.jpg"]
+    np.testing.assert_array_equal(merged.label_ids, [0, 1, 2, 1])
+    np.testing.assert_array_equal(merged.image_ids, [0, 0, 0, 1])
+    with pytest.raises(ValueError):
+        table.concat(AnnotationTable.empty("voc"))
+
+
+def test_pending_batches(coco_annotations, records):
+    anns = coco_annotations(records[:1])
+    anns.table.index
+    anns._update_class_names(["bird"])
+    for record in records[1:]:
+        anns._add_records([record])
+    assert len(anns._pending) == 3
+    expected = AnnotationTable.from_records("coco", records, dict(cat=0, dog=1, bird=2))
+    np.testing.assert_array_equal(anns.values, expected.values)
+    np.testing.assert_array_equal(anns.table.label_ids, expected.label_ids)
+    assert anns.table.image_names == expected.image_names and not anns._pending
+    np.testing.assert_array_equal(anns.label_indices("bird"), [2])
+
+
+def test_objects_match_box_classes(coco_annotations, records):
+    objects = coco_annotations(records)._objects
+    assert list(objects) == ["image_0.jpg", "image_2.jpg"]
+    expected = BoundingBox.from_coco(98, 345, 322, 117.4, image_size=(640, 480))
+    actual = objects["image_0.jpg"][0]
+    assert type(actual.box) is type(expected) and actual.box.values == expected.values
+    assert (actual.label_id, actual.label_name, actual.annotation_id) == (0, "cat", 0)
+    assert [ann.label_name for ann in objects["image_0.jpg"]] == ["cat", "dog", "bird"]
+
+
+def test_objects_are_read_only(coco_annotations, records):
+    anns = coco_annotations(records)
+    objects = anns._objects
+    with pytest.raises(TypeError):
+        objects["image_1.jpg"] = objects["image_0.jpg"]
+    with pytest.raises(AttributeError):
+        objects["image_0.jpg"].append(objects["image_2.jpg"][0])
+    assert len(anns._objects["image_0.jpg"]) == 3 and "image_1.jpg" not in anns._objects
+
+
+def test_load_validates_in_batch(tmp_path):
+    labels_dir = str(tmp_path / "voc")
+    oob_records = [("image.jpg", (100, 100), np.array([[10, 10, 20, 20], [50, 50, 120, 90]]), ["cat", "cat"])]
+    write_voc(iter(oob_records), labels_dir, bbox_type="voc")
+    anns = Annotations("voc")
+    with pytest.raises(ValueError):
+        anns.load_from_voc(labels_dir)
+    assert len(anns.table) == 0
+
+
+def test_annotations_zero_copy(coco_annotations):
+    records = [
+        ("image_0.jpg", (640, 480), np.array([[98, 345, 322, 117], [10, 20, 30, 40]]), ["cat", "dog"]),
+        ("image_1.jpg", (320, 240), np.array([[0, 0, 160, 120]]), ["dog"]),
+    ]
+    anns = coco_annotations(records)
+    values = np.asarray(anns)
+    assert values is anns.table.values
+    np.testing.assert_array_equal(values, [[98, 345, 322, 117], [10, 20, 30, 40], [0, 0, 160, 120]])
+    assert np.shares_memory(np.from_dlpack(anns), values)
+    assert np.shares_memory(np.from_dlpack(anns.table), values)
+
+
+def test_annotations_read_only(coco_annotations, tmp_path):
+    anns = coco_annotations([("image_0.jpg", (640, 480), np.array([[10, 20, 30, 40], [0, 0, 5, 5]]), ["cat", "dog"])])
+    anns.save_as_voc(str(tmp_path / "before"))
+    with pytest.raises(ValueError, match="read-only"):
+        np.asarray(anns)[0] = [0, 0, 50, 50]
+    with pytest.raises(ValueError, match="read-only"):
+        np.from_dlpack(anns)[0] = [0, 0, 50, 50]
+    with pytest.raises(ValueError, match="read-only"):
+        anns.table.to_voc_array()[0] = [0, 0, 50, 50]
+    # Nothing changed, what is saved matches the loaded boxes
+    anns.save_as_voc(str(tmp_path / "after"))
+    assert (tmp_path / "after" / "image_0.xml").read_text() == (tmp_path / "before" / "image_0.xml").read_text()
+    np.testing.assert_array_equal(anns.values, [[10, 20, 30, 40], [0, 0, 5, 5]])
+    # Writable copies are detached from the annotations
+    values = np.asarray(anns, copy=True)
+    values[0] = [0, 0, 50, 50]
+    np.testing.assert_array_equal(anns.table.to_voc_array()[0], [10, 20, 40, 60])
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from pybboxes.annotations import Annotations, AnnotationsView
+
+
+@pytest.fixture
+def annotations(coco_annotations):
+    records = [
+        (
+            "image_0.jpg",
+            (640, 480),
+            np.array([[98, 345, 322, 117], [10, 20, 30, 40], [0, 0, 5, 5], [600, 400, 100, 50]]),
+            ["cat", "dog", "cat", "bird"],
+        ),
+        ("image_1.jpg", (320, 240), np.array([[0, 0, 160, 120], [300, 10, 40, 10]]), ["dog", "cat"]),
+    ]
+    return coco_annotations(records, class_names=["cat", "dog", "bird"])
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_filter(annotations, indexed):
+    if indexed:
+        annotations.table.index
+    np.testing.assert_array_equal(annotations.filter(labels=["cat"]).indices, [0, 2, 5])
+    np.testing.assert_array_equal(annotations.filter(labels=["cat", 2]).indices, [0, 2, 3, 5])
+    np.testing.assert_array_equal(annotations.filter(area_min=1000).indices, [0, 1, 3, 4])
+    np.testing.assert_array_equal(annotations.filter(area_min=25, area_max=1200).indices, [1, 2, 5])
+    np.testing.assert_array_equal(annotations.filter(aspect_min=2).indices, [0, 3, 5])
+    np.testing.assert_array_equal(annotations.filter(oob=True).indices, [3, 5])
+    np.testing.assert_array_equal(annotations.filter(labels=["cat"], area_min=100, oob=False).indices, [0])
+    assert len(annotations.filter(labels=[])) == 0
+    with pytest.raises(ValueError):
+        annotations.filter(labels=["horse"])
+
+
+def test_view_is_lazy(annotations):
+    view = annotations.filter(oob=False)
+    assert isinstance(view, AnnotationsView) and not view.is_materialized
+    assert view._source is annotations.table
+    assert len(view) == 4
+    np.testing.assert_array_equal(view.values, annotations.values[[0, 1, 2, 4]])
+    np.testing.assert_array_equal(np.asarray(view), view.values)
+    nested = view.filter(labels=["dog"])
+    assert nested._source is annotations.table and not view.is_materialized
+    np.testing.assert_array_equal(nested.indices, [1, 4])
+
+
+def test_view_interop(annotations):
+    view = annotations.filter(oob=False)
+    # Copies of the rows until materialized, which are read-only so that writes are not lost silently
+    with pytest.raises(ValueError, match="read-only"):
+        np.asarray(view)[0] = [0, 0, 1, 1]
+    with pytest.raises(ValueError, match="materialized"):
+        np.asarray(view, copy=False)
+    with pytest.raises(BufferError, match="materialized"):
+        view.__dlpack__(copy=False)
+    np.testing.assert_array_equal(np.from_dlpack(view), annotations.values[[0, 1, 2, 4]])
+    assert not view.is_materialized
+    values = np.asarray(view.table, copy=False)
+    assert np.shares_memory(np.asarray(view, copy=False), values)
+    assert np.shares_memory(np.from_dlpack(view), values)
+
+
+def test_view_materializes_on_change(annotations):
+    view = annotations.filter(labels=["cat"])
+    view.remove([0])
+    assert view.is_materialized and view.indices is None
+    assert view.values.tolist() == [[0, 0, 5, 5], [300, 10, 40, 10]]
+    # The source is not affected and views of it are snapshots
+    assert len(annotations) == 6
+    other = annotations.filter(labels=["cat"])
+    annotations.remove(annotations.label_indices("cat"))
+    assert len(other) == 3 and len(annotations) == 3
+    assert other.label_counts() == {"cat": 3, "dog": 0, "bird": 0}
+
+
+def test_save_view(annotations, tmp_path):
+    view = annotations.filter(labels=["dog"])
+    view.save_as_coco(str(tmp_path / "dogs.json"))
+    assert view.is_materialized
+    loaded = Annotations("coco")
+    loaded.load_from_coco(str(tmp_path / "dogs.json"))
+    np.testing.assert_array_equal(loaded.values, annotations.values[[1, 4]])
+    assert loaded.table.image_names == ["image_0.jpg", "image_1.jpg"]
+    assert loaded.label_counts() == {"cat": 0, "dog": 2, "bird": 0}
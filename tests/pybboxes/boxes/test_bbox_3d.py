@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoundingBox3D, BoxArray3D, CenterBoundingBox3D
+
+
+@pytest.fixture
+def corners():
+    return np.array([[0, 0, 0, 2, 4, 6], [1, 1, 1, 3, 5, 2], [10, 10, 10, 11, 11, 11]], dtype=float)
+
+
+def test_bounding_box_3d_conversion():
+    box = BoundingBox3D(0, 0, 0, 2, 4, 6)
+    assert box.volume == 48 and box.size == (2, 4, 6)
+    assert box.to_center(return_values=True) == (1, 2, 3, 2, 4, 6)
+    center = box.to_center()
+    assert isinstance(center, CenterBoundingBox3D) and center.corners == box.corners
+    assert BoundingBox3D.from_center(1, 2, 3, 2, 4, 6).values == box.values
+    assert [b.values for b in CenterBoundingBox3D.from_array([[1, 2, 3, 2, 4, 6], [0, 0, 0, 1, 1, 1]])] == [
+        (1, 2, 3, 2, 4, 6),
+        (0, 0, 0, 1, 1, 1),
+    ]
+    with pytest.raises(ValueError):
+        BoundingBox3D(1, 0, 0, 0, 1, 1)
+    with pytest.raises(ValueError):
+        CenterBoundingBox3D(0, 0, 0, -1, 1, 1)
+
+
+def test_bounding_box_3d_computations():
+    box1, box2 = BoundingBox3D(0, 0, 0, 2, 4, 6), BoundingBox3D(1, 1, 1, 3, 5, 2)
+    assert box1 * box2 == 1 * 3 * 1
+    assert box1 + box2 == 48 + 8 - 3
+    assert box1.iou(box2) == pytest.approx(3 / 53)
+    assert box1.iou(BoundingBox3D(5, 5, 5, 6, 6, 6)) == 0
+
+
+def test_box_array_3d_matches_scalar(corners):
+    boxes = BoxArray3D(corners)
+    centers = boxes.convert("center")
+    np.testing.assert_allclose(centers.to_corners_array(), corners)
+    np.testing.assert_allclose(centers.volume, [48, 8, 1])
+    scalar_boxes = [BoundingBox3D(*values) for values in corners.tolist()]
+    expected = [[box1.iou(box2) for box2 in scalar_boxes] for box1 in scalar_boxes]
+    np.testing.assert_allclose(centers.iou_matrix(boxes), expected)
+    np.testing.assert_allclose(boxes.iou(boxes[::-1]), np.diag(np.array(expected)[:, ::-1]))
+    np.testing.assert_allclose(boxes.intersection(boxes[:1]), [48, 3, 0])
+
+
+def test_box_array_3d_sparse_iou():
+    rng = np.random.default_rng(0)
+    centers = np.c_[rng.uniform(0, 100, (500, 3)), rng.uniform(0.5, 5, (500, 3))]
+    boxes = BoxArray3D(centers, bbox_type="center")
+    others = BoxArray3D(centers + np.c_[rng.normal(0, 1, (500, 3)), np.zeros((500, 3))], bbox_type="center")
+    rows, cols, ious = boxes.sparse_iou(others, min_iou=0.1)
+    dense = boxes.iou_matrix(others)
+    expected_rows, expected_cols = np.nonzero(dense >= 0.1)
+    np.testing.assert_array_equal(rows, expected_rows)
+    np.testing.assert_array_equal(cols, expected_cols)
+    np.testing.assert_allclose(ious, dense[rows, cols])
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoundingBox, BoxArray, convert_bbox
+
+IMAGE_SIZE = (640, 480)
+
+
+@pytest.fixture
+def voc_boxes():
+    return np.array([[98, 345, 420, 462], [-10, 20, 100, 500], [600, 0, 700, 50]])
+
+
+def test_box_array_conversion(voc_boxes):
+    boxes = BoxArray(voc_boxes, bbox_type="voc", image_size=IMAGE_SIZE)
+    yolo = boxes.convert("yolo")
+    assert yolo.name == "yolo" and yolo.image_size == IMAGE_SIZE and len(yolo) == 3
+    expected = convert_bbox(voc_boxes[0].tolist(), from_type="voc", to_type="yolo", image_size=IMAGE_SIZE)
+    np.testing.assert_allclose(yolo.values[0], expected, atol=1e-4)
+    np.testing.assert_allclose(yolo.to_voc_array(), voc_boxes)
+    np.testing.assert_allclose(yolo[1:].values, yolo.values[1:])
+    with pytest.raises(ValueError):
+        BoxArray(yolo.values, bbox_type="yolo")
+
+
+def test_box_array_clamp_and_shift(voc_boxes):
+    boxes = BoxArray(voc_boxes, bbox_type="voc", image_size=IMAGE_SIZE)
+    assert boxes.is_oob.tolist() == [False, True, True]
+    for values, clamped in zip(voc_boxes.tolist(), boxes.clamp().values):
+        assert BoundingBox(*values, image_size=IMAGE_SIZE).clamp().values == tuple(clamped)
+    shifted = boxes.convert("albumentations").shift((0.1, -0.1))
+    expected = BoundingBox(*voc_boxes[0].tolist(), image_size=IMAGE_SIZE).to_albumentations().shift((0.1, -0.1))
+    np.testing.assert_allclose(shifted.values[0], expected.values, atol=1e-4)
+    np.testing.assert_allclose(boxes.area, [322 * 117, 110 * 480, 100 * 50])
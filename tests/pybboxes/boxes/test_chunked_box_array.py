@@ -0,0 +1,135 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray, ChunkedBoxArray
+from pybboxes.boxes.chunked_box_array import ChunkWriter, open_array
+
+IMAGE_SIZE = (640, 480)
+
+
+@pytest.fixture(scope="module")
+def voc_boxes():
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(-20, 600, (5000, 2))
+    return np.c_[corners, corners + rng.uniform(1, 80, (5000, 2))]
+
+
+@pytest.fixture(params=[".npy", ".bin"])
+def chunked_boxes(request, tmp_path, voc_boxes):
+    path = str(tmp_path / f"boxes{request.param}")
+    if request.param == ".npy":
+        np.save(path, voc_boxes)
+    else:
+        voc_boxes.tofile(path)
+    return ChunkedBoxArray.open(path, image_size=IMAGE_SIZE, chunk_size=333)
+
+
+def test_open(chunked_boxes, voc_boxes):
+    assert isinstance(chunked_boxes.values, np.memmap)
+    assert len(chunked_boxes) == len(voc_boxes)
+    np.testing.assert_array_equal(np.concatenate([values for values, _ in chunked_boxes.iter_chunks()]), voc_boxes)
+
+
+@pytest.mark.parametrize("to_type", ["coco", "yolo"])
+def test_convert(tmp_path, chunked_boxes, voc_boxes, to_type):
+    converted = chunked_boxes.convert(to_type, str(tmp_path / "converted.npy"))
+    expected = BoxArray(voc_boxes, image_size=IMAGE_SIZE).convert(to_type)
+    assert converted.name == to_type and converted.image_size == IMAGE_SIZE
+    np.testing.assert_array_equal(np.load(tmp_path / "converted.npy"), expected.values)
+
+
+def test_convert_dtype(tmp_path, chunked_boxes, voc_boxes):
+    converted = chunked_boxes.convert("coco", str(tmp_path / "converted.bin"), dtype="int32")
+    assert converted.values.dtype == np.int32
+    np.testing.assert_array_equal(converted.values, BoxArray(voc_boxes).convert("coco", dtype="int32").values)
+
+
+def test_drop_oob(tmp_path, chunked_boxes, voc_boxes):
+    oob = BoxArray(voc_boxes, image_size=IMAGE_SIZE).is_oob
+    assert chunked_boxes.count_oob() == oob.sum()
+    filtered = chunked_boxes.drop_oob(str(tmp_path / "filtered.npy"))
+    np.testing.assert_array_equal(filtered.values, voc_boxes[~oob])
+    assert filtered.count_oob() == 0
+
+
+def test_drop_oob_per_box_sizes(tmp_path, voc_boxes):
+    sizes = np.tile(IMAGE_SIZE, (len(voc_boxes), 1))
+    sizes[::2] = (320, 240)
+    boxes = ChunkedBoxArray(voc_boxes, image_size=sizes, chunk_size=1000)
+    with pytest.raises(ValueError):
+        boxes.drop_oob(str(tmp_path / "filtered.npy"))
+    filtered = boxes.drop_oob(str(tmp_path / "filtered.npy"), str(tmp_path / "sizes.npy"))
+    x_tl, y_tl, x_br, y_br = voc_boxes.T
+    keep = (x_tl >= 0) & (y_tl >= 0) & (x_br <= sizes[:, 0]) & (y_br <= sizes[:, 1])
+    np.testing.assert_array_equal(filtered.values, voc_boxes[keep])
+    np.testing.assert_array_equal(filtered.image_size, sizes[keep])
+
+
+def test_area_stats(chunked_boxes, voc_boxes):
+    areas = BoxArray(voc_boxes).area
+    stats = chunked_boxes.area_stats()
+    assert stats.count == len(areas)
+    np.testing.assert_allclose(
+        [stats.mean, stats.std, stats.min, stats.max], [areas.mean(), areas.std(), areas.min(), areas.max()]
+    )
+
+
+def test_empty(tmp_path):
+    path = str(tmp_path / "empty.bin")
+    open(path, "wb").close()
+    boxes = ChunkedBoxArray.open(path)
+    assert len(boxes) == 0 and boxes.area_stats().count == 0
+    assert len(boxes.save(str(tmp_path / "empty.npy"))) == 0
+
+
+def test_chunk_writer(tmp_path, voc_boxes):
+    path = str(tmp_path / "boxes.npy")
+    with ChunkWriter(path, dtype=np.float32) as writer:
+        for chunk in np.array_split(voc_boxes, 7):
+            writer.write(chunk)
+    np.testing.assert_array_equal(np.load(path), voc_boxes.astype(np.float32))
+    with pytest.raises(ValueError):
+        open_array(path, width=2)
+    (tmp_path / "truncated.bin").write_bytes(b"\0" * 12)
+    with pytest.raises(ValueError):
+        open_array(str(tmp_path / "truncated.bin"))
+
+
+def test_memory_bounded_by_chunk_size(tmp_path):
+    rng = np.random.default_rng(1)
+    corners = rng.uniform(0, 500, (200000, 2))
+    np.save(tmp_path / "boxes.npy", np.c_[corners, corners + rng.uniform(1, 80, (200000, 2))])
+    boxes = ChunkedBoxArray.open(str(tmp_path / "boxes.npy"), image_size=IMAGE_SIZE, chunk_size=2000)
+    tracemalloc.start()
+    try:
+        boxes.convert("yolo", str(tmp_path / "yolo.npy"))
+        boxes.area_stats()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The file holds 6.4 MB of boxes, a chunk 64 kB
+    assert peak < 1_000_000
+
+
+def test_failed_write_leaves_no_file(tmp_path, chunked_boxes):
+    path = tmp_path / "boxes_uint8.npy"
+    with pytest.raises(ValueError):
+        chunked_boxes.save(str(path), dtype="uint8")
+    assert list(tmp_path.glob("boxes_uint8*")) == []
+
+    np.save(path, np.zeros((1, 4), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        chunked_boxes.save(str(path), dtype="uint8")
+    np.testing.assert_array_equal(np.load(path), np.zeros((1, 4), dtype=np.uint8))
+
+
+def test_write_to_source_file(chunked_boxes, voc_boxes):
+    with pytest.raises(ValueError, match="read from this file"):
+        chunked_boxes.save(chunked_boxes.values.filename)
+    with pytest.raises(ValueError, match="read from this file"):
+        chunked_boxes.convert("coco", chunked_boxes.values.filename)
+    with pytest.raises(ValueError, match="read from this file"):
+        chunked_boxes.drop_oob(chunked_boxes.values.filename)
+    np.testing.assert_array_equal(chunked_boxes.values, voc_boxes)
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray, RotatedBoundingBox, RotatedBoxArray, convert_bbox
+from pybboxes.ops import convex_intersection_area, pairwise_rotated_iou, rotated_iou, rotated_to_polygons
+
+
+def clipped_area(subject, clipper):
+    """Sutherland-Hodgman clipping of a convex polygon, both given counterclockwise."""
+
+    def inside(p, a, b):
+        return (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0]) >= 0
+
+    def crossing(p, q, a, b):
+        d1, d2 = q - p, b - a
+        t = ((a[0] - p[0]) * d2[1] - (a[1] - p[1]) * d2[0]) / (d1[0] * d2[1] - d1[1] * d2[0])
+        return p + t * d1
+
+    output = list(subject)
+    for i in range(len(clipper)):
+        a, b = clipper[i], clipper[(i + 1) % len(clipper)]
+        points, output = output, []
+        for j in range(len(points)):
+            p, q = points[j], points[(j + 1) % len(points)]
+            if inside(q, a, b):
+                if not inside(p, a, b):
+                    output.append(crossing(p, q, a, b))
+                output.append(q)
+            elif inside(p, a, b):
+                output.append(crossing(p, q, a, b))
+        if not output:
+            return 0.0
+    x, y = np.array(output).T
+    return abs(np.sum(x * np.roll(y, -1) - y * np.roll(x, -1))) / 2
+
+
+def is_counterclockwise(polygon):
+    (x0, y0), (x1, y1), (x2, y2) = polygon[:3]
+    return (x1 - x0) * (y2 - y1) - (y1 - y0) * (x2 - x1) > 0
+
+
+@pytest.fixture
+def rotated_boxes():
+    rng = np.random.default_rng(0)
+    boxes1 = np.c_[rng.uniform(0, 20, (200, 2)), rng.uniform(2, 10, (200, 2)), rng.uniform(-3, 3, 200)]
+    boxes2 = boxes1 + np.c_[rng.normal(0, 3, (200, 2)), rng.uniform(-1, 1, (200, 2)), rng.normal(0, 1, 200)]
+    return boxes1, boxes2
+
+
+def test_rotated_bounding_box():
+    box = RotatedBoundingBox(50, 40, 20, 10, np.pi / 2, image_size=(100, 80))
+    np.testing.assert_allclose(box.to_polygon(), [[55, 30], [55, 50], [45, 50], [45, 30]], atol=1e-9)
+    assert box.to_voc(return_values=True) == (45, 30, 55, 50)
+    assert box.to_yolo(return_values=True) == convert_bbox((45, 30, 55, 50), "voc", "yolo", image_size=(100, 80))
+    restored = RotatedBoundingBox.from_polygon(box.to_polygon())
+    np.testing.assert_allclose(restored.values, box.values)
+    # A square rotated by 45 degrees against itself unrotated
+    square, diamond = RotatedBoundingBox(0, 0, 2, 2, 0), RotatedBoundingBox(0, 0, 2, 2, np.pi / 4)
+    assert square.intersection(diamond) == pytest.approx(8 * (np.sqrt(2) - 1))
+    assert square.iou(RotatedBoundingBox(10, 0, 2, 2, 0.3)) == 0
+    with pytest.raises(ValueError):
+        RotatedBoundingBox(0, 0, -1, 2, 0)
+
+
+def test_rotated_iou_matches_polygon_clipping(rotated_boxes):
+    boxes1, boxes2 = RotatedBoxArray(rotated_boxes[0]), RotatedBoxArray(rotated_boxes[1])
+    expected = []
+    for box1, box2 in zip(boxes1.to_polygons(), boxes2.to_polygons()):
+        # Polygons with a mirrored orientation are reversed to counterclockwise for the reference
+        box1, box2 = [p if is_counterclockwise(p) else p[::-1] for p in (box1, box2)]
+        expected.append(clipped_area(box1, box2))
+    intersection = convex_intersection_area(boxes1.to_polygons(), boxes2.to_polygons())
+    np.testing.assert_allclose(intersection, expected, atol=1e-9)
+    assert (intersection > 0).sum() > 100
+    ious = boxes1.iou(boxes2)
+    np.testing.assert_allclose(ious, intersection / (boxes1.area + boxes2.area - intersection))
+    np.testing.assert_allclose(boxes1.iou(boxes1), 1)
+
+
+def test_rotated_iou_coincident_edges(rotated_boxes):
+    box = np.array([15.123, 5.8947, 13.2636, 3.9695, 1.4475])
+    assert rotated_iou(box, box + [0, 0, 0, 0, np.pi]) == pytest.approx(1)
+    boxes = rotated_boxes[0]
+    for angle in (np.pi / 2, np.pi, -np.pi, 2 * np.pi):
+        square = np.c_[boxes[:, :2], boxes[:, 2], boxes[:, 2], boxes[:, 4]]
+        np.testing.assert_allclose(rotated_iou(square, square + [0, 0, 0, 0, angle]), 1)
+    np.testing.assert_allclose(rotated_iou(boxes, boxes + [0, 0, 0, 0, np.pi]), 1)
+    # Boxes sharing an edge, rotated together
+    for angle in (0, 0.3, np.pi / 2, 2.5):
+        direction = np.array([np.cos(angle), np.sin(angle)])
+        left = [0, 0, 10, 4, angle]
+        assert rotated_iou(left, [*(10 * direction), 10, 4, angle]) == pytest.approx(0, abs=1e-12)
+        assert rotated_iou(left, [*(5 * direction), 10, 4, angle]) == pytest.approx(1 / 3)
+        assert rotated_iou(left, [*(2.5 * direction), 5, 4, angle]) == pytest.approx(1 / 2)
+        assert rotated_iou(left, [0, 0, 10, 2, angle]) == pytest.approx(1 / 2)
+
+
+def test_rotated_iou_matrix(rotated_boxes):
+    boxes1, boxes2 = RotatedBoxArray(rotated_boxes[0][:40]), RotatedBoxArray(rotated_boxes[1][:50])
+    matrix = boxes1.iou_matrix(boxes2)
+    assert matrix.shape == (40, 50)
+    np.testing.assert_allclose(matrix, rotated_iou(boxes1.values[:, None], boxes2.values[None]), atol=1e-12)
+
+
+def test_rotated_iou_disjoint_and_empty():
+    boxes1, boxes2 = RotatedBoxArray([[0, 0, 2, 2, 0]]), RotatedBoxArray([[100, 100, 2, 2, 0], [50, 0, 2, 2, 1]])
+    np.testing.assert_array_equal(boxes1.iou_matrix(boxes2), [[0, 0]])
+    np.testing.assert_array_equal(pairwise_rotated_iou(boxes1.values, boxes2.values), [[0, 0]])
+    empty = np.empty((0, 5))
+    assert rotated_iou(empty, empty).shape == (0,)
+    assert pairwise_rotated_iou(empty, boxes2.values).shape == (0, 2)
+    assert pairwise_rotated_iou(boxes2.values, empty).shape == (2, 0)
+    assert convex_intersection_area(np.empty((0, 4, 2)), np.empty((0, 4, 2))).shape == (0,)
+
+
+def test_rotated_box_array_conversions(rotated_boxes):
+    boxes = RotatedBoxArray(rotated_boxes[0], image_size=(640, 480))
+    restored = RotatedBoxArray.from_polygons(boxes.to_polygons().reshape(-1, 8))
+    np.testing.assert_allclose(restored.to_polygons(), boxes.to_polygons(), atol=1e-9)
+    enclosing = boxes.to_box_array("coco")
+    assert isinstance(enclosing, BoxArray) and enclosing.name == "coco"
+    for values, expected in zip(boxes.values[:10].tolist(), enclosing.values[:10]):
+        polygon = rotated_to_polygons(np.array(values))
+        np.testing.assert_allclose(expected[:2], polygon.min(axis=0))
+        np.testing.assert_allclose(expected[2:], polygon.max(axis=0) - polygon.min(axis=0))
+    assert np.all(boxes.to_box_array("yolo").values[:, 2:] > 0)
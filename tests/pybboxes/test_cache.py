@@ -0,0 +1,99 @@
+import itertools
+
+import pytest
+
+from pybboxes import BoundingBox, cache
+from pybboxes.functional import convert_bbox
+
+BOX_TYPES = ["albumentations", "coco", "fiftyone", "voc", "yolo"]
+
+
+@pytest.fixture
+def boxes(albumentations_bbox, coco_bbox, fiftyone_bbox, voc_bbox, yolo_bbox):
+    return dict(
+        albumentations=albumentations_bbox, coco=coco_bbox, fiftyone=fiftyone_bbox, voc=voc_bbox, yolo=yolo_bbox
+    )
+
+
+def test_disabled_by_default():
+    assert not cache.enabled()
+    assert cache.get_cache() is None
+
+
+@pytest.mark.parametrize("from_type,to_type", list(itertools.product(BOX_TYPES, BOX_TYPES)))
+def test_cached_conversion_matches_uncached(boxes, image_size, from_type, to_type):
+    expected = convert_bbox(boxes[from_type], from_type=from_type, to_type=to_type, image_size=image_size)
+    with cache.conversion_cache() as conversions:
+        first = convert_bbox(boxes[from_type], from_type=from_type, to_type=to_type, image_size=image_size)
+        hits = conversions.hits
+        second = convert_bbox(boxes[from_type], from_type=from_type, to_type=to_type, image_size=image_size)
+        assert conversions.hits == hits + 1
+    assert first == second == expected
+
+
+def test_only_requested_conversions_are_counted(coco_bbox, image_size):
+    with cache.conversion_cache() as conversions:
+        convert_bbox(coco_bbox, from_type="coco", to_type="yolo", image_size=image_size)
+        assert conversions.info() == (0, 1, 0, 4096, 1)
+        convert_bbox(coco_bbox, from_type="coco", to_type="yolo", image_size=image_size)
+        assert conversions.info() == (1, 1, 0, 4096, 1)
+
+    with cache.conversion_cache() as conversions:
+        box = BoundingBox.from_coco(*coco_bbox, image_size=image_size)
+        assert conversions.info() == (0, 0, 0, 4096, 0)
+        box.to_yolo()
+        assert conversions.info() == (0, 1, 0, 4096, 1)
+        box.to_yolo()
+        box.to_yolo(return_values=True)
+        assert conversions.info() == (1, 2, 0, 4096, 2)
+
+
+def test_cached_box_objects_are_not_shared(coco_bbox, image_size):
+    with cache.conversion_cache():
+        box = BoundingBox.from_coco(*coco_bbox, image_size=image_size)
+        yolo1 = box.to_yolo()
+        yolo2 = box.to_yolo()
+        assert yolo1 is not yolo2
+        yolo1.shift((0.01, 0.01))
+        assert yolo2.values == box.to_yolo(return_values=True) != yolo1.values
+        assert repr(yolo2) == repr(BoundingBox.from_coco(*coco_bbox, image_size=image_size).to_yolo())
+
+
+def test_strict_is_part_of_the_key(image_size):
+    oob_box = (98, 345, 580, 245)
+    with cache.conversion_cache():
+        converted = convert_bbox(oob_box, from_type="coco", to_type="voc", image_size=image_size, strict=False)
+        assert converted == (98, 345, 678, 590)
+        with pytest.raises(ValueError):
+            convert_bbox(oob_box, from_type="coco", to_type="voc", image_size=image_size, strict=True)
+        box = convert_bbox(
+            oob_box, from_type="coco", to_type="voc", image_size=image_size, strict=False, return_values=False
+        )
+        assert box.is_oob and not box.strict
+
+
+def test_lru_eviction(image_size):
+    with cache.conversion_cache(maxsize=2) as conversions:
+        for x in range(10):
+            convert_bbox((x, 10, 20, 20), from_type="coco", to_type="voc")
+        info = conversions.info()
+    assert info.currsize == 2
+    assert info.evictions > 0
+    assert not cache.enabled()
+
+
+def test_invalidate_and_clear(coco_bbox):
+    conversions = cache.enable()
+    try:
+        convert_bbox(coco_bbox, from_type="coco", to_type="yolo", image_size=(640, 480))
+        convert_bbox(coco_bbox, from_type="coco", to_type="yolo", image_size=(1280, 960))
+        size = len(conversions)
+        removed = conversions.invalidate(image_size=(640, 480))
+        assert 0 < removed < size
+        assert conversions.invalidate(from_type="coco", to_type="yolo", image_size=(1280, 960)) > 0
+        assert conversions.invalidate(from_type="coco", to_type="yolo") == 0
+        conversions.clear()
+        assert conversions.info() == (0, 0, 0, 4096, 0)
+    finally:
+        cache.disable()
+    assert cache.get_cache() is None
@@ -0,0 +1,59 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from pybboxes.annotations import Annotations, write_coco
+from pybboxes.cli import main
+from pybboxes.utils.io import write_jpeg_header
+
+
+@pytest.fixture
+def coco_file(tmp_path):
+    records = [
+        (f"image_{i}.jpg", (640, 480), np.array([[98, 345, 322, 117], [10, 20, 30, 40]], dtype=float), ["cat", "dog"])
+        for i in range(10)
+    ]
+    export_file = str(tmp_path / "annotations.json")
+    write_coco(records, export_file, bbox_type="coco")
+    return export_file
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_coco_to_voc(tmp_path, coco_file, capsys, workers):
+    output = str(tmp_path / "voc")
+    argv = ["convert", "--from", "coco", "--to", "voc", "--json-path", coco_file, "--output", output]
+    assert main(argv + ["--workers", str(workers), "--chunk-size", "3"]) == 0
+
+    assert len(os.listdir(output)) == 10
+    summary = capsys.readouterr().out
+    assert "10 images (20 boxes)" in summary
+    assert "images/s" in summary and "boxes/s" in summary and "peak RSS" in summary
+
+    records = list(Annotations("voc").iter_from_voc(output))
+    assert records[0][2].tolist() == [[98, 345, 420, 462], [10, 20, 40, 60]]
+
+
+def test_convert_yolo_to_coco(tmp_path, coco_file):
+    yolo_dir = str(tmp_path / "yolo")
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    for i in range(10):
+        write_jpeg_header(images_dir / f"image_{i}.jpg", (640, 480))
+    main(["convert", "--from", "coco", "--to", "yolo", "--json-path", coco_file, "--output", yolo_dir])
+
+    output = str(tmp_path / "out.json")
+    argv = ["convert", "--from", "yolo", "--to", "coco", "--labels-dir", yolo_dir, "--images-dir", str(images_dir)]
+    main(argv + ["--output", output, "--workers", "2", "--chunk-size", "4"])
+
+    with open(output, "r") as f:
+        data = json.load(f)
+    assert [image["file_name"] for image in data["images"]] == [f"image_{i}.jpg" for i in range(10)]
+    assert data["annotations"][0]["bbox"] == [98, 345, 322, 117]
+    assert [c["name"] for c in data["categories"]] == ["cat", "dog"]
+
+
+def test_convert_requires_source_arguments(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["convert", "--from", "yolo", "--to", "coco", "--output", str(tmp_path / "out.json")])
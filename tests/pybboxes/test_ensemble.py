@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from pybboxes import convert_bbox
+from pybboxes.ensemble import fuse_boxes
+
+
+def reference_fusion(boxes_list, scores_list, labels_list, weights, iou_threshold, skip_box_threshold, method):
+    """
+    Box by box WBF over VOC boxes, fused boxes recomputed from the cluster members.
+    """
+
+    def iou(a, b):
+        w = max(0.0, min(a[2], b[2]) - max(a[0], b[0]))
+        h = max(0.0, min(a[3], b[3]) - max(a[1], b[1]))
+        union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - w * h
+        return w * h / union
+
+    records = [
+        (label, -score * weight, box, score * weight)
+        for boxes, scores, labels, weight in zip(boxes_list, scores_list, labels_list, weights)
+        for box, score, label in zip(boxes, scores, labels)
+        if score >= skip_box_threshold
+    ]
+    records.sort(key=lambda record: record[:2])
+    results = []
+    for label in sorted({record[0] for record in records}):
+        clusters = []
+        for _, _, box, score in (record for record in records if record[0] == label):
+            fused = [
+                np.average([b for b, _ in members], axis=0, weights=[s for _, s in members])
+                if method == "wbf"
+                else members[0][0]
+                for members in clusters
+            ]
+            ious = [iou(box, f) for f in fused]
+            if ious and max(ious) > iou_threshold:
+                clusters[int(np.argmax(ious))].append((box, score))
+            else:
+                clusters.append([(box, score)])
+        for members in clusters:
+            member_boxes, member_scores = np.array([b for b, _ in members]), np.array([s for _, s in members])
+            if method == "max":
+                results.append((member_boxes[0], member_scores[0], label))
+                continue
+            score = member_scores.mean() * min(len(weights), len(members)) / sum(weights)
+            results.append((np.average(member_boxes, axis=0, weights=member_scores), score, label))
+    results.sort(key=lambda result: -result[1])
+    return np.array([r[0] for r in results]), np.array([r[1] for r in results]), np.array([r[2] for r in results])
+
+
+@pytest.fixture
+def predictions():
+    rng = np.random.default_rng(3)
+    objects = np.c_[rng.uniform(0, 500, (40, 2)), rng.uniform(20, 120, (40, 2))]
+    objects[:, 2:] += objects[:, :2]
+    object_labels = rng.integers(0, 3, len(objects))
+    boxes_list, scores_list, labels_list = [], [], []
+    for _ in range(4):
+        detected = rng.random(len(objects)) < 0.8
+        boxes_list.append(objects[detected] + rng.normal(0, 4, (detected.sum(), 4)))
+        scores_list.append(rng.uniform(0.05, 1, detected.sum()))
+        labels_list.append(object_labels[detected])
+    return boxes_list, scores_list, labels_list
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("method", ["wbf", "average", "max"])
+@pytest.mark.parametrize("weights", [None, [2, 1, 1, 0.5]])
+def test_fuse_boxes(predictions, method, weights):
+    boxes_list, scores_list, labels_list = predictions
+    boxes, scores, labels = fuse_boxes(
+        boxes_list,
+        scores_list,
+        labels_list,
+        bbox_type="voc",
+        method=method,
+        weights=weights,
+        iou_threshold=0.55,
+        skip_box_threshold=0.1,
+    )
+    expected_boxes, expected_scores, expected_labels = reference_fusion(
+        boxes_list, scores_list, labels_list, weights or [1] * 4, 0.55, 0.1, method
+    )
+    np.testing.assert_allclose(scores, expected_scores)
+    np.testing.assert_array_equal(labels, expected_labels)
+    np.testing.assert_allclose(boxes, expected_boxes)
+
+
+def test_fuse_boxes_formats_and_labels():
+    voc_boxes = [[[10, 10, 50, 50], [100, 100, 150, 140]], [[12, 10, 52, 50]]]
+    scores = [[0.9, 0.8], [0.6]]
+    labels = [["cat", "dog"], ["cat"]]
+    boxes, fused_scores, fused_labels = fuse_boxes(voc_boxes, scores, labels, bbox_type="voc")
+    assert fused_labels.tolist() == ["cat", "dog"]
+    np.testing.assert_allclose(boxes[0], [10 + 2 * 0.6 / 1.5, 10, 50 + 2 * 0.6 / 1.5, 50])
+    np.testing.assert_allclose(fused_scores, [0.75, 0.4])
+
+    yolo_boxes = [
+        [convert_bbox(box, from_type="voc", to_type="yolo", image_size=(200, 200)) for box in model_boxes]
+        for model_boxes in voc_boxes
+    ]
+    yolo_fused, _, _ = fuse_boxes(yolo_boxes, scores, labels, bbox_type="yolo", image_size=(200, 200))
+    expected = [convert_bbox(box, from_type="voc", to_type="yolo", image_size=(200, 200)) for box in boxes]
+    np.testing.assert_allclose(yolo_fused, expected, atol=1e-2)
+
+    _, max_scores, _ = fuse_boxes(voc_boxes, scores, labels, bbox_type="voc", conf_type="max", weights=[2, 1])
+    np.testing.assert_allclose(max_scores, [0.9, 0.8])
+
+
+@pytest.mark.parametrize("method", ["wbf", "average", "max"])
+def test_fuse_boxes_empty(method):
+    for predictions in (([np.empty((0, 4))], [[]], [[]]), ([], [], []), ([[], []], [[], []], [[], []])):
+        boxes, scores, labels = fuse_boxes(*predictions, bbox_type="voc", method=method)
+        assert boxes.shape == (0, 4) and scores.shape == (0,) and labels.shape == (0,)
+    boxes, _, _ = fuse_boxes([], [], [], bbox_type="yolo", image_size=(640, 480))
+    assert boxes.shape == (0, 4)
+
+
+@pytest.mark.filterwarnings("error")
+def test_fuse_boxes_separate_objects():
+    """clusters of objects far apart are built independently, with the same result as box by box"""
+    rng = np.random.default_rng(0)
+    objects = np.c_[np.arange(50) * 100.0, np.zeros(50), np.arange(50) * 100.0 + 50, np.full(50, 50.0)]
+    boxes_list = [objects + rng.normal(0, 2, objects.shape) for _ in range(3)]
+    scores_list = [rng.random(50) for _ in range(3)]
+    labels_list = [np.zeros(50, dtype=int)] * 3
+    # Touching objects are fused with a zero threshold, exactly as box by box
+    touching = [objects[:2] * [1, 1, 2, 1], objects[:2] * [1, 1, 2, 1] + [0, 0, 1e-9, 0]]
+    for predictions, iou_threshold in (
+        ((boxes_list, scores_list, labels_list), 0.55),
+        ((touching, [[0.9, 0.8]] * 2, [[0, 0]] * 2), 0),
+    ):
+        boxes, scores, labels = fuse_boxes(*predictions, bbox_type="voc", iou_threshold=iou_threshold)
+        expected = reference_fusion(*predictions, [1] * len(predictions[0]), iou_threshold, 0, "wbf")
+        np.testing.assert_allclose(boxes, expected[0])
+        np.testing.assert_allclose(scores, expected[1])
+
+
+def test_fuse_boxes_invalid_arguments():
+    with pytest.raises(ValueError):
+        fuse_boxes([[[0, 0, 1, 1]]], [[1.0]], [[0]], method="nms")
+    with pytest.raises(ValueError):
+        fuse_boxes([[[0, 0, 1, 1]]], [[1.0]], [[0]], conf_type="median")
+    with pytest.raises(ValueError):
+        fuse_boxes([[[0, 0, 1, 1]]], [[1.0]], [[0]], weights=[1, 2])
+    with pytest.raises(ValueError):
+        fuse_boxes([[[0, 0, 1, 1]]], [[1.0], [0.5]], [[0]])
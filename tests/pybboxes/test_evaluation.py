@@ -0,0 +1,134 @@
+import contextlib
+import io
+import json
+
+import numpy as np
+import pytest
+from pycocotools.coco import COCO
+from pycocotools.cocoeval import COCOeval
+
+from pybboxes.annotations import Annotations
+from pybboxes.evaluation import DetectionEvaluator
+from pybboxes.functional import convert_bbox
+from pybboxes.utils.synthetic import generate_dataset
+
+
+@pytest.fixture(scope="module")
+def reference(tmp_path_factory):
+    """Synthetic ground truth with jittered, partially missing and false positive predictions."""
+    output_dir = tmp_path_factory.mktemp("evaluation")
+    json_path = generate_dataset(
+        str(output_dir), "coco", num_images=40, write_images=False, num_classes=4, box_scale=(0.01, 0.6)
+    )["json_path"]
+    ground_truth = Annotations("coco")
+    ground_truth.load_from_coco(json_path)
+    # COCOeval takes matches to the annotation with id 0 as unmatched, shift the ids for the reference.
+    with open(json_path, "r") as f:
+        data = json.load(f)
+    for annotation in data["annotations"]:
+        annotation["id"] += 1
+    with open(json_path, "w") as f:
+        json.dump(data, f)
+
+    rng = np.random.default_rng(0)
+    predictions = []
+    for image_name, _, boxes, labels in ground_truth._iter_records():
+        coco_boxes = np.c_[boxes[:, :2], boxes[:, 2:] - boxes[:, :2]]
+        keep = rng.random(len(boxes)) < 0.8
+        num_fp = rng.integers(0, 5)
+        pred_boxes = np.r_[
+            coco_boxes[keep] * rng.uniform(0.85, 1.15, size=(keep.sum(), 4)),
+            np.c_[rng.uniform(0, 300, (num_fp, 2)), rng.uniform(5, 200, (num_fp, 2))],
+        ]
+        pred_labels = [label for label, k in zip(labels, keep) if k] + [
+            f"class_{i}" for i in rng.integers(0, 4, num_fp)
+        ]
+        # Rounded scores to have ties
+        scores = np.round(rng.random(len(pred_boxes)), 2)
+        predictions.append((image_name, pred_boxes, scores, pred_labels))
+    return json_path, ground_truth, predictions
+
+
+def cocoeval_stats(json_path, predictions):
+    with contextlib.redirect_stdout(io.StringIO()):
+        coco = COCO(json_path)
+        image_ids = {image["file_name"]: image_id for image_id, image in coco.imgs.items()}
+        category_ids = {category["name"]: category_id for category_id, category in coco.cats.items()}
+        detections = [
+            {"image_id": image_ids[image_name], "bbox": box, "score": score, "category_id": category_ids[label]}
+            for image_name, boxes, scores, labels in predictions
+            for box, score, label in zip(boxes.tolist(), scores.tolist(), labels)
+        ]
+        coco_eval = COCOeval(coco, coco.loadRes(detections), "bbox")
+        coco_eval.evaluate()
+        coco_eval.accumulate()
+        coco_eval.summarize()
+    return coco_eval
+
+
+def test_matches_cocoeval(reference):
+    json_path, ground_truth, predictions = reference
+    evaluator = DetectionEvaluator(ground_truth)
+    for prediction in predictions:
+        evaluator.update(*prediction, bbox_type="coco")
+    summary = evaluator.compute()
+
+    coco_eval = cocoeval_stats(json_path, predictions)
+    assert list(summary) == [
+        "AP", "AP50", "AP75", "AP_small", "AP_medium", "AP_large",
+        "AR1", "AR10", "AR100", "AR_small", "AR_medium", "AR_large",
+    ]  # fmt: skip
+    np.testing.assert_allclose(list(summary.values()), coco_eval.stats, atol=1e-12)
+    np.testing.assert_allclose(evaluator.precision, coco_eval.eval["precision"], atol=1e-12)
+    np.testing.assert_allclose(evaluator.recall, coco_eval.eval["recall"], atol=1e-12)
+
+
+def test_incremental_update(reference):
+    _, ground_truth, predictions = reference
+    expected = DetectionEvaluator(ground_truth)
+    for prediction in predictions:
+        expected.update(*prediction)
+    expected = expected.compute()
+
+    evaluator = DetectionEvaluator(ground_truth)
+    for image_name, boxes, scores, labels in predictions[:20]:
+        evaluator.update(image_name, boxes, scores, labels)
+    partial = evaluator.compute()
+    # Predictions of an image may also arrive in several calls
+    for image_name, boxes, scores, labels in predictions[20:]:
+        evaluator.update(image_name, boxes[:1], scores[:1], labels[:1])
+        evaluator.update(image_name, boxes[1:], scores[1:], labels[1:])
+    assert evaluator.compute() == expected
+    assert partial != expected
+
+    evaluator.reset()
+    assert evaluator.compute()["AP"] == 0
+
+
+def test_label_ids_and_normalized_boxes(reference):
+    _, ground_truth, predictions = reference
+    expected = DetectionEvaluator(ground_truth)
+    evaluator = DetectionEvaluator(ground_truth)
+    image_sizes = {record[0]: record[1] for record in ground_truth._iter_records()}
+    for image_name, boxes, scores, labels in predictions:
+        expected.update(image_name, boxes, scores, labels)
+        image_size = image_sizes[image_name]
+        yolo_boxes = np.array(
+            [convert_bbox(box, from_type="coco", to_type="yolo", image_size=image_size) for box in boxes.tolist()]
+        )
+        label_ids = [ground_truth.label2id(label) for label in labels]
+        evaluator.update(image_name, yolo_boxes, scores, label_ids, bbox_type="yolo")
+    np.testing.assert_allclose(list(evaluator.compute().values()), list(expected.compute().values()), atol=1e-2)
+
+
+def test_perfect_predictions(reference):
+    _, ground_truth, _ = reference
+    evaluator = DetectionEvaluator(ground_truth, iou_thresholds=[0.5, 0.75], max_detections=[100])
+    for image_name, _, boxes, labels in ground_truth._iter_records():
+        # Predictions of labels unknown to the ground truth are ignored
+        boxes = np.r_[boxes, [[0, 0, 10, 10]]]
+        evaluator.update(image_name, boxes, np.ones(len(boxes)), labels + ["unknown"], bbox_type="voc")
+    summary = evaluator.compute()
+    assert summary["AP"] == pytest.approx(1.0)
+    assert summary["AR100"] == pytest.approx(1.0)
+    assert "AR10" not in summary
@@ -1,4 +1,19 @@
-from pybboxes.functional import compute_area, convert_bbox
+import numpy as np
+import pytest
+
+from pybboxes.functional import (
+    compute_area,
+    compute_ciou,
+    compute_diou,
+    compute_giou,
+    compute_intersection,
+    compute_iou,
+    compute_iou_matrix,
+    compute_union,
+    convert_bbox,
+    pack_polygons,
+    polygons_to_bbox,
+)
 from tests.utils import assert_almost_equal
 
 
@@ -65,3 +80,92 @@ def test_area_voc(voc_bbox, bbox_area, image_size):
 def test_area_yolo(yolo_bbox, bbox_area, image_size):
     area = compute_area(yolo_bbox, bbox_type="yolo", image_size=image_size)
     assert_almost_equal(actual=int(area), desired=bbox_area)
+
+
+@pytest.mark.parametrize("bbox_type", ["albumentations", "coco", "fiftyone", "voc", "yolo"])
+def test_vectorized_computations_match_scalar(request, bbox_type, image_size):
+    boxes = request.getfixturevalue(f"multiple_{bbox_type}_bboxes").reshape(-1, 4)[:50]
+    boxes1, boxes2 = boxes[:25], boxes[25:]
+    for fn in (compute_intersection, compute_union, compute_iou):
+        actual = fn(boxes1, boxes2, bbox_type=bbox_type, image_size=image_size)
+        assert isinstance(actual, np.ndarray) and actual.shape == (25,)
+        desired = [fn(b1, b2, bbox_type=bbox_type, image_size=image_size) for b1, b2 in zip(boxes1, boxes2)]
+        assert_almost_equal(actual=actual.tolist(), desired=desired)
+    areas = compute_area(boxes, bbox_type=bbox_type, image_size=image_size)
+    assert areas.tolist() == [compute_area(box, bbox_type=bbox_type, image_size=image_size) for box in boxes]
+
+
+def test_vectorized_broadcasting(coco_bbox):
+    boxes = np.array([coco_bbox, [0, 0, 10, 10], [400, 450, 10, 10]])
+    assert compute_intersection(boxes, coco_bbox).tolist() == [322 * 117, 0, 10 * 10]
+    pairwise = compute_iou(boxes[:, None], boxes[None], bbox_type="coco")
+    assert pairwise.shape == (3, 3)
+    assert_almost_equal(actual=np.diag(pairwise).tolist(), desired=[1.0, 1.0, 1.0])
+
+
+def test_vectorized_per_box_image_size(yolo_bbox, bbox_area, image_size):
+    boxes = np.array([yolo_bbox, yolo_bbox])
+    image_sizes = np.array([image_size, (2 * image_size[0], 2 * image_size[1])])
+    areas = compute_area(boxes, bbox_type="yolo", image_size=image_sizes)
+    assert_almost_equal(actual=areas.tolist(), desired=[bbox_area, 4 * bbox_area], decimal=2)
+
+
+def test_vectorized_validation(image_size):
+    with pytest.raises(ValueError):
+        compute_area(np.array([[10, 10, 5, 20]]), bbox_type="voc")
+    with pytest.raises(ValueError):
+        compute_area(np.array([[600, 10, 50, 20]]), bbox_type="coco", image_size=image_size, strict=True)
+    with pytest.raises(ValueError):
+        compute_area(np.array([[0.5, 0.5, 0.2, 0.2]]), bbox_type="yolo")
+    assert compute_area(np.array([[600, 10, 50, 20]]), bbox_type="coco", image_size=image_size).tolist() == [1000]
+
+
+def test_giou_diou_ciou_scalar():
+    assert_almost_equal(actual=compute_giou([0, 0, 10, 10], [20, 20, 10, 10]), desired=-700 / 900)
+    # Center distance 50, enclosing diagonal 15^2 + 15^2
+    assert_almost_equal(actual=compute_diou([0, 0, 10, 10], [5, 5, 10, 10]), desired=25 / 175 - 50 / 450)
+    # Same aspect ratio, CIoU reduces to DIoU
+    assert compute_ciou([0, 0, 10, 10], [5, 5, 10, 10]) == compute_diou([0, 0, 10, 10], [5, 5, 10, 10])
+    for fn in (compute_iou, compute_giou, compute_diou, compute_ciou):
+        assert_almost_equal(actual=fn([1, 2, 3, 4], [1, 2, 3, 4]), desired=1.0)
+
+
+@pytest.mark.parametrize("bbox_type", ["albumentations", "coco", "fiftyone", "voc", "yolo"])
+@pytest.mark.parametrize("metric", ["iou", "giou", "diou", "ciou"])
+def test_iou_metrics_vectorized(request, bbox_type, metric, image_size):
+    boxes = request.getfixturevalue(f"multiple_{bbox_type}_bboxes").reshape(-1, 4)
+    boxes1, boxes2 = boxes[:20], boxes[20:30]
+    fn = globals()[f"compute_{metric}"]
+
+    elementwise = fn(boxes1[:10], boxes2, bbox_type=bbox_type, image_size=image_size)
+    desired = [fn(b1, b2, bbox_type=bbox_type, image_size=image_size) for b1, b2 in zip(boxes1[:10], boxes2)]
+    assert_almost_equal(actual=elementwise.tolist(), desired=desired)
+
+    matrix = compute_iou_matrix(boxes1, boxes2, bbox_type=bbox_type, metric=metric, image_size=image_size)
+    assert matrix.shape == (20, 10)
+    desired = [[fn(b1, b2, bbox_type=bbox_type, image_size=image_size) for b2 in boxes2] for b1 in boxes1]
+    assert_almost_equal(actual=matrix.tolist(), desired=desired)
+
+
+def test_iou_matrix_unknown_metric(coco_bbox):
+    with pytest.raises(ValueError):
+        compute_iou_matrix([coco_bbox], [coco_bbox], metric="jaccard")
+
+
+def test_polygons_to_bbox(image_size):
+    polygons = [
+        [[10, 20, 50, 25, 30, 60]],
+        [],
+        [[0, 0, 5, 5, 0, 5], [100, 200, 110, 190, 105, 220]],  # parts of an object are bounded together
+    ]
+    coords, offsets = pack_polygons(polygons)
+    assert coords.shape == (9, 2) and offsets.tolist() == [0, 3, 3, 9]
+    boxes = polygons_to_bbox(coords, offsets, bbox_type="voc")
+    assert_almost_equal(actual=boxes[[0, 2]].tolist(), desired=[[10, 20, 50, 60], [0, 0, 110, 220]])
+    assert np.isnan(boxes[1]).all()
+    yolo_boxes = polygons_to_bbox(coords.ravel(), offsets, bbox_type="yolo", image_size=image_size)
+    assert_almost_equal(
+        actual=yolo_boxes[0].tolist(),
+        desired=list(convert_bbox([10, 20, 50, 60], from_type="voc", to_type="yolo", image_size=image_size)),
+        decimal=4,
+    )
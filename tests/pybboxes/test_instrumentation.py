@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+
+from pybboxes import BoundingBox, instrumentation
+from pybboxes.annotations import Annotations, write_coco
+from pybboxes.functional import convert_bbox
+
+
+def test_disabled_by_default(coco_bbox, image_size):
+    assert not instrumentation.enabled()
+    BoundingBox.from_coco(*coco_bbox, image_size=image_size)
+    assert instrumentation._collector is None
+
+
+def test_collect_constructions_and_conversions(coco_bbox, image_size):
+    with instrumentation.collect() as stats:
+        assert instrumentation.enabled()
+        convert_bbox(coco_bbox, from_type="coco", to_type="yolo", image_size=image_size)
+        convert_bbox(coco_bbox, from_type="coco", to_type="yolo", image_size=image_size)
+    assert not instrumentation.enabled()
+
+    snapshot = stats.snapshot()
+    assert snapshot["conversions"] == {"coco->yolo": 2}
+    # coco -> (generic) voc -> yolo, the yolo box also validates through voc per conversion
+    assert snapshot["constructions"] == {
+        "CocoBoundingBox": 2,
+        "BoundingBox": 2,
+        "VocBoundingBox": 2,
+        "YoloBoundingBox": 2,
+    }
+    assert snapshot["stages"]["convert_bbox"]["calls"] == 2
+    assert snapshot["stages"]["convert_bbox"]["seconds"] >= snapshot["stages"]["load_bbox"]["seconds"] >= 0
+
+    # nothing is recorded after the context exits
+    convert_bbox(coco_bbox, from_type="coco", to_type="yolo", image_size=image_size)
+    assert stats.snapshot()["conversions"] == {"coco->yolo": 2}
+
+
+def test_collect_annotation_io(tmp_path):
+    records = [("image_0.jpg", (640, 480), np.array([[98, 345, 420, 462]], dtype=float), ["cat"])]
+    export_file = str(tmp_path / "annotations.json")
+    with instrumentation.collect() as stats:
+        write_coco(records, export_file, bbox_type="voc")
+        anns = Annotations(annotation_type="coco")
+        anns.load_from_coco(export_file)
+        anns.save_as_voc(str(tmp_path / "voc"))
+
+    snapshot = json.loads(stats.to_json())
+    assert snapshot["io"]["files_written"] == 2
+    assert snapshot["io"]["files_read"] == 1
+    assert snapshot["io"]["bytes_read"] == (tmp_path / "annotations.json").stat().st_size
+    assert snapshot["conversions"]["voc->coco"] == 1
+    assert {"write_coco", "annotations.load_from_coco", "annotations.save_as_voc"} <= set(snapshot["stages"])
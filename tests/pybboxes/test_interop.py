@@ -0,0 +1,49 @@
+import sys
+
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray, BoxArray3D, RotatedBoxArray
+
+
+@pytest.fixture
+def voc_boxes():
+    return np.array([[10, 20, 30, 40], [0, 0, 640, 480], [100.5, 200.25, 300, 400]])
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_box_array_zero_copy(voc_boxes, dtype):
+    values = voc_boxes.astype(dtype)
+    boxes = BoxArray.from_dlpack(values, bbox_type="voc", image_size=(640, 480))
+    assert np.shares_memory(boxes.values, values)
+    assert np.asarray(boxes) is boxes.values
+    exported = np.from_dlpack(boxes)
+    assert np.shares_memory(exported, values) and exported.dtype == dtype
+    exported[0, 0] = 11
+    assert boxes.values[0, 0] == 11
+    assert boxes.__dlpack_device__() == values.__dlpack_device__()
+
+
+def test_array_protocol_copies(voc_boxes):
+    boxes = BoxArray(voc_boxes)
+    assert not np.shares_memory(np.array(boxes, copy=True), boxes.values)
+    assert np.asarray(boxes, dtype=np.float32).dtype == np.float32
+    with pytest.raises(ValueError):
+        np.asarray(boxes, dtype=np.float32, copy=False)
+    # Integer inputs are stored as float, so constructing from them casts once
+    assert not np.shares_memory(BoxArray.from_dlpack(np.zeros((2, 4), dtype=np.int32)).values, voc_boxes)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="buffer protocol for Python classes requires PEP 688")
+def test_buffer_protocol(voc_boxes):
+    view = memoryview(BoxArray(voc_boxes))
+    assert view.shape == (3, 4) and view.format == "d"
+
+
+def test_box_arrays_3d_and_rotated_zero_copy():
+    values_3d = np.array([[0, 0, 0, 1, 2, 3]], dtype=np.float32)
+    boxes_3d = BoxArray3D.from_dlpack(values_3d)
+    assert np.shares_memory(np.from_dlpack(boxes_3d), values_3d)
+    values_rotated = np.array([[5, 5, 2, 1, 0.3]])
+    rotated = RotatedBoxArray.from_dlpack(values_rotated, image_size=(10, 10))
+    assert np.shares_memory(np.asarray(rotated), values_rotated)
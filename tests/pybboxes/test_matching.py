@@ -0,0 +1,88 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from pybboxes.functional import compute_iou_matrix
+from pybboxes.matching import linear_sum_assignment, match_boxes, sparse_iou
+
+
+def random_coco_boxes(rng, n, extent=1000):
+    return np.c_[rng.uniform(0, extent, (n, 2)), rng.uniform(10, 100, (n, 2))]
+
+
+@pytest.fixture
+def box_sets():
+    rng = np.random.default_rng(42)
+    boxes1 = random_coco_boxes(rng, 300)
+    jitter = np.c_[rng.normal(0, 8, (len(boxes1), 2)), rng.uniform(-5, 5, (len(boxes1), 2))]
+    boxes2 = np.r_[boxes1 + jitter, random_coco_boxes(rng, 50)]
+    return boxes1, boxes2, rng.random(len(boxes1))
+
+
+def brute_force_assignment_cost(cost):
+    n, m = cost.shape
+    if n > m:
+        return brute_force_assignment_cost(cost.T)
+    return min(cost[np.arange(n), list(p)].sum() for p in itertools.permutations(range(m), n))
+
+
+def test_linear_sum_assignment():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        n, m = rng.integers(1, 6, size=2).tolist()
+        cost = rng.integers(0, 4, size=(n, m)).astype(float)  # integer costs to have ties
+        rows, cols = linear_sum_assignment(cost)
+        assert len(rows) == len(set(cols.tolist())) == min(n, m)
+        assert cost[rows, cols].sum() == pytest.approx(brute_force_assignment_cost(cost))
+
+
+def test_sparse_iou_matches_dense(box_sets):
+    boxes1, boxes2, _ = box_sets
+    rows, cols, ious = sparse_iou(boxes1, boxes2, bbox_type="coco")
+    dense = compute_iou_matrix(boxes1, boxes2, bbox_type="coco")
+    # compute_iou_matrix rounds coordinates as the box classes, the sparse computation keeps them.
+    np.testing.assert_allclose(ious, dense[rows, cols], atol=0.1)
+    rows, cols, ious = sparse_iou(boxes1, boxes2, bbox_type="coco", min_iou=0.5)
+    assert ious.min() >= 0.5
+
+
+def test_greedy_and_hungarian():
+    boxes1 = [[2.5, 0, 12.5, 10], [4, 0, 14, 10]]
+    boxes2 = [[0, 0, 10, 10], [3, 0, 13, 10]]
+    greedy = match_boxes(boxes1, boxes2, bbox_type="voc", scores=[0.9, 0.8])
+    assert greedy.pairs.tolist() == [[0, 1]]
+    assert greedy.unmatched1.tolist() == [1] and greedy.unmatched2.tolist() == [0]
+    # Scores decide the order, box 1 takes its best match first and box 0 falls back to its second best
+    assert match_boxes(boxes1, boxes2, bbox_type="voc", scores=[0.1, 0.8]).pairs.tolist() == [[0, 0], [1, 1]]
+    # Without scores, pairs are taken in descending IoU
+    assert match_boxes(boxes1, boxes2, bbox_type="voc").pairs.tolist() == [[0, 1]]
+
+    hungarian = match_boxes(boxes1, boxes2, bbox_type="voc", method="hungarian")
+    assert hungarian.pairs.tolist() == [[0, 0], [1, 1]]
+    np.testing.assert_allclose(hungarian.ious, [7.5 / 12.5, 9 / 11])
+
+
+def test_hungarian_is_optimal(box_sets):
+    boxes1, boxes2, scores = box_sets
+    hungarian = match_boxes(boxes1, boxes2, iou_threshold=0.3, method="hungarian")
+    greedy = match_boxes(boxes1, boxes2, iou_threshold=0.3, scores=scores)
+    assert hungarian.ious.sum() >= greedy.ious.sum()
+
+    rows, cols, ious = sparse_iou(boxes1, boxes2, min_iou=0.3)
+    gain = np.zeros((len(boxes1), len(boxes2)))
+    gain[rows, cols] = ious
+    assert hungarian.ious.sum() == pytest.approx(gain[linear_sum_assignment(-gain)].sum())
+    for result in (hungarian, greedy):
+        assert len(np.unique(result.pairs[:, 0])) == len(np.unique(result.pairs[:, 1])) == len(result.pairs)
+        assert result.ious.min() >= 0.3
+        assert len(result.pairs) + len(result.unmatched1) == len(boxes1)
+        assert len(result.pairs) + len(result.unmatched2) == len(boxes2)
+
+
+def test_no_overlaps():
+    result = match_boxes([[0, 0, 10, 10]], [[50, 50, 10, 10], [80, 80, 5, 5]], method="hungarian")
+    assert result.pairs.shape == (0, 2)
+    assert result.unmatched1.tolist() == [0] and result.unmatched2.tolist() == [0, 1]
+    with pytest.raises(ValueError):
+        match_boxes([[0, 0, 10, 10]], [[0, 0, 10, 10]], method="auction")
@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray, BoxArray3D, RotatedBoxArray, ops, parallel
+from pybboxes.functional import compute_iou_matrix
+
+
+@pytest.fixture(scope="module")
+def voc_boxes():
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 500, (200, 2))
+    return np.c_[corners, corners + rng.uniform(1, 80, (200, 2))]
+
+
+@pytest.mark.parametrize("metric", ["iou", "giou"])
+def test_compute_iou_matrix_workers(voc_boxes, metric):
+    expected = compute_iou_matrix(voc_boxes, voc_boxes[:150], bbox_type="voc", metric=metric)
+    result = compute_iou_matrix(voc_boxes, voc_boxes[:150], bbox_type="voc", metric=metric, workers=2)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_box_array_3d_iou_matrix_workers():
+    rng = np.random.default_rng(1)
+    corners = rng.uniform(0, 50, (60, 3))
+    boxes = BoxArray3D(np.c_[corners, corners + rng.uniform(1, 10, (60, 3))])
+    np.testing.assert_array_equal(boxes.iou_matrix(boxes, workers=2), boxes.iou_matrix(boxes))
+
+
+def test_rotated_iou_workers():
+    rng = np.random.default_rng(2)
+    boxes = RotatedBoxArray(np.c_[rng.uniform(0, 100, (80, 2)), rng.uniform(2, 20, (80, 2)), rng.uniform(-3, 3, 80)])
+    others = boxes[::-1]
+    np.testing.assert_allclose(boxes.iou(others, workers=2), boxes.iou(others))
+    np.testing.assert_allclose(boxes.iou_matrix(others, workers=2), boxes.iou_matrix(others))
+
+
+def test_map_rows(voc_boxes):
+    fn = partial(ops.pairwise, ops.box_iou)
+    expected = fn(voc_boxes, voc_boxes)
+    result = parallel.map_rows(fn, [voc_boxes], [voc_boxes], (len(voc_boxes),), workers=3, chunk_size=7)
+    np.testing.assert_array_equal(result, expected)
+    # Single process and single row inputs run inline
+    np.testing.assert_array_equal(parallel.map_rows(fn, [voc_boxes], [voc_boxes], (len(voc_boxes),)), expected)
+    assert parallel.map_rows(fn, [voc_boxes[:1]], [voc_boxes], (len(voc_boxes),), workers=2).shape == (1, 200)
+
+
+@pytest.mark.parametrize("workers", [0, -2])
+def test_map_rows_invalid_workers(voc_boxes, workers):
+    with pytest.raises(ValueError):
+        compute_iou_matrix(voc_boxes, voc_boxes, bbox_type="voc", workers=workers)
+
+
+def test_shared_array(voc_boxes):
+    with parallel.SharedArray.from_array(voc_boxes) as shared:
+        attached = parallel.SharedArray.attach(shared.spec)
+        np.testing.assert_array_equal(attached.array, voc_boxes)
+        attached.array[0, 0] = -1
+        assert shared.array[0, 0] == -1
+        attached.close()
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Many chunks on the small inputs of the tests
+    monkeypatch.setattr(parallel, "CHUNK_ELEMENTS", 64)
+
+
+@pytest.mark.parametrize("to_type", ["coco", "yolo"])
+@pytest.mark.parametrize("dtype", [None, np.float32])
+def test_convert_threads(voc_boxes, small_chunks, to_type, dtype):
+    boxes = BoxArray(voc_boxes, image_size=(640, 480))
+    expected = boxes.convert(to_type, dtype=dtype)
+    result = boxes.convert(to_type, dtype=dtype, threads=3)
+    assert result.values.dtype == expected.values.dtype
+    np.testing.assert_array_equal(result.values, expected.values)
+    np.testing.assert_array_equal(boxes.clamp(threads=3).values, boxes.clamp().values)
+
+
+def test_per_box_image_sizes_threads(voc_boxes, small_chunks):
+    sizes = np.random.default_rng(3).integers(100, 600, (len(voc_boxes), 2))
+    expected = ops.from_voc_array(voc_boxes, "yolo", sizes)
+    np.testing.assert_array_equal(ops.from_voc_array(voc_boxes, "yolo", sizes, threads=4), expected)
+    np.testing.assert_array_equal(
+        ops.to_voc_array(expected, "yolo", sizes, threads=4), ops.to_voc_array(expected, "yolo", sizes)
+    )
+    np.testing.assert_array_equal(ops.box_clamp(voc_boxes, sizes, threads=4), ops.box_clamp(voc_boxes, sizes))
+
+
+def test_iou_matrix_threads(voc_boxes, small_chunks):
+    expected = compute_iou_matrix(voc_boxes, voc_boxes[:150], bbox_type="voc", metric="diou")
+    result = compute_iou_matrix(voc_boxes, voc_boxes[:150], bbox_type="voc", metric="diou", threads=4)
+    np.testing.assert_array_equal(result, expected)
+    with pytest.raises(ValueError):
+        compute_iou_matrix(voc_boxes, voc_boxes, bbox_type="voc", workers=2, threads=2)
+
+
+def test_global_threads(voc_boxes, small_chunks):
+    expected = compute_iou_matrix(voc_boxes, voc_boxes, bbox_type="voc")
+    try:
+        assert parallel.set_threads(4) == parallel.get_threads() == 4
+        # Concurrent callers, e.g. the request threads of a server, share the pool
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: compute_iou_matrix(voc_boxes, voc_boxes, bbox_type="voc"), range(8)))
+    finally:
+        parallel.set_threads(None)
+    assert parallel.get_threads() == 1
+    for result in results:
+        np.testing.assert_array_equal(result, expected)
+    with pytest.raises(ValueError):
+        parallel.set_threads(0)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray, convert_bbox, ops, precision
+from pybboxes.annotations.streaming import read_voc_file
+
+
+@pytest.fixture
+def yolo_boxes():
+    rng = np.random.default_rng(0)
+    centers, sizes = rng.uniform(0.3, 0.7, (100, 2)), rng.uniform(0.05, 0.5, (100, 2))
+    return np.c_[centers, sizes]
+
+
+@pytest.fixture(autouse=True)
+def reset_policy():
+    yield
+    precision.reset()
+
+
+def test_kernels_keep_float32(yolo_boxes):
+    boxes = yolo_boxes.astype(np.float32)
+    voc_boxes = ops.to_voc_array(boxes, "yolo", (640, 480), round_values=False)
+    assert voc_boxes.dtype == np.float32
+    assert ops.from_voc_array(voc_boxes, "coco", round_values=False).dtype == np.float32
+    assert ops.box_clamp(voc_boxes, (640, 480)).dtype == np.float32
+    np.testing.assert_allclose(voc_boxes, ops.to_voc_array(yolo_boxes, "yolo", (640, 480), False), rtol=1e-6)
+    # Integer inputs are computed in float64
+    assert ops.to_voc_array(np.array([[1, 2, 3, 4]]), "voc").dtype == np.float64
+
+
+def test_cast_rounding():
+    values = np.array([[0.5, 1.5, 2.5, 3.49]])
+    np.testing.assert_array_equal(precision.cast(values, np.int32), [[0, 2, 2, 3]])
+    assert [round(v) for v in values[0].tolist()] == precision.cast(values, np.int32)[0].tolist()
+    with pytest.raises(ValueError):
+        precision.cast(np.array([[-1.0, 0, 10, 10]]), np.uint16)
+    with pytest.raises(ValueError):
+        precision.cast(np.array([[np.nan, 0, 10, 10]]), np.int32)
+    values = np.zeros((2, 4), dtype=np.int32)
+    assert precision.cast(values, np.int32) is values
+    with pytest.raises(ValueError):
+        precision.set_policy(normalized="int32")
+    with pytest.raises(ValueError):
+        BoxArray(np.zeros((1, 4)), "yolo", (640, 480), dtype=np.uint16)
+
+
+def test_box_array_dtypes(yolo_boxes):
+    assert BoxArray(yolo_boxes.astype(np.float32), "yolo", (640, 480)).convert("coco").values.dtype == np.float32
+    assert BoxArray([[1, 2, 3, 4]]).values.dtype == np.float64
+    boxes = BoxArray(yolo_boxes, "yolo", (640, 480)).convert("voc", dtype=np.uint16)
+    assert boxes.values.dtype == np.uint16
+    assert boxes.convert("coco").values.dtype == np.uint16
+    assert boxes.convert("yolo").values.dtype == np.float64
+    assert boxes[:10].values.dtype == np.uint16 and boxes.clamp().values.dtype == np.uint16
+    assert boxes.area.dtype == np.float64
+    expected = [convert_bbox(box, "yolo", "voc", image_size=(640, 480)) for box in yolo_boxes.tolist()]
+    np.testing.assert_array_equal(boxes.values, expected)
+
+
+def test_policy(yolo_boxes):
+    with precision.dtype_policy(normalized="float32", pixel="int32") as policy:
+        assert policy == precision.get_policy()
+        boxes = BoxArray(yolo_boxes, "yolo", (640, 480))
+        assert boxes.values.dtype == np.float32
+        assert boxes.convert("coco").values.dtype == np.int32
+        assert boxes.convert("coco", dtype=np.float64).values.dtype == np.float64
+    assert precision.get_policy() == precision.DtypePolicy()
+    assert BoxArray(yolo_boxes, "yolo", (640, 480)).values.dtype == np.float64
+
+
+def test_record_boxes_policy(tmp_path):
+    labels_path = tmp_path / "image.xml"
+    labels_path.write_text(
+        "<annotation><filename>image.jpg</filename><size><width>640</width><height>480</height></size>"
+        "<object><name>cat</name><bndbox><xmin>1</xmin><ymin>2</ymin><xmax>30</xmax><ymax>40</ymax></bndbox>"
+        "</object></annotation>"
+    )
+    assert read_voc_file(str(labels_path))[2].dtype == np.float64
+    with precision.dtype_policy(pixel="uint16"):
+        boxes = read_voc_file(str(labels_path))[2]
+    assert boxes.dtype == np.uint16
+    np.testing.assert_array_equal(boxes, [[1, 2, 30, 40]])
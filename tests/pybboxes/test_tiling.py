@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoundingBox, convert_bbox
+from pybboxes.tiling import tile_boxes, tile_windows, untile_boxes
+
+
+def test_tile_windows():
+    windows = tile_windows(image_size=(250, 100), tile_size=100, overlap=0.2)
+    assert windows.tolist() == [[0, 0, 100, 100], [80, 0, 180, 100], [150, 0, 250, 100]]
+    windows = tile_windows(image_size=(50, 300), tile_size=(100, 150))
+    assert windows.tolist() == [[0, 0, 50, 150], [0, 150, 50, 300]]
+    with pytest.raises(ValueError):
+        tile_windows(image_size=(50, 50), tile_size=10, overlap=1)
+
+
+def test_tile_boxes_match_shift_and_clamp():
+    rng = np.random.default_rng(0)
+    image_size = (1000, 800)
+    boxes = np.c_[rng.integers(0, 900, (200, 2)), rng.integers(1, 150, (200, 2))]
+    windows = tile_windows(image_size, tile_size=256, overlap=0.25)
+    tiled = tile_boxes(boxes, windows, bbox_type="coco", min_visibility=0.25)
+
+    expected_count = 0
+    for tile, (tile_boxes_, indices, visibility) in enumerate(
+        zip(tiled.split(), tiled.split(tiled.indices), tiled.split(tiled.visibility))
+    ):
+        x_tl, y_tl, x_br, y_br = windows[tile].tolist()
+        expected = {}
+        for index, box in enumerate(boxes.tolist()):
+            voc = BoundingBox.from_array(convert_bbox(box, from_type="coco", to_type="voc"))
+            if voc * BoundingBox(x_tl, y_tl, x_br, y_br) == 0:
+                continue
+            clamped = BoundingBox(*voc.values, image_size=(x_br - x_tl, y_br - y_tl)).shift((-x_tl, -y_tl))
+            clamped.clamp()
+            x1, y1, x2, y2 = clamped.values
+            if (x2 - x1) * (y2 - y1) / voc.area >= 0.25:
+                expected[index] = convert_bbox(clamped.values, from_type="voc", to_type="coco")
+        assert indices.tolist() == sorted(expected)
+        np.testing.assert_allclose(tile_boxes_, [expected[i] for i in indices.tolist()] or np.empty((0, 4)))
+        assert np.all(visibility >= 0.25) and np.all(visibility <= 1)
+        expected_count += len(expected)
+    assert len(tiled.boxes) == expected_count
+
+
+def test_untile_boxes_roundtrip():
+    image_size = (640, 480)
+    windows = tile_windows(image_size, tile_size=320, overlap=0.5)
+    boxes = np.array([[0.1, 0.2, 0.05, 0.1], [0.5, 0.5, 0.1, 0.1], [0.9, 0.9, 0.1, 0.15]])
+    tiled = tile_boxes(boxes, windows, bbox_type="yolo", image_size=image_size, min_visibility=1.0)
+    restored, tiles = untile_boxes(tiled.split(), windows, bbox_type="yolo", image_size=image_size)
+    np.testing.assert_allclose(restored, boxes[tiled.indices])
+    assert np.all(tiles == np.repeat(np.arange(len(windows)), np.diff(tiled.offsets)))
+    assert set(tiled.indices.tolist()) == {0, 1, 2}
+
+    with pytest.raises(ValueError):
+        untile_boxes(tiled.split()[:-1], windows, bbox_type="yolo", image_size=image_size)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray
+from pybboxes.transforms import Compose, Crop, HorizontalFlip, Letterbox, Resize, Rot90, Transform, VerticalFlip
+
+
+def box_mask(voc_boxes, image_size):
+    """Pixel masks of the boxes, to check transforms against the same operation on image arrays."""
+    width, height = image_size
+    masks = np.zeros((len(voc_boxes), height, width), dtype=bool)
+    for mask, (x_tl, y_tl, x_br, y_br) in zip(masks, np.asarray(voc_boxes, dtype=int)):
+        mask[y_tl:y_br, x_tl:x_br] = True
+    return masks
+
+
+@pytest.fixture
+def boxes():
+    return BoxArray([[10, 5, 30, 20], [0, 0, 8, 40], [35, 30, 50, 40]], bbox_type="voc", image_size=(50, 40))
+
+
+@pytest.mark.parametrize(
+    "transform, image_op",
+    [
+        (HorizontalFlip(), lambda image: image[:, ::-1]),
+        (VerticalFlip(), lambda image: image[::-1]),
+        (Rot90(), np.rot90),
+        (Rot90(k=3), lambda image: np.rot90(image, 3)),
+        (Crop(5, 10, 45, 35), lambda image: image[10:35, 5:45]),
+        (Compose([Rot90(), HorizontalFlip(), Crop(0, 5, 30, 50)]), lambda image: np.rot90(image)[:, ::-1][5:50, :30]),
+    ],
+)
+def test_transforms_match_image_ops(boxes, transform, image_op):
+    transformed, keep = transform(boxes, clip=True)
+    masks = box_mask(boxes.values, boxes.image_size)
+    expected = [image_op(mask) for mask in masks]
+    assert transformed.image_size == expected[0].shape[::-1]
+    assert keep.tolist() == [i for i, mask in enumerate(expected) if mask.any()]
+    for (x_tl, y_tl, x_br, y_br), index in zip(transformed.values.astype(int), keep):
+        mask = np.zeros_like(expected[index])
+        mask[y_tl:y_br, x_tl:x_br] = True
+        np.testing.assert_array_equal(mask, expected[index])
+
+
+def test_resize_and_letterbox(boxes):
+    resized, _ = Resize((100, 20))(boxes)
+    np.testing.assert_allclose(resized.values[0], [20, 2.5, 60, 10])
+    letterboxed, _ = Letterbox((100, 100))(boxes)
+    # Scaled by 2 to (100, 80) and padded by 10 on the top and bottom
+    assert letterboxed.image_size == (100, 100)
+    np.testing.assert_allclose(letterboxed.values[0], [20, 20, 60, 50])
+
+
+def test_formats_visibility_and_inverse(boxes):
+    pipeline = Compose([Letterbox((64, 64)), HorizontalFlip(), Rot90(), Crop(0, 0, 64, 40)])
+    yolo_boxes = boxes.convert("yolo")
+    transformed, keep = pipeline(yolo_boxes, clip=True, min_visibility=0.5)
+    assert transformed.name == "yolo" and transformed.image_size == (64, 40)
+
+    unclipped, _ = pipeline(yolo_boxes, clip=False)
+    visible, visible_indices = pipeline(yolo_boxes, clip=True)
+    assert len(unclipped) == 3
+    ratios = visible.area / unclipped[visible_indices].area
+    assert keep.tolist() == visible_indices[ratios >= 0.5].tolist()
+
+    inverse = pipeline.get_transform(boxes.image_size).inverse()
+    restored, _ = inverse(unclipped, clip=False)
+    assert restored.image_size == boxes.image_size
+    np.testing.assert_allclose(restored.to_voc_array(), boxes.values, atol=1e-9)
+
+    with pytest.raises(ValueError):
+        inverse(boxes)
+
+
+def test_transform_is_abstract():
+    with pytest.raises(TypeError):
+        Transform()
@@ -0,0 +1,53 @@
+import filecmp
+import os
+
+import pytest
+
+from pybboxes.annotations import Annotations
+from pybboxes.utils.io import get_image_size
+from pybboxes.utils.synthetic import generate_dataset, iter_synthetic_records
+
+
+def test_records_are_deterministic():
+    records1 = list(iter_synthetic_records(20, seed=7))
+    records2 = list(iter_synthetic_records(20, seed=7))
+    for r1, r2 in zip(records1, records2):
+        assert r1[:2] == r2[:2] and r1[3] == r2[3]
+        assert (r1[2] == r2[2]).all()
+    assert any((r1[2].shape != r3[2].shape) for r1, r3 in zip(records1, iter_synthetic_records(20, seed=8)))
+
+
+def test_records_are_valid_boxes():
+    sizes = [(100, 50), (1920, 1080)]
+    for _, (w, h), boxes, labels in iter_synthetic_records(200, image_sizes=sizes, boxes_per_image=(0, 5)):
+        assert (w, h) in sizes
+        assert 0 <= len(boxes) <= 5 and len(labels) == len(boxes)
+        assert ((boxes[:, 0] >= 0) & (boxes[:, 1] >= 0)).all()
+        assert ((boxes[:, 2] <= w) & (boxes[:, 3] <= h)).all()
+        assert ((boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])).all()
+
+
+@pytest.mark.parametrize("image_format", ["jpg", "png"])
+def test_generate_yolo_dataset(tmp_path, image_format):
+    kwargs = generate_dataset(str(tmp_path), "yolo", num_images=10, image_format=image_format, num_classes=3)
+    image_name = sorted(os.listdir(kwargs["images_dir"]))[0]
+    assert image_name.endswith(image_format)
+    assert get_image_size(os.path.join(kwargs["images_dir"], image_name)) in [(640, 480), (1280, 720), (1920, 1080)]
+
+    anns = Annotations("yolo")
+    anns.load_from_yolo(**kwargs)
+    assert len(anns._objects) == 10
+    assert list(anns.names_mapping) == ["class_0", "class_1", "class_2"]
+
+
+@pytest.mark.parametrize("annotation_type", ["coco", "voc"])
+def test_generate_is_reproducible(tmp_path, annotation_type):
+    kwargs1 = generate_dataset(str(tmp_path / "a"), annotation_type, num_images=5, seed=3, write_images=False)
+    kwargs2 = generate_dataset(str(tmp_path / "b"), annotation_type, num_images=5, seed=3, write_images=False)
+    if annotation_type == "coco":
+        assert filecmp.cmp(kwargs1["json_path"], kwargs2["json_path"], shallow=False)
+    else:
+        assert not filecmp.dircmp(kwargs1["labels_dir"], kwargs2["labels_dir"]).diff_files
+        anns = Annotations(annotation_type)
+        anns.load_from_voc(**kwargs1)
+        assert len(anns._objects) == 5